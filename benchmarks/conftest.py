@@ -0,0 +1,24 @@
+import tracemalloc
+from typing import Callable
+
+import pytest
+
+
+@pytest.fixture
+def peak_memory(benchmark) -> Callable:
+    """Record peak memory of a single call in the benchmark's extra info
+
+    Memory is traced in a separate, untimed call, as tracing slows down the
+    measured code. Only the memory allocated during the call is counted.
+    """
+
+    def measure(fun: Callable, *args) -> None:
+        tracemalloc.start()
+        try:
+            fun(*args)
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        benchmark.extra_info["peak_memory"] = peak
+
+    return measure
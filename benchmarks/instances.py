@@ -0,0 +1,152 @@
+from itertools import combinations
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+from docplex.mp.model import Model
+
+from omniqubo.converters.converter import ConverterAbs
+from omniqubo.converters.eq_to_objective import EqToObj
+from omniqubo.converters.ineq_to_eq import IneqToEq
+from omniqubo.converters.simple_manipulation import MakeMax, RemoveConstraint
+from omniqubo.converters.varreplace import BitToSpin, TrivialIntToBit, VarBinary, VarOneHot
+
+PENALTY = 10
+
+
+def _random_graph(n: int, prob: float, rng: np.random.Generator) -> List[Tuple[int, int]]:
+    return [(u, v) for u, v in combinations(range(n), 2) if rng.random() < prob]
+
+
+def tsp(n: int, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    points = rng.random((n, 2))
+    dist = np.round(10 * np.linalg.norm(points[:, None] - points[None, :], axis=2))
+    mdl = Model(name="tsp")
+    x = {(i, t): mdl.binary_var(f"x_{i}_{t}") for i in range(n) for t in range(n)}
+    mdl.minimize(
+        mdl.sum(
+            dist[i, j] * x[i, t] * x[j, (t + 1) % n]
+            for i in range(n)
+            for j in range(n)
+            if i != j
+            for t in range(n)
+        )
+    )
+    for i in range(n):
+        mdl.add_constraint(mdl.sum(x[i, t] for t in range(n)) == 1, ctname=f"city_{i}")
+    for t in range(n):
+        mdl.add_constraint(mdl.sum(x[i, t] for i in range(n)) == 1, ctname=f"time_{t}")
+    return mdl
+
+
+def knapsack(n: int, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(1, 20, n)
+    values = rng.integers(1, 20, n)
+    mdl = Model(name="knapsack")
+    x = [mdl.binary_var(f"x_{i}") for i in range(n)]
+    mdl.minimize(-mdl.sum(int(v) * xi for v, xi in zip(values, x)))
+    capacity = int(weights.sum()) // 2
+    mdl.add_constraint(mdl.sum(int(w) * xi for w, xi in zip(weights, x)) <= capacity, ctname="c")
+    return mdl
+
+
+def max_cut(n: int, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    mdl = Model(name="max_cut")
+    x = [mdl.binary_var(f"x_{i}") for i in range(n)]
+    mdl.minimize(-mdl.sum(x[u] + x[v] - 2 * x[u] * x[v] for u, v in _random_graph(n, 0.3, rng)))
+    return mdl
+
+
+def graph_colouring(n: int, seed: int = 0, colours: int = 3) -> Model:
+    rng = np.random.default_rng(seed)
+    mdl = Model(name="graph_colouring")
+    x = {(v, c): mdl.binary_var(f"x_{v}_{c}") for v in range(n) for c in range(colours)}
+    # the highest colour used is minimized
+    top = mdl.integer_var(lb=0, ub=colours - 1, name="top")
+    mdl.minimize(top)
+    for v in range(n):
+        mdl.add_constraint(mdl.sum(x[v, c] for c in range(colours)) == 1, ctname=f"one_{v}")
+        mdl.add_constraint(mdl.sum(c * x[v, c] for c in range(colours)) <= top, ctname=f"top_{v}")
+    for u, v in _random_graph(n, 0.3, rng):
+        for c in range(colours):
+            mdl.add_constraint(x[u, c] + x[v, c] <= 1, ctname=f"edge_{u}_{v}_{c}")
+    return mdl
+
+
+def job_shop(n: int, seed: int = 0) -> Model:
+    # n jobs on n machines, each job visits all machines in random order
+    rng = np.random.default_rng(seed)
+    durations = rng.integers(1, 4, (n, n))
+    orders = [rng.permutation(n) for _ in range(n)]
+    horizon = int(durations.sum())
+
+    mdl = Model(name="job_shop")
+    start = {
+        (j, m): mdl.integer_var(lb=0, ub=horizon, name=f"s_{j}_{m}")
+        for j in range(n)
+        for m in range(n)
+    }
+    makespan = mdl.integer_var(lb=0, ub=horizon, name="makespan")
+    mdl.minimize(makespan)
+    for j, order in enumerate(orders):
+        for m1, m2 in zip(order[:-1], order[1:]):
+            mdl.add_constraint(
+                start[j, m1] + int(durations[j, m1]) <= start[j, m2], ctname=f"prec_{j}_{m1}"
+            )
+        last = order[-1]
+        mdl.add_constraint(start[j, last] + int(durations[j, last]) <= makespan, ctname=f"end_{j}")
+    for m in range(n):
+        for j1, j2 in combinations(range(n), 2):
+            z = mdl.binary_var(f"z_{m}_{j1}_{j2}")
+            p1, p2 = int(durations[j1, m]), int(durations[j2, m])
+            mdl.add_constraint(
+                start[j1, m] + p1 <= start[j2, m] + horizon * (1 - z), ctname=f"dis_{m}_{j1}_{j2}"
+            )
+            mdl.add_constraint(
+                start[j2, m] + p2 <= start[j1, m] + horizon * z, ctname=f"dis_{m}_{j2}_{j1}"
+            )
+    return mdl
+
+
+# generators of the families with increasing sizes of the instances
+FAMILIES: Dict[str, Tuple[Callable[..., Model], List[int]]] = {
+    "tsp": (tsp, [4, 6, 8]),
+    "knapsack": (knapsack, [10, 30, 100]),
+    "max_cut": (max_cut, [10, 20, 40]),
+    "graph_colouring": (graph_colouring, [5, 10, 20]),
+    "job_shop": (job_shop, [2, 3, 4]),
+}
+
+INSTANCES = [(family, size) for family, (_, sizes) in FAMILIES.items() for size in sizes]
+
+
+def instance(family: str, size: int) -> Model:
+    return FAMILIES[family][0](size)
+
+
+# converters turning the instance into QUBO, followed by the conversion into
+# Ising model. Graph colouring has small integer ranges, thus one-hot encoding
+# is used for it
+def pipeline(family: str) -> List[Tuple[str, ConverterAbs]]:
+    encoding = VarOneHot if family == "graph_colouring" else VarBinary
+    return [
+        ("ineq_to_eq", IneqToEq(".*", True, False)),
+        ("trivial_int_to_bit", TrivialIntToBit(".*", True)),
+        ("int_to_bits", encoding(".*", True)),
+        ("eq_to_obj", EqToObj(".*", True, PENALTY)),
+        ("bit_to_spin", BitToSpin(".*", True, False)),
+    ]
+
+
+STEPS = [name for name, _ in pipeline("")]
+
+# number of steps of the pipeline producing QUBO
+QUBO_STEPS = STEPS.index("eq_to_obj") + 1
+
+# converters applied directly on the transpiled instance
+STANDALONE: Dict[str, Callable[[], ConverterAbs]] = {
+    "make_max": MakeMax,
+    "rm_constraints": lambda: RemoveConstraint(".*", True, False),
+}
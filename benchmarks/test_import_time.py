@@ -0,0 +1,17 @@
+import subprocess
+import sys
+
+import pytest
+
+# each import is run in a fresh interpreter, as modules are cached after the
+# first import
+MODULES = ["omniqubo", "omniqubo.models.sympyopt", "docplex.mp.model", "qiskit_optimization"]
+
+
+def _import_in_subprocess(module: str) -> None:
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_time(benchmark, module):
+    benchmark.pedantic(_import_in_subprocess, args=(module,), rounds=5, iterations=1)
@@ -0,0 +1,73 @@
+import tracemalloc
+from typing import Callable
+
+import pytest
+
+from omniqubo.models.polyopt.constraints import ConstraintEq as PolyOptEq
+from omniqubo.models.polyopt.polyopt import PolyOpt
+from omniqubo.models.sympyopt.constraints import ConstraintEq as SympyOptEq
+from omniqubo.models.sympyopt.sympyopt import SympyOpt
+
+SIZES = [1000, 10000]
+ROUNDS = 3
+MODELS = {"sympyopt": (SympyOpt, SympyOptEq), "polyopt": (PolyOpt, PolyOptEq)}
+
+
+def _add_vars(model, size: int, vtype: str) -> list:
+    if vtype == "bit":
+        return [model.bit_var(f"x{i}") for i in range(size)]
+    return [model.int_var(f"x{i}", lb=0, ub=10) for i in range(size)]
+
+
+def _add_constraints(model, constraint: type, xs: list) -> None:
+    for i in range(len(xs) - 1):
+        model.add_constraint(constraint(xs[i] + xs[i + 1], 1), f"c{i}")
+
+
+# memory still held by the objects created by fun, divided by count
+def _retained_memory(fun: Callable, count: int) -> float:
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = fun()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return (after - before) / count
+
+
+@pytest.mark.parametrize("vtype", ["bit", "int"])
+@pytest.mark.parametrize("backend", MODELS)
+@pytest.mark.parametrize("size", SIZES)
+def test_variables(benchmark, size, backend, vtype):
+    model_cls, _ = MODELS[backend]
+
+    def create():
+        model = model_cls()
+        _add_vars(model, size, vtype)
+        return model
+
+    benchmark.extra_info["bytes_per_variable"] = _retained_memory(create, size)
+    benchmark.pedantic(create, rounds=ROUNDS, iterations=1)
+
+
+@pytest.mark.parametrize("backend", MODELS)
+@pytest.mark.parametrize("size", SIZES)
+def test_constraints(benchmark, size, backend):
+    model_cls, constraint = MODELS[backend]
+
+    # each round adds the constraints to a fresh model
+    def setup():
+        model = model_cls()
+        return (model, constraint, _add_vars(model, size, "bit")), {}
+
+    def create():
+        args, _ = setup()
+        _add_constraints(*args)
+        return args[0]
+
+    model_bytes = _retained_memory(lambda: setup()[0][0], size)
+    total_bytes = _retained_memory(create, size)
+    benchmark.extra_info["bytes_per_constraint"] = total_bytes - model_bytes
+    benchmark.pedantic(_add_constraints, setup=setup, rounds=ROUNDS, iterations=1)
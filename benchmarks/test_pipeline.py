@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from instances import INSTANCES, QUBO_STEPS, STANDALONE, STEPS, instance, pipeline
+from pandas import DataFrame
+
+from omniqubo import Omniqubo
+
+BACKENDS = ["sympyopt", "polyopt"]
+ROUNDS = 3
+NUM_SAMPLES = 1000
+
+
+# converts the instance with the first steps of the pipeline
+def _convert(family: str, size: int, backend: str, steps: int) -> Omniqubo:
+    omniqubo = Omniqubo(instance(family, size), model_backend=backend)
+    for _, converter in pipeline(family)[:steps]:
+        omniqubo.convert(converter)
+    return omniqubo
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("family, size", INSTANCES)
+def test_transpile(benchmark, peak_memory, family, size, backend):
+    model = instance(family, size)
+    peak_memory(Omniqubo, model, False, backend)
+    benchmark.pedantic(Omniqubo, args=(model, False, backend), rounds=ROUNDS, iterations=1)
+
+
+@pytest.mark.parametrize("step", range(len(STEPS)), ids=STEPS)
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("family, size", INSTANCES)
+def test_converter(benchmark, peak_memory, family, size, backend, step):
+    # each round converts a fresh model, prepared outside of the measurement
+    def setup():
+        omniqubo = _convert(family, size, backend, step)
+        return (omniqubo, pipeline(family)[step][1]), {}
+
+    peak_memory(Omniqubo.convert, *setup()[0])
+    benchmark.pedantic(Omniqubo.convert, setup=setup, rounds=ROUNDS, iterations=1)
+
+
+@pytest.mark.parametrize("name", STANDALONE)
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("family, size", INSTANCES)
+def test_standalone_converter(benchmark, peak_memory, family, size, backend, name):
+    def setup():
+        omniqubo = Omniqubo(instance(family, size), model_backend=backend)
+        return (omniqubo, STANDALONE[name]()), {}
+
+    peak_memory(Omniqubo.convert, *setup()[0])
+    benchmark.pedantic(Omniqubo.convert, setup=setup, rounds=ROUNDS, iterations=1)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("family, size", INSTANCES)
+def test_export_dimod_bqm(benchmark, peak_memory, family, size, backend):
+    omniqubo = _convert(family, size, backend, QUBO_STEPS)
+    peak_memory(omniqubo.export, "dimod_bqm")
+    bqm = benchmark.pedantic(omniqubo.export, args=("dimod_bqm",), rounds=ROUNDS, iterations=1)
+    benchmark.extra_info["num_variables"] = bqm.num_variables
+    benchmark.extra_info["num_interactions"] = bqm.num_interactions
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("family, size", INSTANCES)
+def test_interpret(benchmark, peak_memory, family, size, backend):
+    omniqubo = _convert(family, size, backend, QUBO_STEPS)
+    labels = list(omniqubo.model.variables)
+    bits = np.random.default_rng(0).integers(0, 2, (NUM_SAMPLES, len(labels)))
+
+    # interpret modifies the samples, thus each round gets a fresh copy
+    def setup():
+        return (DataFrame(bits, columns=labels),), {}
+
+    peak_memory(omniqubo.interpret, *setup()[0])
+    benchmark.pedantic(omniqubo.interpret, setup=setup, rounds=ROUNDS, iterations=1)
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+from pulp import LpInteger, LpMaximize, LpProblem, LpVariable, lpSum
+
+from omniqubo.models.sympyopt.transpiler.pulp_to_sympyopt import PulpToSympyopt
+
+SIZES = [10000, 100000]
+ROUNDS = 3
+
+
+# sparse LP with size integer variables and size rows of three terms each
+def _lp(size: int, seed: int = 0) -> LpProblem:
+    rng = np.random.default_rng(seed)
+    values = rng.integers(1, 20, size).tolist()
+    weights = rng.integers(1, 5, (size, 3)).tolist()
+    mdl = LpProblem("lp", LpMaximize)
+    x = [LpVariable(f"x_{i}", 0, 10, cat=LpInteger) for i in range(size)]
+    mdl += lpSum(v * xi for v, xi in zip(values, x))
+    for i, (a, b, c) in enumerate(weights):
+        mdl += a * x[i] + b * x[(i + 1) % size] - c * x[(i + 7) % size] <= 10, f"c_{i}"
+    return mdl
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_transpile(benchmark, peak_memory, size):
+    model = _lp(size)
+    peak_memory(PulpToSympyopt().transpile, model)
+    benchmark.pedantic(PulpToSympyopt().transpile, args=(model,), rounds=ROUNDS, iterations=1)
@@ -0,0 +1,121 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from copy import deepcopy
+from itertools import islice
+from os import cpu_count
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Set
+
+from pandas import DataFrame
+
+from .converters.converter import ConverterAbs, interpret
+from .omniqubo import Omniqubo
+
+
+class BatchResult:
+    """Result of the conversion of a single model from the batch
+
+    Stores the index of the model in the input iterable, the resulting model
+    (exported if export mode was provided, otherwise the converted model of
+    the backend), and the converters with the data required for interpreting
+    the samples. The object is picklable, so it can be stored and used for
+    interpreting the samples later on.
+
+    :param index: position of the model in the input iterable
+    :param model: resulting model
+    :param logs: applied converters
+    """
+
+    def __init__(self, index: int, model: Any, logs: List[ConverterAbs]) -> None:
+        self.index = index
+        self.model = model
+        self.logs = logs
+
+    def interpret(self, samples: DataFrame) -> DataFrame:
+        """Interpret optimization results
+
+        Works the same as Omniqubo.interpret, using the converters applied on
+        the model.
+
+        :param samples: samples to be interpreted
+        :return: interpreted samples with "feasible" flag
+        """
+        samples["feasible"] = True
+        for converter in reversed(self.logs):
+            samples = interpret(samples, converter)
+        return samples
+
+
+# runs the recipe on a single model, executed by the workers of the pool
+def _run_recipe(
+    index: int,
+    model,
+    recipe: Sequence[ConverterAbs],
+    export_mode: Optional[str],
+    model_backend: Optional[str],
+) -> BatchResult:
+    omniqubo = Omniqubo(model, model_backend=model_backend)
+    for converter in recipe:
+        omniqubo.convert(converter)
+    result = omniqubo.model if export_mode is None else omniqubo.export(export_mode)
+    return BatchResult(index, result, omniqubo.logs)
+
+
+def convert_batch(
+    models: Iterable,
+    recipe: Sequence[ConverterAbs],
+    export_mode: str = None,
+    model_backend: str = None,
+    processes: int = None,
+    max_pending: int = None,
+) -> Iterator[BatchResult]:
+    """Convert many models with the same recipe across a process pool
+
+    Each model is transpiled with Omniqubo and the converters of the recipe
+    are applied in the given order. Converters are copied for each model, so
+    the recipe itself is not modified. If export_mode is provided, the
+    resulting model is exported (see Omniqubo.export).
+
+    Results are yielded as soon as they are completed, thus not necessarily
+    in the order of the models, see BatchResult.index. At most max_pending
+    models are submitted to the pool at once, so that models can be produced
+    lazily by a generator. If processes is 0, models are converted in the
+    current process, in order.
+
+    .. note::
+        Models, converters and the results have to be picklable.
+
+    :param models: models to be converted
+    :param recipe: converters applied on each model
+    :param export_mode: mode of the export, defaults to no export
+    :param model_backend: backend used for conversion
+    :param processes: number of worker processes, defaults to number of CPUs
+    :param max_pending: maximal number of models submitted to the pool at
+        once, defaults to twice the number of processes
+    :return: iterator over the results
+    """
+    if processes == 0:
+        for index, model in enumerate(models):
+            yield _run_recipe(index, model, deepcopy(recipe), export_mode, model_backend)
+        return
+
+    if processes is None:
+        processes = cpu_count() or 1
+    if max_pending is None:
+        max_pending = 2 * processes
+    assert processes > 0 and max_pending > 0
+
+    indexed_models = enumerate(models)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+
+        # submits at most num models to the pool
+        def submit(num: int) -> Set[Future]:
+            return {
+                executor.submit(_run_recipe, index, model, recipe, export_mode, model_backend)
+                for index, model in islice(indexed_models, num)
+            }
+
+        pending = submit(max_pending)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            pending |= submit(len(done))
+            for future in done:
+                yield future.result()
@@ -3,10 +3,15 @@ from typing import Iterable, List
 
 from omniqubo.vars import VarAbs
 
+INEQ_LEQ_SENSE = "leq"
+INEQ_GEQ_SENSE = "geq"
+
 
 class ConstraintAbs(ABC):
     """Abstract class for constraints"""
 
+    __slots__ = ("check_interpret",)
+
     @abstractmethod
     def __init__(self) -> None:
         # important for example to avoid checking equalities coming from equality
@@ -18,7 +18,8 @@ class EqToObj(ConverterAbs):
 
     :param name: name of the constraint f(x) = 0
     :param is_regexp: flag deciding if name is a string or regular expression.
-    :param penalty: penalty used
+    :param penalty: penalty used, a number or a parameter created with
+        omniqubo.parametric.parameter
     """
 
     def __init__(self, name: str, is_regexp: bool, penalty: float) -> None:
@@ -34,6 +35,5 @@ class EqToObj(ConverterAbs):
 
 @interpret.register
 def interpret_eqtoobj(samples: DataFrame, converter: EqToObj) -> DataFrame:
-    for verifier in converter.data["verifiers"]:
-        samples["feasible"] &= verifier(samples) == 0
+    samples["feasible"] &= converter.data["verifier"].check(samples)
     return samples
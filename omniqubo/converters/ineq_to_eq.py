@@ -33,20 +33,7 @@ class IneqToEq(ConverterAbs):
 
 @interpret.register
 def interpret_ineqtoeq(samples: DataFrame, converter: IneqToEq) -> DataFrame:
-    if converter.check_slack:
-        for verifier, slack_name in converter.data["verifiers"]:
-            samples["feasible"] &= verifier(samples) == 0
-            if slack_name != "":  # check if slack did not have upper bound 0
-                samples.pop(slack_name)
-    else:
-        for verifier, slack_name, ctype in converter.data["verifiers"]:
-            if ctype == "leq":
-                samples["feasible"] &= verifier(samples) <= 0
-            elif ctype == "geq":
-                samples["feasible"] &= verifier(samples) >= 0
-            else:
-                raise ValueError(f"Unknown ctype {ctype}")
-            if slack_name != "":  # check if slack did not have upper bound 0
-                samples.pop(slack_name)
-
+    samples["feasible"] &= converter.data["verifier"].check(samples)
+    for slack_name in converter.data["slack_names"]:
+        samples.pop(slack_name)
     return samples
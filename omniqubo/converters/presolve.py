@@ -0,0 +1,41 @@
+from pandas import DataFrame
+
+from .converter import ConverterAbs, interpret
+
+
+class Presolve(ConverterAbs):
+    """Reduce the model before encoding the variables
+
+    Runs presolve on the linear constraints of matching names. Bounds of
+    integer, binary and spin variables are tightened iteratively using the
+    constraints, at most max_iter times. Variables with a single feasible
+    value, for example forced by singleton constraints, are fixed and
+    replaced with their value. Afterwards constraints which always hold, as
+    well as duplicated and dominated constraints, are removed. If some
+    constraint is shown to be never satisfied, ValueError is raised and the
+    model is not changed. If is_regexp is set to True, then all constraints
+    with matching names are used.
+
+    Tighter bounds of the integer variables reduce the number of bits needed
+    to encode them. Interpret restores the values of the fixed variables and
+    checks the removed constraints.
+
+    :param name: the name of the used constraints
+    :param is_regexp: flag deciding if name is regular expression
+    :param max_iter: maximal number of rounds of bound tightening
+    """
+
+    def __init__(self, name: str, is_regexp: bool, max_iter: int = 10) -> None:
+        assert max_iter >= 0
+        self.name = name
+        self.is_regexp = is_regexp
+        self.max_iter = max_iter
+        super().__init__()
+
+
+@interpret.register
+def interpret_presolve(samples: DataFrame, converter: Presolve) -> DataFrame:
+    for name, value in converter.data["fixed"].items():
+        samples[name] = value
+    samples["feasible"] &= converter.data["verifier"].check(samples)
+    return samples
@@ -58,15 +58,7 @@ class RemoveConstraint(ConverterAbs):
 
 @interpret.register
 def interpret_removeconstraint(samples: DataFrame, converter: RemoveConstraint) -> DataFrame:
-    for verifier, ctype in converter.data["verifiers"]:
-        if ctype == "eq":
-            samples["feasible"] &= verifier(samples) == 0
-        elif ctype == "geq":
-            samples["feasible"] &= verifier(samples) >= 0
-        elif ctype == "leq":
-            samples["feasible"] &= verifier(samples) <= 0
-        else:
-            ValueError(f"Uknonwn Constraint type {ctype}")  # pragma: no cover
+    samples["feasible"] &= converter.data["verifier"].check(samples)
     return samples
 
 
@@ -131,7 +123,11 @@ class RemoveTrivialConstraints(ConverterAbs):
     """Remove trivial constraints
 
     Remove trivial inequalities of the form P(x) <= 0, where max P(x) <= 0 can
-    be shown. Similar for other types of inequalities.
+    be shown. Similar for other types of inequalities. Equalities P(x) == 0
+    are removed if P(x) is shown to be always 0. Bounds are derived from the
+    bounds of the variables. If some constraint is shown to be never
+    satisfied, ValueError is raised and the model is not changed. Removed
+    constraints are checked by interpret.
 
     :param name: the name of the removed model
     :param is_regexp: flag deciding if name is regular expression
@@ -147,4 +143,5 @@ class RemoveTrivialConstraints(ConverterAbs):
 def interpret_removetrivialconstraints(
     samples: DataFrame, converter: RemoveTrivialConstraints
 ) -> DataFrame:
+    samples["feasible"] &= converter.data["verifier"].check(samples)
     return samples
@@ -1,7 +1,7 @@
-from typing import Callable
+from typing import Callable, Sequence
 
 import numpy as np
-from pandas import DataFrame
+from pandas import DataFrame, concat
 
 from .converter import ConverterAbs, interpret
 from .utils import INTER_STR_SEP
@@ -48,25 +48,35 @@ class VarOneHot(VarReplace):
 
 @interpret.register
 def interpret_varonehot(samples: DataFrame, converter: VarOneHot) -> DataFrame:
-    for name in converter.data["bounds"].keys():
-        lb, ub = converter.data["bounds"][name]
-
-        names = [f"{name}{INTER_STR_SEP}OH_{i}" for i in range(ub - lb + 1)]
-        samples["feasible_tmp"] = samples.apply(lambda row: sum(row[n] for n in names) == 1, axis=1)
-
-        def set_var_value(row):
-            return lb + [row[n] for n in names].index(1) if row["feasible_tmp"] else np.nan
-
-        samples[name] = samples.apply(
-            set_var_value,
-            axis=1,
-        )
-
-        samples["feasible"] &= samples.pop("feasible_tmp")
-        for n in names:
-            samples.pop(n)
-
-    return samples
+    bounds = converter.data["bounds"]
+    if not bounds:
+        return samples
+
+    # one-hot bits of all variables are taken as a single block, transposed so
+    # that bits of each variable form a contiguous slice of rows
+    names = [
+        f"{name}{INTER_STR_SEP}OH_{i}"
+        for name, (lb, ub) in bounds.items()
+        for i in range(ub - lb + 1)
+    ]
+    block = samples[names].to_numpy().T
+
+    is_valid = np.ones(samples.shape[0], dtype=bool)
+    values = dict()
+    end = 0
+    for name, (lb, ub) in bounds.items():
+        start, end = end, end + ub - lb + 1
+        bits = block[start:end]
+        is_valid_var = bits.sum(axis=0) == 1
+        decoded = lb + bits.argmax(axis=0)
+        if not is_valid_var.all():
+            decoded = np.where(is_valid_var, decoded, np.nan)
+        values[name] = decoded
+        is_valid &= is_valid_var
+
+    samples["feasible"] &= is_valid
+    samples = samples.drop(columns=names + [name for name in values if name in samples])
+    return concat([samples, DataFrame(values, index=samples.index)], axis=1)
 
 
 class VarBinary(VarReplace):
@@ -90,10 +100,10 @@ def _binary_encoding_coeff(lb: int, ub: int):
     is_power_of_two = span_size and (not (span_size & (span_size - 1)))
     if is_power_of_two:
         bit_no = span_size.bit_length() - 1
-        vals = [2 ** i for i in range(bit_no)]
+        vals = [1 << i for i in range(bit_no)]
     else:
         bit_no = span_size.bit_length()
-        vals = [2 ** i for i in range(bit_no - 1)]
+        vals = [1 << i for i in range(bit_no - 1)]
         vals.append(ub - lb - sum(vals))
     return vals
 
@@ -266,3 +276,28 @@ class ReplaceVarWithEq(VarReplace):
 @interpret.register
 def interpret_replacevarwitheq(samples: DataFrame, converter: ReplaceVarWithEq) -> DataFrame:
     raise NotImplementedError()
+
+
+class VarReplaceBatch(ConverterAbs):
+    """Apply several VarReplace converters at once
+
+    Converters are applied in the given order, but instead of substituting
+    the variables in the objective and constraints after each of them, their
+    substitutions are composed and applied in a single pass over the model.
+    The resulting model is the same as if the converters were applied one by
+    one. Data required for interpreting the samples is stored in the given
+    converters, thus they can be logged individually instead of the batch.
+
+    :param converters: the applied converters
+    """
+
+    def __init__(self, converters: Sequence[VarReplace]) -> None:
+        self.converters = list(converters)
+        super().__init__()
+
+
+@interpret.register
+def interpret_varreplacebatch(samples: DataFrame, converter: VarReplaceBatch) -> DataFrame:
+    for conv in reversed(converter.converters):
+        samples = interpret(samples, conv)
+    return samples
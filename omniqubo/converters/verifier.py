@@ -0,0 +1,149 @@
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+from pandas import DataFrame
+from scipy.sparse import coo_matrix, csr_matrix, spmatrix
+
+EQ_CTYPE = "eq"
+LEQ_CTYPE = "leq"
+GEQ_CTYPE = "geq"
+
+
+# checks values against ctype, i.e. values == 0, values <= 0 or values >= 0
+def _check_ctype(values: np.ndarray, ctype: str) -> np.ndarray:
+    if ctype == EQ_CTYPE:
+        return values == 0
+    elif ctype == LEQ_CTYPE:
+        return values <= 0
+    elif ctype == GEQ_CTYPE:
+        return values >= 0
+    raise ValueError(f"Unknown ctype {ctype}")
+
+
+class ConstraintsVerifier:
+    """Batched verifier of constraints removed from the model
+
+    Stores constraints of the form f(x) == 0, f(x) <= 0 or f(x) >= 0 ("eq",
+    "leq" and "geq" ctype respectively), which are compiled once during the
+    conversion. Linear functions are stored as rows of a sparse matrix, so
+    that all of them are evaluated with a single sparse matrix-vector product
+    over the matrix of samples. Nonlinear functions are kept as vectorized
+    callables taking a dictionary from the variable names to NumPy arrays.
+    Verifier depends only on the names of the variables, thus it stays valid
+    after the variables are removed from the model.
+    """
+
+    def __init__(self) -> None:
+        self.varnames: List[str] = []
+        self._var_idx: Dict[str, int] = dict()
+        self._rows: List[int] = []
+        self._cols: List[int] = []
+        self._coeffs: List[float] = []
+        self._offsets: List[float] = []
+        self._ctypes: List[str] = []
+        self._nonlinear: List[tuple] = []
+        self._matrix: Optional[csr_matrix] = None
+
+    def __len__(self) -> int:
+        return len(self._offsets) + len(self._nonlinear)
+
+    def add_linear(self, coeffs: Mapping[str, float], offset: float, ctype: str) -> None:
+        """Add linear constraint sum_i coeffs[i] * x_i + offset (ctype) 0
+
+        :param coeffs: coefficients of the variables
+        :param offset: constant term of the function
+        :param ctype: type of the constraint, "eq", "leq" or "geq"
+        """
+        _check_ctype(np.zeros(0), ctype)
+        row = len(self._offsets)
+        for name, coeff in coeffs.items():
+            if name not in self._var_idx:
+                self._var_idx[name] = len(self.varnames)
+                self.varnames.append(name)
+            self._rows.append(row)
+            self._cols.append(self._var_idx[name])
+            self._coeffs.append(float(coeff))
+        self._offsets.append(float(offset))
+        self._ctypes.append(ctype)
+        self._matrix = None
+
+    def add_linear_block(
+        self,
+        matrix: spmatrix,
+        varnames: Sequence[str],
+        offsets: Union[Sequence[float], np.ndarray],
+        ctypes: Sequence[str],
+    ) -> None:
+        """Add linear constraints matrix @ x + offsets (ctypes) 0 at once
+
+        :param matrix: sparse matrix of the coefficients
+        :param varnames: names of the variables of the columns
+        :param offsets: constant terms of the rows
+        :param ctypes: types of the rows, "eq", "leq" or "geq"
+        """
+        for ctype in set(ctypes):
+            _check_ctype(np.zeros(0), ctype)
+        coo = coo_matrix(matrix)
+        # only variables with nonzero coefficients are required in the samples
+        cols = np.zeros(len(varnames), dtype=np.int64)
+        for col in np.unique(coo.col).tolist():
+            name = varnames[col]
+            if name not in self._var_idx:
+                self._var_idx[name] = len(self.varnames)
+                self.varnames.append(name)
+            cols[col] = self._var_idx[name]
+        self._rows.extend((coo.row + len(self._offsets)).tolist())
+        self._cols.extend(cols[coo.col].tolist())
+        self._coeffs.extend(coo.data.astype(float).tolist())
+        self._offsets.extend(np.asarray(offsets, dtype=float).tolist())
+        self._ctypes.extend(ctypes)
+        self._matrix = None
+
+    def add_nonlinear(self, fun: Callable, varnames: Sequence[str], ctype: str) -> None:
+        """Add constraint fun(x) (ctype) 0
+
+        :param fun: vectorized function taking dictionary mapping names of
+            varnames into arrays of values
+        :param varnames: names of the variables fun depends on
+        :param ctype: type of the constraint, "eq", "leq" or "geq"
+        """
+        _check_ctype(np.zeros(0), ctype)
+        self._nonlinear.append((fun, list(varnames), ctype))
+
+    def _get_matrix(self) -> csr_matrix:
+        if self._matrix is None:
+            self._matrix = csr_matrix(
+                (self._coeffs, (self._rows, self._cols)),
+                shape=(len(self._offsets), len(self.varnames)),
+            )
+        return self._matrix
+
+    def values(self, samples: DataFrame) -> np.ndarray:
+        """Compute values of linear functions on the samples
+
+        :param samples: samples, with values for each variable in separate column
+        :return: array of shape (number of samples, number of linear constraints)
+        """
+        if not self.varnames:
+            return np.tile(np.array(self._offsets), (samples.shape[0], 1))
+        mat = samples[self.varnames].to_numpy(dtype=float)
+        return np.asarray(self._get_matrix().dot(mat.T)).T + np.array(self._offsets)
+
+    def check(self, samples: DataFrame) -> np.ndarray:
+        """Check which samples satisfy all stored constraints
+
+        :param samples: samples, with values for each variable in separate column
+        :return: boolean array, True if sample satisfies all constraints
+        """
+        feasible = np.ones(samples.shape[0], dtype=bool)
+        if self._offsets:
+            vals = self.values(samples)
+            ctypes = np.array(self._ctypes)
+            for ctype in (EQ_CTYPE, LEQ_CTYPE, GEQ_CTYPE):
+                mask = ctypes == ctype
+                if mask.any():
+                    feasible &= _check_ctype(vals[:, mask], ctype).all(axis=1)
+        for fun, varnames, ctype in self._nonlinear:
+            vals = fun({name: samples[name].to_numpy(dtype=float) for name in varnames})
+            feasible &= _check_ctype(np.broadcast_to(vals, feasible.shape), ctype)
+        return feasible
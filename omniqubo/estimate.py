@@ -0,0 +1,473 @@
+from collections import Counter
+from functools import reduce
+from math import ceil, factorial, isinf
+from operator import mul
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from sympy import Add, Integer, Mul, Pow, Symbol, expand
+
+from .constants import DEFAULT_PENALTY_VALUE
+from .constraints import INEQ_GEQ_SENSE
+from .converters.utils import INTER_STR_SEP
+from .converters.varreplace import _binary_encoding_coeff
+from .model import ModelAbs
+from .models.polyopt import vars as polyopt_vars
+from .models.polyopt.poly import Poly
+from .models.polyopt.polyopt import PolyOpt
+from .models.sympyopt import vars as sympyopt_vars
+from .models.sympyopt.bounds import Bound, _exact, _interval_mul, _interval_pow
+from .models.sympyopt.constraints import LinearConstraints
+
+# encodings of integer variables supported by the estimation
+ENCODING_MODES = ("one-hot", "binary")
+_SWITCHED_MODE = {"one-hot": "binary", "binary": "one-hot"}
+
+_BIT_TYPES = (sympyopt_vars.BitVar, polyopt_vars.BitVar)
+_SPIN_TYPES = (sympyopt_vars.SpinVar, polyopt_vars.SpinVar)
+_INT_TYPES = (sympyopt_vars.IntVar, polyopt_vars.IntVar)
+
+# monomial given as sorted tuple of variable names, in which the power of a
+# variable is encoded by repetitions, and its coefficient
+_Term = Tuple[Tuple[str, ...], Any]
+
+
+class QuboEstimate:
+    """Predicted size of the QUBO produced from the model
+
+    Stores the number of binary variables, the number of quadratic terms and
+    the density of the quadratic terms, i.e. their number divided by the
+    number of all pairs of binary variables. is_quadratic is False if terms of
+    degree higher than 2 would be produced. min_coeff and max_coeff bound the
+    magnitudes of the contributions to the linear and quadratic
+    coefficients. max_coeff is an upper bound of the largest coefficient,
+    while min_coeff is the smallest contribution to a coefficient, as
+    contributions may cancel. Their ratio is the dynamic range.
+
+    Estimation ignores cancellations of the terms, thus the numbers of terms
+    are upper bounds.
+    """
+
+    def __init__(self) -> None:
+        self.binaries = 0
+        self.quadratic_terms = 0
+        self.is_quadratic = True
+        self.min_coeff = 0.0
+        self.max_coeff = 0.0
+
+    @property
+    def density(self) -> float:
+        """Number of quadratic terms divided by the number of pairs of binaries"""
+        pairs = self.binaries * (self.binaries - 1) // 2
+        return self.quadratic_terms / pairs if pairs else 0.0
+
+    @property
+    def dynamic_range(self) -> float:
+        """Ratio of the largest and the smallest coefficient magnitude"""
+        return self.max_coeff / self.min_coeff if self.min_coeff else 1.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the estimate as a dictionary
+
+        :return: dictionary with the estimate
+        """
+        return {
+            "binaries": self.binaries,
+            "quadratic_terms": self.quadratic_terms,
+            "density": self.density,
+            "is_quadratic": self.is_quadratic,
+            "min_coeff": self.min_coeff,
+            "max_coeff": self.max_coeff,
+            "dynamic_range": self.dynamic_range,
+        }
+
+    def __repr__(self) -> str:
+        return f"QuboEstimate({self.as_dict()})"
+
+
+# product of the values, as math.prod requires Python 3.8
+def _prod(values: Iterable[float]) -> float:
+    return reduce(mul, values, 1.0)
+
+
+# returns the terms of the polynomial, which is either Sympy expression or Poly
+def _get_terms(model: ModelAbs, expr) -> List[_Term]:
+    if isinstance(expr, Poly):
+        assert isinstance(model, PolyOpt)
+        names = model._names(expr)
+        return [(tuple(sorted(names[idx] for idx in mono)), c) for mono, c in expr.terms.items()]
+    terms = []
+    for term in Add.make_args(expand(expr)):
+        coeff, mono = term.as_coeff_Mul()
+        varnames = []  # type: List[str]
+        for factor in Mul.make_args(mono):
+            if isinstance(factor, Symbol):
+                varnames.append(factor.name)
+            elif isinstance(factor, Pow) and isinstance(factor.base, Symbol):
+                if not (isinstance(factor.exp, Integer) and factor.exp > 0):
+                    raise ValueError(f"Expression {expr} is not a polynomial")
+                varnames.extend([factor.base.name] * int(factor.exp))
+            elif factor.is_number:
+                coeff *= factor
+            else:
+                raise ValueError(f"Expression {expr} is not a polynomial")
+        terms.append((tuple(sorted(varnames)), coeff))
+    return terms
+
+
+# returns weights of the bits encoding the variable and the offset of the
+# encoding, i.e. x = offset + sum_i w_i b_i. Spins are encoded as s = 2b - 1
+def _encoding(name: str, var, mode: str) -> Tuple[List[int], int]:
+    if isinstance(var, _BIT_TYPES):
+        return [1], 0
+    if isinstance(var, _SPIN_TYPES):
+        return [2], -1
+    if not isinstance(var, _INT_TYPES):
+        raise ValueError(f"Variable {name} cannot be encoded with bits")
+    lb, ub = var.get_lb(), var.get_ub()
+    if isinf(lb) or isinf(ub):
+        raise ValueError(f"Variable {name} is not bounded")
+    if ub - lb == 1:
+        return [1], lb  # trivial conversion
+    if mode == "binary":
+        return _binary_encoding_coeff(lb, ub), lb
+    if mode == "one-hot":
+        return list(range(lb, ub + 1)), 0
+    raise ValueError(f"Unknown mode {mode}")
+
+
+class _Estimator:
+    def __init__(
+        self,
+        types: Dict[str, str],
+        encodings: Dict[str, Tuple[List[int], int]],
+        onehot: Set[str],
+    ) -> None:
+        self.types = types
+        self.onehot = onehot
+        self.pairs = set()  # type: Set[Tuple[str, str]]
+        self.is_quadratic = True
+        # upper bounds of the coefficients of the bits of the given variables
+        self.max_coeffs = dict()  # type: Dict[Tuple[str, ...], float]
+        self.min_coeff = 0.0
+        self.bits_no = {v: len(enc) for v, (enc, _) in encodings.items()}
+        self.nonzero_no = {v: sum(w != 0 for w in enc) for v, (enc, _) in encodings.items()}
+        self.offset = {v: abs(offset) for v, (_, offset) in encodings.items()}
+        self.min_weight = {v: min(abs(w) for w in enc if w) for v, (enc, _) in encodings.items()}
+        self.max_weight = {v: max(abs(w) for w in enc) for v, (enc, _) in encodings.items()}
+
+    # reduces powers of bits and spins
+    def reduce(self, mono: Tuple[str, ...]) -> Dict[str, int]:
+        powers = dict()  # type: Dict[str, int]
+        for name, power in Counter(mono).items():
+            if self.types[name] == "bit":
+                power = 1
+            elif self.types[name] == "spin":
+                power %= 2
+            if power:
+                powers[name] = power
+        return powers
+
+    # adds coeff to the upper bound of the coefficients of bits of vars
+    def add_max(self, varnames: Tuple[str, ...], coeff: float) -> None:
+        if coeff:
+            self.max_coeffs[varnames] = self.max_coeffs.get(varnames, 0.0) + coeff
+
+    # adds smallest contribution to the coefficients
+    def add_min(self, coeff: float) -> None:
+        self.min_coeff = min(self.min_coeff, coeff) if self.min_coeff else coeff
+
+    # adds contributions of coeff * mono, where each variable is replaced
+    # with offset + sum_i w_i b_i. For each variable x**k, between 1 and k
+    # bits of x can be chosen, thus quadratic terms are produced only if at
+    # most 2 variables are present
+    def add(self, mono: Tuple[str, ...], coeff) -> None:
+        powers = self.reduce(mono)
+        coeff = abs(float(coeff))
+        if not powers or coeff == 0:
+            return
+        self.add_min(coeff * _prod(self.min_weight[v] ** k for v, k in powers.items()))
+        max_w, off = self.max_weight, self.offset
+        degree = sum(powers.values())
+        if degree == 1:
+            (x,) = powers
+            self.add_max((x,), coeff * max_w[x])
+        elif degree == 2 and len(powers) == 2:
+            x, y = sorted(powers)
+            self.pairs.add((x, y))
+            self.add_max((x, y), coeff * max_w[x] * max_w[y])
+            self.add_max((x,), coeff * off[y] * max_w[x])
+            self.add_max((y,), coeff * off[x] * max_w[y])
+        elif degree == 2:
+            (x,) = powers
+            if self.bits_no[x] > 1:
+                self.pairs.add((x, x))
+                self.add_max((x, x), 2 * coeff * max_w[x] ** 2)
+            self.add_max((x,), coeff * (max_w[x] ** 2 + 2 * off[x] * max_w[x]))
+        else:
+            if sum(min(k, self.bits_no[v]) for v, k in powers.items()) > 2:
+                self.is_quadratic = False
+            # cross terms of x**k have multinomial coefficient at most k!
+            max_coeff = _prod(max_w[v] ** k * factorial(k) for v, k in powers.items())
+            self.add_max(tuple(sorted(powers)), coeff * max_coeff)
+
+    # adds terms of the penalty * row**2
+    def add_square(self, row: List[_Term], penalty: float) -> None:
+        for i, (mono1, coeff1) in enumerate(row):
+            self.add(mono1 + mono1, penalty * coeff1 * coeff1)
+            for mono2, coeff2 in row[i + 1 :]:  # noqa: E203
+                self.add(mono1 + mono2, 2 * penalty * coeff1 * coeff2)
+
+    # one-hot encoded variable comes with constraint sum_i b_i == 1, giving
+    # linear coefficients -penalty and quadratic ones 2 * penalty
+    def add_onehot(self, name: str, penalty: float) -> None:
+        self.pairs.add((name, name))
+        self.add_max((name,), abs(penalty))
+        self.add_max((name, name), 2 * abs(penalty))
+        self.add_min(abs(penalty))
+
+    def result(self) -> QuboEstimate:
+        estimate = QuboEstimate()
+        estimate.binaries = sum(self.bits_no.values())
+        for x, y in self.pairs:
+            if x != y:
+                estimate.quadratic_terms += self.nonzero_no[x] * self.nonzero_no[y]
+            else:
+                bits_no = self.bits_no[x] if x in self.onehot else self.nonzero_no[x]
+                estimate.quadratic_terms += bits_no * (bits_no - 1) // 2
+        estimate.is_quadratic = self.is_quadratic
+        estimate.min_coeff = self.min_coeff
+        estimate.max_coeff = max(self.max_coeffs.values(), default=0.0)
+        return estimate
+
+
+# lower bound of the polynomial given by its terms
+def _get_lowerbound(terms: List[_Term], model: ModelAbs) -> Bound:
+    lb = 0  # type: Bound
+    for mono, coeff in terms:
+        bounds = (_exact(coeff), _exact(coeff))  # type: Tuple[Bound, Bound]
+        for name, power in Counter(mono).items():
+            var = model.variables[name]
+            if isinstance(var, _BIT_TYPES):
+                var_bounds = (0, 1)  # type: Tuple[Bound, Bound]
+            elif isinstance(var, _SPIN_TYPES) and power % 2 == 0:
+                var_bounds = (1, 1)
+            else:
+                var_bounds = _interval_pow(_exact(var.get_lb()), _exact(var.get_ub()), power)
+            bounds = _interval_mul(bounds, var_bounds)
+        lb += bounds[0]
+    return lb
+
+
+# returns variables of the model with the slack variables added by IneqToEq,
+# terms of the objective and terms of the constraints moved to the left side
+def _get_structure(
+    model: ModelAbs,
+) -> Tuple[Dict[str, Any], List[_Term], List[List[_Term]]]:
+    slack_ubs = dict()  # type: Dict[str, int]
+    rows = []  # type: List[List[_Term]]
+    constraints = dict()  # type: Dict[str, Any]
+    for cname, c in model.constraints.items():
+        if isinstance(c, LinearConstraints):
+            constraints.update(c.to_constraints())
+        else:
+            constraints[cname] = c
+    for cname, c in constraints.items():
+        row = _get_terms(model, c.exprleft - c.exprright)
+        if c.is_ineq_constraint():
+            geq = c.sense == INEQ_GEQ_SENSE
+            slack_bound = -_get_lowerbound([(m, -coeff) for m, coeff in row] if geq else row, model)
+            if slack_bound < 0:
+                raise ValueError(f"Inequality {cname} is not satisfiable")
+            if slack_bound > 0:
+                slack_name = f"{cname}{INTER_STR_SEP}slack"
+                slack_ubs[slack_name] = ceil(slack_bound)
+                row.append(((slack_name,), -1 if geq else 1))
+        rows.append(row)
+
+    variables = dict(model.variables)  # type: Dict[str, Any]
+    variables.update({name: sympyopt_vars.IntVar(name, 0, ub) for name, ub in slack_ubs.items()})
+    return variables, _get_terms(model, model.objective), rows
+
+
+# returns the estimator with all the terms of the QUBO added
+def _get_estimator(
+    variables: Dict[str, Any],
+    objective: List[_Term],
+    rows: List[List[_Term]],
+    modes: Mapping[str, str],
+    default_mode: str,
+    penalty: float,
+) -> _Estimator:
+    types = dict()  # type: Dict[str, str]
+    encodings = dict()  # type: Dict[str, Tuple[List[int], int]]
+    onehot = set()  # type: Set[str]
+    for name, var in variables.items():
+        if isinstance(var, _BIT_TYPES):
+            types[name] = "bit"
+        elif isinstance(var, _SPIN_TYPES):
+            types[name] = "spin"
+        else:
+            types[name] = "int"
+        var_mode = modes.get(name, default_mode)
+        encodings[name] = _encoding(name, var, var_mode)
+        if len(encodings[name][0]) > 1 and var_mode == "one-hot":
+            onehot.add(name)
+
+    estimator = _Estimator(types, encodings, onehot)
+    for mono, coeff in objective:
+        estimator.add(mono, coeff)
+    for row in rows:
+        estimator.add_square(row, penalty)
+    for name in onehot:
+        estimator.add_onehot(name, penalty)
+    return estimator
+
+
+def estimate_qubo(
+    model: ModelAbs, mode: Union[str, Mapping[str, str]] = "binary", penalty: float = None
+) -> QuboEstimate:
+    """Estimate the QUBO produced from the model without converting it
+
+    Predicts the result of transforming inequalities into equalities with
+    slack variables, encoding integer variables with bits, shifting the
+    equalities, including the constraints of one-hot encodings, into the
+    objective with penalty, and replacing spins with bits. Only the
+    structure of the terms and the bounds of the variables are used, thus the
+    estimation is much faster than the conversion.
+
+    mode is either the encoding used for all integer variables, "binary" or
+    "one-hot", or a dictionary mapping names of the variables into the
+    encodings. Variables missing in the dictionary, including the slack
+    variables named "<constraint name>___slack", are encoded with "binary".
+
+    :param model: SympyOpt or PolyOpt model with bounded variables
+    :param mode: encoding of the integer variables
+    :param penalty: penalty used for shifting the equalities, defaults to
+        DEFAULT_PENALTY_VALUE
+    :return: the estimate
+    """
+    if penalty is None:
+        penalty = DEFAULT_PENALTY_VALUE
+    modes = {} if isinstance(mode, str) else mode
+    default_mode = mode if isinstance(mode, str) else "binary"
+    variables, objective, rows = _get_structure(model)
+    return _get_estimator(variables, objective, rows, modes, default_mode, penalty).result()
+
+
+# violation of the limits, number of quadratic terms and number of binaries,
+# compared lexicographically
+def _score(
+    binaries: int, quadratic_terms: int, max_binaries: Optional[int], max_density: Optional[float]
+) -> Tuple[float, int, int]:
+    excess = 0.0
+    if max_binaries is not None and binaries > max_binaries:
+        excess += (binaries - max_binaries) / max_binaries
+    pairs = binaries * (binaries - 1) // 2
+    density = quadratic_terms / pairs if pairs else 0.0
+    if max_density is not None and density > max_density:
+        excess += (density - max_density) / max_density
+    return excess, quadratic_terms, binaries
+
+
+# numbers of the bits, of the bits with nonzero weights and of the quadratic
+# terms between the bits of the variable itself, for the given encoding.
+# self_pair denotes if the variable is multiplied by itself in the QUBO
+def _bit_counts(name: str, var, mode: str, self_pair: bool) -> Tuple[int, int, int]:
+    weights, _ = _encoding(name, var, mode)
+    bits_no, nonzero_no = len(weights), sum(w != 0 for w in weights)
+    if mode == "one-hot" and bits_no > 1:
+        return bits_no, nonzero_no, bits_no * (bits_no - 1) // 2
+    if self_pair:
+        return bits_no, nonzero_no, nonzero_no * (nonzero_no - 1) // 2
+    return bits_no, nonzero_no, 0
+
+
+def select_encodings(
+    model: ModelAbs,
+    varnames: Iterable[str],
+    max_binaries: int = None,
+    max_density: float = None,
+) -> Dict[str, str]:
+    """Choose the encoding of each integer variable
+
+    Chooses "binary" or "one-hot" encoding for the integer variables of
+    given names, so that the QUBO produced as in estimate_qubo has at most
+    max_binaries binary variables and density of quadratic terms at most
+    max_density, and the number of its quadratic terms is minimal. Names
+    which are not integer variables are skipped, remaining variables are
+    assumed to be encoded with "binary".
+
+    Starting with binary encodings, the encoding of a single variable
+    reducing the violation of the limits, and then the number of quadratic
+    terms, the most is changed, until no change improves the QUBO. Binary
+    encoding needs fewer bits, while one-hot encoding may lower the density
+    of the QUBO. The QUBO is estimated once as in estimate_qubo, and each
+    change is scored by the differences in the numbers of bits and quadratic
+    terms it causes, thus the model is neither converted nor estimated
+    repeatedly.
+
+    :param model: SympyOpt or PolyOpt model with bounded variables
+    :param varnames: names of the encoded variables
+    :param max_binaries: maximal number of binary variables, defaults to no limit
+    :param max_density: maximal density of quadratic terms, defaults to no limit
+    :raises ValueError: if no encodings satisfying the limits were found
+    :return: dictionary mapping names of the variables into the encodings
+    """
+    assert max_binaries is None or max_binaries > 0
+    assert max_density is None or max_density > 0
+    variables, objective, rows = _get_structure(model)
+    modes = {
+        name: "binary" for name in varnames if isinstance(variables.get(name), _INT_TYPES)
+    }  # type: Dict[str, str]
+    # variables with two values are encoded with a single bit in both modes
+    candidates = [name for name in modes if variables[name].get_ub() - variables[name].get_lb() > 1]
+    penalty = DEFAULT_PENALTY_VALUE
+
+    # bits of the same pairs of variables are joined with quadratic terms in
+    # both encodings, apart from the constraints of one-hot encodings. Thus
+    # the pairs are found once, and each change is scored by the differences
+    # in the numbers of bits and quadratic terms, which depend only on the
+    # pairs containing the changed variable
+    estimator = _get_estimator(variables, objective, rows, modes, "binary", penalty)
+    neighbours: Dict[str, List[str]] = {name: [] for name in candidates}
+    for x, y in estimator.pairs:
+        if x != y and x in neighbours:
+            neighbours[x].append(y)
+        if x != y and y in neighbours:
+            neighbours[y].append(x)
+    counts = {
+        name: {
+            mode: _bit_counts(name, variables[name], mode, (name, name) in estimator.pairs)
+            for mode in ENCODING_MODES
+        }
+        for name in candidates
+    }
+    nonzero_no = estimator.nonzero_no
+    neighbours_nonzero = {name: sum(nonzero_no[y] for y in neighbours[name]) for name in candidates}
+    estimate = estimator.result()
+    binaries, quadratic_terms = estimate.binaries, estimate.quadratic_terms
+
+    best = _score(binaries, quadratic_terms, max_binaries, max_density)
+    while True:
+        best_name = None
+        for name in candidates:
+            old, new = counts[name][modes[name]], counts[name][_SWITCHED_MODE[modes[name]]]
+            new_binaries = binaries + new[0] - old[0]
+            new_terms = quadratic_terms + new[2] - old[2]
+            new_terms += (new[1] - old[1]) * neighbours_nonzero[name]
+            score = _score(new_binaries, new_terms, max_binaries, max_density)
+            if score < best:
+                best, best_name = score, name
+        if best_name is None:
+            break
+        old = counts[best_name][modes[best_name]]
+        modes[best_name] = _SWITCHED_MODE[modes[best_name]]
+        new = counts[best_name][modes[best_name]]
+        binaries, quadratic_terms = best[2], best[1]
+        for y in neighbours[best_name]:
+            if y in neighbours_nonzero:
+                neighbours_nonzero[y] += new[1] - old[1]
+
+    if best[0] > 0:
+        raise ValueError("No encoding of the variables satisfies the limits")
+    return modes
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, MutableMapping
 
 MIN_SENSE = "min"
 MAX_SENSE = "max"
@@ -18,10 +18,10 @@ class ModelAbs(ABC):
 
     @abstractmethod
     def __init__(self) -> None:
-        self.variables = dict()  # type: Dict[str,Any]
-        self.constraints = dict()  # type: Dict[str,Any]
+        self.variables: MutableMapping[str, Any] = dict()
+        self.constraints: Dict[str, Any] = dict()
         self.sense = MIN_SENSE
-        self.objective = None
+        self.objective: Any = None
 
         pass
 
@@ -0,0 +1,151 @@
+from copy import copy
+from typing import Any, Dict, List, Mapping, MutableMapping, Tuple, TypeVar
+
+from .model import ModelAbs
+
+ModelType = TypeVar("ModelType", bound=ModelAbs)
+
+# state of the model, i.e. its attributes with containers copied shallowly
+ModelState = Dict[str, Any]
+
+# delta of a dictionary attribute: removed keys and new or replaced values
+DictDelta = Tuple[List[Any], Dict[Any, Any]]
+
+
+# copies containers of the state shallowly, so that elements are shared
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, (MutableMapping, set, list)):
+        return copy(value)
+    return value
+
+
+# extracts the state of the model, elements of containers are shared
+def _get_state(model: ModelAbs) -> ModelState:
+    state = {name: _copy_value(value) for name, value in vars(model).items()}
+    state["__class__"] = type(model)
+    return state
+
+
+# builds the model from the state, containers are copied so that the state
+# is not affected by the changes of the built model
+def _build_model(state: ModelState) -> ModelAbs:
+    cls = state["__class__"]
+    model = cls.__new__(cls)
+    for name, value in state.items():
+        if name != "__class__":
+            setattr(model, name, _copy_value(value))
+    return model
+
+
+_MISSING = object()
+
+
+# computes changes between dictionaries, values are compared by identity
+def _dict_delta(old: Mapping, new: Mapping) -> DictDelta:
+    removed = [key for key in old if key not in new]
+    changed = {key: val for key, val in new.items() if old.get(key, _MISSING) is not val}
+    return removed, changed
+
+
+class _ModelDelta:
+    # changes of the model between two consecutive steps of the history
+    def __init__(self) -> None:
+        self.dicts = dict()  # type: Dict[str, DictDelta]
+        self.attrs = dict()  # type: Dict[str, Any]
+        self.removed = []  # type: List[str]
+
+
+def share_model(model: ModelType) -> ModelType:
+    """Create a copy of the model sharing its variables and constraints
+
+    Containers of the model (dictionaries of variables and constraints) are
+    copied, while their elements and the objective function are shared
+    between the models. Converters never modify variables and constraints
+    in place, thus the copy is not affected by the conversion of the original
+    model and vice versa.
+
+    :param model: copied model
+    :return: model sharing the elements with the original one
+    """
+    shared = _build_model(_get_state(model))
+    assert isinstance(shared, type(model))
+    return shared
+
+
+class ModelHistory:
+    """Copy-on-write history of the models
+
+    Stores the first model and, for each next model, only the changes with
+    respect to the previous one: added, replaced or removed variables and
+    constraints, and the new objective function if it was changed. Since
+    converters replace variables and constraints instead of modifying them
+    in place, the objects are compared by identity and shared between the
+    steps. Intermediate models are reconstructed on demand, by applying the
+    changes to the first model.
+
+    Reconstructed models share variables, constraints and the objective
+    function with the history, and should not be modified in place.
+    """
+
+    def __init__(self) -> None:
+        self._base = None  # type: Any
+        self._deltas = []  # type: List[_ModelDelta]
+        self._last = dict()  # type: ModelState
+
+    def __len__(self) -> int:
+        if self._base is None:
+            return 0
+        return len(self._deltas) + 1
+
+    def append(self, model: ModelAbs) -> None:
+        """Record the model as the next step of the history
+
+        :param model: recorded model
+        """
+        state = _get_state(model)
+        if self._base is None:
+            self._base = state
+            self._last = dict(state)
+            return
+        delta = _ModelDelta()
+        for name, value in state.items():
+            old = self._last.get(name, _MISSING)
+            if isinstance(value, MutableMapping) and isinstance(old, MutableMapping):
+                removed, changed = _dict_delta(old, value)
+                if removed or changed:
+                    delta.dicts[name] = (removed, changed)
+            elif isinstance(value, (set, list)):
+                if old != value:
+                    delta.attrs[name] = value
+            elif old is not value:
+                delta.attrs[name] = value
+        delta.removed = [name for name in self._last if name not in state]
+        self._deltas.append(delta)
+        self._last = state
+
+    def _state_at(self, step: int) -> ModelState:
+        state = {name: _copy_value(value) for name, value in self._base.items()}
+        for delta in self._deltas[:step]:
+            for name in delta.removed:
+                del state[name]
+            for name, (removed, changed) in delta.dicts.items():
+                for key in removed:
+                    del state[name][key]
+                state[name].update(changed)
+            for name, value in delta.attrs.items():
+                state[name] = _copy_value(value)
+        return state
+
+    def __getitem__(self, step: int) -> ModelAbs:
+        """Reconstruct the model from the given step
+
+        :param step: step of the history, negative values count from the end
+        :raises IndexError: if step is out of range
+        :return: the model recorded in the step
+        """
+        length = len(self)
+        if step < 0:
+            step += length
+        if not 0 <= step < length:
+            raise IndexError("Model history index out of range")
+        return _build_model(self._state_at(step))
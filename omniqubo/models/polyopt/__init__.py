@@ -0,0 +1,5 @@
+from .polyopt import PolyOpt
+
+__all__ = [
+    "PolyOpt",
+]
@@ -0,0 +1,133 @@
+from typing import Iterable, List, Union
+
+from omniqubo.constraints import INEQ_GEQ_SENSE, INEQ_LEQ_SENSE, ConstraintAbs
+
+from .poly import Poly
+
+
+class ConstraintPolyOpt(ConstraintAbs):
+    """Abstract class for PolyOpt constraints
+
+    Each constraint compares two polynomials, exprleft and exprright.
+
+    :param exprleft: The left expression of the constraint
+    :param exprright: The right expression of the constraint
+    """
+
+    __slots__ = ("exprleft", "exprright")
+
+    def __init__(self, exprleft: Union[Poly, float], exprright: Union[Poly, float]) -> None:
+        self.exprleft = Poly._coerce(exprleft)
+        self.exprright = Poly._coerce(exprright)
+        super().__init__()
+
+    # outputs list of variable indices which are not in vars
+    # important for verification if all variables are in the model
+    def _list_unknown_vars(self, vars: Iterable) -> List:
+        known = set(vars)
+        used = self.exprleft.variables() | self.exprright.variables()
+        return [idx for idx in used if idx not in known]
+
+
+class ConstraintEq(ConstraintPolyOpt):
+    """Equality constraint for PolyOpt
+
+    Constraint of the form exprleft == exprright.
+
+    :param exprleft: The left expression of the equality
+    :param exprright: The right expression of the equality
+    """
+
+    __slots__ = ()
+
+    def __init__(self, exprleft: Union[Poly, float], exprright: Union[Poly, float]) -> None:
+        super().__init__(exprleft, exprright)
+
+    def is_eq_constraint(self) -> bool:
+        """Check if the constraint is an equality
+
+        :return: True
+        """
+        return True
+
+    def is_ineq_constraint(self) -> bool:
+        """Check if the constraint is an inequality
+
+        :return: False
+        """
+        return False
+
+    def __eq__(self, sec: object) -> bool:
+        """Compares two constraints
+
+        The reference object needs to be ConstraintEq. f == g and a == b are
+        equivalent if (f - g) - (a - b) or (f - g) + (a - b) is approximately
+        zero. Variables are compared by their indices.
+        """
+        if not isinstance(sec, ConstraintEq):
+            return False
+        expr1 = self.exprleft - self.exprright
+        expr2 = sec.exprleft - sec.exprright
+        return expr1 - expr2 == 0 or expr1 + expr2 == 0
+
+    def __str__(self) -> str:
+        return f"{self.exprleft} == {self.exprright}"
+
+
+class ConstraintIneq(ConstraintPolyOpt):
+    """Inequality constraint for PolyOpt
+
+    Constraint of the form exprleft <= exprright for sense equal to
+    INEQ_LEQ_SENSE or exprleft >= exprright for sense equal to INEQ_GEQ_SENSE.
+
+    :param exprleft: The left expression of the inequality
+    :param exprright: The right expression of the inequality
+    :param sense: the sense of the inequality
+    """
+
+    __slots__ = ("sense",)
+
+    def __init__(
+        self, exprleft: Union[Poly, float], exprright: Union[Poly, float], sense: str = None
+    ) -> None:
+        if sense is None:
+            sense = INEQ_LEQ_SENSE
+        if sense != INEQ_GEQ_SENSE and sense != INEQ_LEQ_SENSE:
+            raise ValueError(f"incorrect sense {sense}")
+        self.sense = sense
+        super().__init__(exprleft, exprright)
+
+    def is_eq_constraint(self) -> bool:
+        """Check if the constraint is an equality
+
+        :return: False
+        """
+        return False
+
+    def is_ineq_constraint(self) -> bool:
+        """Check if the constraint is an inequality
+
+        :return: True
+        """
+        return True
+
+    def __eq__(self, sec: object) -> bool:
+        """Compares two inequality constraints
+
+        The reference object needs to be ConstraintIneq. If senses are the same
+        for both inequalities, for example f >= g and a >= b, then constraints
+        are equivalent if (f - g) - (a - b) is approximately zero. Otherwise the
+        condition is (f - g) + (a - b) is approximately zero. Variables are
+        compared by their indices.
+        """
+        if not isinstance(sec, ConstraintIneq):
+            return False
+        expr1 = self.exprleft - self.exprright
+        expr2 = sec.exprleft - sec.exprright
+        if self.sense == sec.sense:
+            return expr1 - expr2 == 0
+        return expr1 + expr2 == 0
+
+    def __str__(self) -> str:
+        sense = ">=" if self.sense == INEQ_GEQ_SENSE else "<="
+        return f"{self.exprleft} {sense} {self.exprright}"
@@ -0,0 +1,712 @@
+import re
+from copy import copy
+from itertools import groupby
+from math import ceil
+from numbers import Number
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import numpy as np
+
+from omniqubo.constraints import INEQ_GEQ_SENSE
+from omniqubo.converters.converter import can_convert, convert
+from omniqubo.converters.eq_to_objective import EqToObj
+from omniqubo.converters.ineq_to_eq import IneqToEq
+from omniqubo.converters.presolve import Presolve
+from omniqubo.converters.quadratize import QuadratizePyqubo
+from omniqubo.converters.simple_manipulation import (
+    MakeMax,
+    MakeMin,
+    RemoveConstraint,
+    RemoveTrivialConstraints,
+    SetILPIntVarBounds,
+    SetIntVarBounds,
+)
+from omniqubo.converters.utils import INTER_STR_SEP
+from omniqubo.converters.varreplace import (
+    BitToSpin,
+    IntSetValue,
+    ReplaceVarWithEq,
+    SpinToBit,
+    TrivialIntToBit,
+    VarBinary,
+    VarOneHot,
+    VarPracticalBinary,
+    VarReplace,
+    VarReplaceBatch,
+    _binary_encoding_coeff,
+)
+from omniqubo.converters.verifier import EQ_CTYPE, GEQ_CTYPE, LEQ_CTYPE, ConstraintsVerifier
+from omniqubo.model import MAX_SENSE, MIN_SENSE
+
+from .constraints import ConstraintEq, ConstraintIneq
+from .poly import Monomial, Poly
+from .polyopt import PolyOpt
+from .vars import BitVar, IntVar
+
+# for explanation of how each convert and can_convert works, see documentation
+# of appropriate converter class
+
+
+# NumPy-vectorized function computing the value of the polynomial. Variable
+# names are resolved at the time of creation, so the function stays valid after
+# the variables are removed from the model
+class _PolyFunction:
+    def __init__(self, model: PolyOpt, expr: Poly) -> None:
+        self.expr = expr
+        self.names = model._names(expr)
+
+    def __call__(self, values: Dict[str, np.ndarray]) -> np.ndarray:
+        return self.expr.evaluate({idx: values[name] for idx, name in self.names.items()})
+
+
+# adds constraint expr ==/<=/>= 0 into the verifier. Linear expressions are
+# stored as sparse rows, others as NumPy functions
+def _add_to_verifier(verifier: ConstraintsVerifier, model: PolyOpt, expr: Poly, ctype: str) -> None:
+    if expr.degree() <= 1:
+        names = model._names(expr)
+        coeffs = {names[mono[0]]: coeff for mono, coeff in expr.terms.items() if mono}
+        verifier.add_linear(coeffs, expr.constant(), ctype)
+    else:
+        fun = _PolyFunction(model, expr)
+        verifier.add_nonlinear(fun, list(fun.names.values()), ctype)
+
+
+# looks for the names of constraints of type ctype according to the converter
+def _matching_constrnames(model: PolyOpt, converter, ctype: type) -> List[str]:
+    constr_names: List[str] = []
+    if converter.is_regexp:
+        _rex = re.compile(converter.name)
+        for cname, c in model.constraints.items():
+            if _rex.fullmatch(cname) and isinstance(c, ctype):
+                constr_names.append(cname)
+    else:
+        assert isinstance(model.constraints[converter.name], ctype)
+        constr_names.append(converter.name)
+    return constr_names
+
+
+# EqToObj
+
+
+@convert.register
+def convert_polyopt_eqtoobj(model: PolyOpt, converter: EqToObj) -> PolyOpt:
+    assert can_convert(model, converter)
+    constr_names = _matching_constrnames(model, converter, ConstraintEq)
+
+    converter.data["verifier"] = ConstraintsVerifier()
+    scale = converter.penalty if model.sense == MIN_SENSE else -converter.penalty
+    # penalties are accumulated in place, so that the objective is rebuilt only once
+    penalties = Poly()
+    for cname in constr_names:
+        c = model.constraints.pop(cname)
+        assert isinstance(c, ConstraintEq)
+        diff = c.exprleft - c.exprright
+        penalties._iadd_scaled(model._bitspin_simp(diff * diff), scale)
+        if c.check_interpret:
+            _add_to_verifier(converter.data["verifier"], model, diff, EQ_CTYPE)
+    model.objective = model.objective + penalties
+    return model
+
+
+@can_convert.register
+def can_convert_polyopt_eqtoobj(model: PolyOpt, converter: EqToObj) -> bool:
+    # symbolic penalties are not supported by Poly
+    if not isinstance(converter.penalty, Number):
+        return False
+    if converter.is_regexp:
+        return True
+    name = converter.name
+    if name not in model.constraints:
+        return False
+    return isinstance(model.constraints[name], ConstraintEq)
+
+
+# IneqToEq
+
+
+# multiplies two intervals, where 0 * INF is assumed to be 0
+def _interval_mul(int1: Tuple[float, float], int2: Tuple[float, float]) -> Tuple[float, float]:
+    products = [x * y if x != 0 and y != 0 else 0 for x in int1 for y in int2]
+    return min(products), max(products)
+
+
+# bounds of var**exp, where var is bounded with lb and ub
+def _power_bounds(lb: float, ub: float, exp: int) -> Tuple[float, float]:
+    low, high = pow(lb, exp), pow(ub, exp)
+    if exp % 2 == 1:
+        return low, high
+    if lb * ub <= 0:
+        return 0, max(low, high)
+    return min(low, high), max(low, high)
+
+
+# gets lower and upper bound on the polynomial. Model is used for getting var
+# bounds. Tight for linear expressions
+def _get_bounds(poly: Poly, model: PolyOpt) -> Tuple[float, float]:
+    lower, upper = 0.0, 0.0
+    for mono, coeff in poly.terms.items():
+        bounds = (coeff, coeff)
+        for idx, group in groupby(mono):
+            var = model._vars_by_idx[idx]
+            bounds = _interval_mul(
+                bounds, _power_bounds(var.get_lb(), var.get_ub(), len(list(group)))
+            )
+        lower += bounds[0]
+        upper += bounds[1]
+    return lower, upper
+
+
+@convert.register
+def convert_polyopt_ineqtoeq(model: PolyOpt, converter: IneqToEq) -> PolyOpt:
+    assert can_convert(model, converter)
+    constr_names = _matching_constrnames(model, converter, ConstraintIneq)
+
+    converter.data["verifier"] = ConstraintsVerifier()
+    converter.data["slack_names"] = []
+    for cname in constr_names:
+        c = model.constraints.pop(cname)
+        assert isinstance(c, ConstraintIneq)
+
+        if c.sense == INEQ_GEQ_SENSE:
+            slack_bound = -_get_bounds(c.exprright - c.exprleft, model)[0]
+        else:  # INEQ_LEQ_SENSE
+            slack_bound = -_get_bounds(c.exprleft - c.exprright, model)[0]
+        slack_name = f"{cname}{INTER_STR_SEP}slack"
+        if slack_bound == 0:
+            slack_var = Poly()  # no need for a variable
+            slack_name = ""
+        elif slack_bound > 0:
+            slack_var = model.int_var(slack_name, lb=0, ub=ceil(slack_bound))
+        else:
+            raise ValueError(f"Inequality {cname} is not satisfiable")
+
+        if c.sense == INEQ_GEQ_SENSE:
+            c_new = ConstraintEq(c.exprleft - slack_var, c.exprright)
+        else:  # INEQ_LEQ_SENSE
+            c_new = ConstraintEq(c.exprleft + slack_var, c.exprright)
+        c_new.check_interpret = False
+        model.add_constraint(c_new, cname)
+
+        if slack_name != "":
+            converter.data["slack_names"].append(slack_name)
+        verifier = converter.data["verifier"]
+        if converter.check_slack:
+            _add_to_verifier(verifier, model, c_new.exprleft - c_new.exprright, EQ_CTYPE)
+        else:
+            ctype = GEQ_CTYPE if c.sense == INEQ_GEQ_SENSE else LEQ_CTYPE
+            _add_to_verifier(verifier, model, c.exprleft - c.exprright, ctype)
+
+    return model
+
+
+@can_convert.register
+def can_convert_polyopt_ineqtoeq(model: PolyOpt, converter: IneqToEq) -> bool:
+    if converter.is_regexp:
+        return True
+    name = converter.name
+    if name not in model.constraints:
+        return False
+    return isinstance(model.constraints[name], ConstraintIneq)
+
+
+# QuadratizePyqubo
+
+
+@convert.register
+def convert_polyopt_quadratizepyqubo(model: PolyOpt, converter: QuadratizePyqubo) -> PolyOpt:
+    assert can_convert(model, converter)
+    raise NotImplementedError()
+
+
+@can_convert.register
+def can_convert_polyopt_quadratizepyqubo(model: PolyOpt, converter: QuadratizePyqubo) -> bool:
+    return model.is_hobo()
+
+
+# MakeMax
+
+
+@convert.register
+def convert_polyopt_makemax(model: PolyOpt, converter: MakeMax) -> PolyOpt:
+    assert can_convert(model, converter)
+    if model.sense == MIN_SENSE:
+        model.maximize(-model.get_objective())
+    return model
+
+
+@can_convert.register
+def can_convert_polyopt_makemax(model: PolyOpt, converter: MakeMax) -> bool:
+    return True
+
+
+# MakeMin
+
+
+@convert.register
+def convert_polyopt_makemin(model: PolyOpt, converter: MakeMin) -> PolyOpt:
+    assert can_convert(model, converter)
+    if model.sense == MAX_SENSE:
+        model.minimize(-model.get_objective())
+    return model
+
+
+@can_convert.register
+def can_convert_polyopt_makemin(model: PolyOpt, converter: MakeMin) -> bool:
+    return True
+
+
+# RemoveConstraint
+
+
+@convert.register
+def convert_polyopt_removeconstraint(model: PolyOpt, converter: RemoveConstraint) -> PolyOpt:
+    assert can_convert(model, converter)
+    converter.data["verifier"] = ConstraintsVerifier()
+
+    to_be_removed: List[str] = []
+    if converter.is_regexp:
+        _rex = re.compile(converter.name)
+        to_be_removed = [cname for cname in model.constraints if _rex.fullmatch(cname)]
+    else:
+        to_be_removed.append(converter.name)
+
+    for cname in to_be_removed:
+        c = model.constraints.pop(cname)
+
+        if converter.check_constraint:
+            if isinstance(c, ConstraintEq):
+                ctype = EQ_CTYPE
+            else:
+                assert isinstance(c, ConstraintIneq)
+                ctype = GEQ_CTYPE if c.sense == INEQ_GEQ_SENSE else LEQ_CTYPE
+            _add_to_verifier(converter.data["verifier"], model, c.exprleft - c.exprright, ctype)
+    return model
+
+
+@can_convert.register
+def can_convert_polyopt_removeconstraint(model: PolyOpt, converter: RemoveConstraint) -> bool:
+    if converter.is_regexp:
+        return True
+    return converter.name in model.constraints
+
+
+# RemoveTrivialConstraints
+
+
+# removing trivial constraints is not supported by PolyOpt, models have to be
+# converted with SympyOpt backend
+@can_convert.register
+def can_convert_polyopt_removetrivialconstraints(
+    model: PolyOpt, converter: RemoveTrivialConstraints
+) -> bool:
+    return False
+
+
+# Presolve
+
+
+# presolve is not supported by PolyOpt, models have to be presolved with
+# SympyOpt backend
+@can_convert.register
+def can_convert_polyopt_presolve(model: PolyOpt, converter: Presolve) -> bool:
+    return False
+
+
+# general commands for VarReplace
+
+
+# substitute polynomials for variables in objective and all constraints
+# note: constraints are replaced, not modified, as they may be shared with
+# the model history
+def _sub_expression(model: PolyOpt, rule_dict: Dict[int, Poly]):
+    model.objective = model.objective.subs(rule_dict)
+    for name, c in model.constraints.items():
+        exprleft = c.exprleft.subs(rule_dict)
+        exprright = c.exprright.subs(rule_dict)
+        if exprleft is not c.exprleft or exprright is not c.exprright:
+            c = copy(c)
+            c.exprleft = exprleft
+            c.exprright = exprright
+            model.constraints[name] = c
+
+
+# looks for a matching variables names according to the name (perhaps regular
+# expression). if is regular expression - filter the varnames. Otherwise
+# filtering_fun has to be satisfied
+def _matching_varnames(
+    model: PolyOpt, converter: Union[VarReplace, SetIntVarBounds], filtering_fun: Callable
+) -> List[str]:
+    var_to_replace: List[str] = []
+    if converter.is_regexp:
+        _rex = re.compile(converter.varname)
+        for varname in model.variables:
+            if _rex.fullmatch(varname) and filtering_fun(varname):
+                var_to_replace.append(varname)
+    else:
+        assert filtering_fun(converter.varname)
+        var_to_replace.append(converter.varname)
+    return var_to_replace
+
+
+# check if integer variable can be converted into bits
+def _can_convert_int(model: PolyOpt, name: str) -> bool:
+    var = model.variables[name]
+    if not isinstance(var, IntVar):
+        return False
+    return np.isfinite(var.lb) and np.isfinite(var.ub)
+
+
+# SetIntVarBounds
+
+
+# verifies if single variable can have bounds set up
+def _can_convert_intsetbounds_sing(model: PolyOpt, converter: SetIntVarBounds, name: str) -> bool:
+    if name not in model.variables:
+        return False
+    var = model.variables[name]
+    if not isinstance(var, IntVar):
+        return False
+    return (not np.isfinite(var.lb) and converter.lb is not None) or (
+        not np.isfinite(var.ub) and converter.ub is not None
+    )
+
+
+@convert.register
+def convert_polyopt_setintvarbounds(model: PolyOpt, converter: SetIntVarBounds) -> PolyOpt:
+    assert can_convert(model, converter)
+
+    def filtering_fun(varname: str) -> bool:
+        return _can_convert_intsetbounds_sing(model, converter, varname)
+
+    varnames = _matching_varnames(model, converter, filtering_fun=filtering_fun)
+    for vname in varnames:
+        # variable is replaced, not modified, as it may be shared with the
+        # model history
+        var = copy(model.variables[vname])
+        assert isinstance(var, IntVar)
+        if converter.lb is not None and not np.isfinite(var.lb):
+            assert converter.lb < var.ub
+            var.lb = converter.lb
+        if converter.ub is not None and not np.isfinite(var.ub):
+            assert var.lb < converter.ub
+            var.ub = converter.ub
+        model.variables[vname] = var
+        model._vars_by_idx[var.idx] = var
+    return model
+
+
+@can_convert.register
+def can_convert_polyopt_setintvarbounds(model: PolyOpt, converter: SetIntVarBounds) -> bool:
+    if converter.is_regexp:
+        return True
+    return _can_convert_intsetbounds_sing(model, converter, converter.varname)
+
+
+# SetILPIntVarBounds
+
+
+@convert.register
+def convert_polyopt_setilpintvarbounds(model: PolyOpt, converter: SetILPIntVarBounds) -> PolyOpt:
+    assert can_convert(model, converter)
+    raise NotImplementedError()
+
+
+@can_convert.register
+def can_convert_polyopt_setilpintvarbounds(model: PolyOpt, converter: SetILPIntVarBounds) -> bool:
+    raise NotImplementedError()
+
+
+# VarOneHot
+
+
+# outputs expression and adds constraint for one-hot encoding
+def _get_expr_add_constr_onehot(model: PolyOpt, var: IntVar) -> Poly:
+    name = var.name
+    lb = var.lb
+    ub = var.ub
+    idxs = []
+    for i in range(ub - lb + 1):
+        bname = f"{name}{INTER_STR_SEP}OH_{i}"
+        model.bit_var(bname)
+        idxs.append(model.variables[bname].idx)
+
+    # add constraint
+    c = ConstraintEq(Poly({(idx,): 1 for idx in idxs}), 1)
+    model.add_constraint(c, name=f"{INTER_STR_SEP}OH_{name}")
+
+    return Poly({(idx,): v for idx, v in zip(idxs, range(lb, ub + 1))})
+
+
+# removes matching variables from the model, returning their substitution
+# for the objective and constraints
+def _replace_varonehot(model: PolyOpt, converter: VarOneHot) -> Dict[int, Poly]:
+    def filtering_fun(vname: str):
+        return _can_convert_int(model, vname)
+
+    var_to_replace = _matching_varnames(model, converter, filtering_fun)
+
+    rule_dict: Dict[int, Poly] = dict()
+    for vname in var_to_replace:
+        var = model.variables[vname]
+        assert isinstance(var, IntVar)
+        rule_dict[var.idx] = _get_expr_add_constr_onehot(model, var)
+
+    converter.data["bounds"] = dict()
+    for vname in var_to_replace:
+        var = model._pop_var(vname)
+        assert isinstance(var, IntVar)
+        converter.data["bounds"][vname] = (var.lb, var.ub)
+    return rule_dict
+
+
+@convert.register
+def convert_polyopt_varonehot(model: PolyOpt, converter: VarOneHot) -> PolyOpt:
+    assert can_convert(model, converter)
+    _sub_expression(model, _replace_varonehot(model, converter))
+    return model
+
+
+@can_convert.register
+def can_convert_polyopt_varonehot(model: PolyOpt, converter: VarOneHot) -> bool:
+    if converter.is_regexp:
+        return True
+    return _can_convert_int(model, converter.varname)
+
+
+# VarBinary
+
+
+# https://link.springer.com/article/10.1007/s11128-019-2213-x Eq. (5)
+def _get_expr_binary(model: PolyOpt, var: IntVar) -> Poly:
+    name = var.name
+    vals = _binary_encoding_coeff(var.lb, var.ub)
+    terms: Dict[Monomial, Any] = {(): var.lb}
+    for i, val in enumerate(vals):
+        bname = f"{name}{INTER_STR_SEP}BIN_{i}"
+        model.bit_var(bname)
+        terms[(model.variables[bname].idx,)] = val
+    return Poly(terms)
+
+
+# removes matching variables from the model, returning their substitution
+# for the objective and constraints
+def _replace_varbinary(model: PolyOpt, converter: VarBinary) -> Dict[int, Poly]:
+    def filtering_fun(vname: str):
+        return _can_convert_int(model, vname)
+
+    var_to_replace = _matching_varnames(model, converter, filtering_fun)
+
+    rule_dict: Dict[int, Poly] = dict()
+    for vname in var_to_replace:
+        var = model.variables[vname]
+        assert isinstance(var, IntVar)
+        rule_dict[var.idx] = _get_expr_binary(model, var)
+
+    converter.data["bounds"] = dict()
+    for vname in var_to_replace:
+        var = model._pop_var(vname)
+        assert isinstance(var, IntVar)
+        converter.data["bounds"][vname] = (var.lb, var.ub)
+    return rule_dict
+
+
+@convert.register
+def convert_polyopt_varbinary(model: PolyOpt, converter: VarBinary) -> PolyOpt:
+    assert can_convert(model, converter)
+    _sub_expression(model, _replace_varbinary(model, converter))
+    return model
+
+
+@can_convert.register
+def can_convert_polyopt_varbinary(model: PolyOpt, converter: VarBinary) -> bool:
+    if converter.is_regexp:
+        return True
+    return _can_convert_int(model, converter.varname)
+
+
+# VarPracticalBinary
+
+
+@convert.register
+def convert_polyopt_varpracticalbinary(model: PolyOpt, converter: VarPracticalBinary) -> PolyOpt:
+    assert can_convert(model, converter)
+    raise NotImplementedError()
+
+
+@can_convert.register
+def can_convert_polyopt_varpracticalbinary(model: PolyOpt, converter: VarPracticalBinary) -> bool:
+    raise NotImplementedError()
+
+
+# TrivialIntToBit:
+
+
+# checks if variables can be converted according to TrivialIntToBit (lb <= y <=
+# lb+1)
+def _can_convert_trivitb_sing(model: PolyOpt, name: str) -> bool:
+    var = model.variables[name]
+    return isinstance(var, IntVar) and var.ub - var.lb == 1
+
+
+# removes matching variables from the model, returning their substitution
+# for the objective and constraints
+def _replace_trivialinttobit(model: PolyOpt, converter: TrivialIntToBit) -> Dict[int, Poly]:
+    converter.data["lb"] = dict()
+    if converter.is_regexp:
+
+        def filtering_fun(vname: str):
+            return _can_convert_trivitb_sing(model, vname)
+
+    else:
+
+        def filtering_fun(vname: str):
+            return True
+
+    var_to_replace = _matching_varnames(model, converter, filtering_fun)
+    # if not converter.is_regexp, check if we can implement it and do nothing if
+    # you cannot
+    if not converter.is_regexp:
+        if not _can_convert_trivitb_sing(model, var_to_replace[0]):
+            return dict()
+
+    rule_dict: Dict[int, Poly] = dict()
+    for vname in var_to_replace:
+        var = model.variables[vname]
+        assert isinstance(var, IntVar)  # for mypy
+        bit_var = model.bit_var(f"{vname}{INTER_STR_SEP}itb")
+        rule_dict[var.idx] = var.lb + bit_var
+
+    for vname in var_to_replace:
+        var = model._pop_var(vname)
+        assert isinstance(var, IntVar)
+        converter.data["lb"][vname] = var.lb
+    return rule_dict
+
+
+@convert.register
+def convert_polyopt_trivialinttobit(model: PolyOpt, converter: TrivialIntToBit) -> PolyOpt:
+    assert can_convert(model, converter)
+    _sub_expression(model, _replace_trivialinttobit(model, converter))
+    return model
+
+
+@can_convert.register
+def can_convert_polyopt_trivialinttobit(model: PolyOpt, converter: TrivialIntToBit) -> bool:
+    return True  # always can convert, even if does nothing
+
+
+#  BitToSpin
+
+
+# outputs expression transforming Bit to Spin. Note two expressions are
+# possible, and the reversed one is more popular in the literature
+def _get_expr_bittospin(model: PolyOpt, converter: BitToSpin, varname: str) -> Poly:
+    var = model.spin_var(f"{varname}{INTER_STR_SEP}bts")
+    if converter.reversed:
+        return (1 - var) / 2
+    else:
+        return (1 + var) / 2
+
+
+# checks if variable is binary and thus can be converted to spin
+def _can_convert_bittospin_sing(model: PolyOpt, name: str) -> bool:
+    return isinstance(model.variables[name], BitVar)
+
+
+# removes matching variables from the model, returning their substitution
+# for the objective and constraints
+def _replace_bittospin(model: PolyOpt, converter: BitToSpin) -> Dict[int, Poly]:
+    def filtering_fun(vname: str):
+        return _can_convert_bittospin_sing(model, vname)
+
+    var_to_replace = _matching_varnames(model, converter, filtering_fun)
+
+    rule_dict: Dict[int, Poly] = dict()
+    for vname in var_to_replace:
+        idx = model.variables[vname].idx
+        rule_dict[idx] = _get_expr_bittospin(model, converter, vname)
+
+    converter.data["varnames"] = set(var_to_replace)
+    for vname in var_to_replace:
+        model._pop_var(vname)
+
+    return rule_dict
+
+
+@convert.register
+def convert_polyopt_bittospin(model: PolyOpt, converter: BitToSpin) -> PolyOpt:
+    assert can_convert(model, converter)
+    _sub_expression(model, _replace_bittospin(model, converter))
+    return model
+
+
+@can_convert.register
+def can_convert_polyopt_bittospin(model: PolyOpt, converter: BitToSpin) -> bool:
+    if converter.is_regexp:
+        return True
+    return _can_convert_bittospin_sing(model, converter.varname)
+
+
+# VarReplaceBatch
+
+_VARREPLACE_RULES: Dict[type, Callable[..., Dict[int, Poly]]] = {
+    VarOneHot: _replace_varonehot,
+    VarBinary: _replace_varbinary,
+    TrivialIntToBit: _replace_trivialinttobit,
+    BitToSpin: _replace_bittospin,
+}
+
+
+@convert.register
+def convert_polyopt_varreplacebatch(model: PolyOpt, converter: VarReplaceBatch) -> PolyOpt:
+    assert can_convert(model, converter)
+    rule_dict: Dict[int, Poly] = dict()
+    for conv in converter.converters:
+        assert can_convert(model, conv)
+        rules = _VARREPLACE_RULES[type(conv)](model, conv)
+        # new variables of the previous substitutions may be replaced as well
+        rule_dict = {idx: expr.subs(rules) for idx, expr in rule_dict.items()}
+        rule_dict.update(rules)
+    _sub_expression(model, rule_dict)
+    return model
+
+
+@can_convert.register
+def can_convert_polyopt_varreplacebatch(model: PolyOpt, converter: VarReplaceBatch) -> bool:
+    return all(type(conv) in _VARREPLACE_RULES for conv in converter.converters)
+
+
+#  SpinToBit
+@convert.register
+def convert_polyopt_spintobit(model: PolyOpt, converter: SpinToBit) -> PolyOpt:
+    assert can_convert(model, converter)
+    raise NotImplementedError()
+
+
+@can_convert.register
+def can_convert_polyopt_spintobit(model: PolyOpt, converter: SpinToBit) -> bool:
+    raise NotImplementedError()
+
+
+#  ReplaceVarWithEq
+@convert.register
+def convert_polyopt_replacevarwitheq(model: PolyOpt, converter: ReplaceVarWithEq) -> PolyOpt:
+    assert can_convert(model, converter)
+    raise NotImplementedError()
+
+
+@can_convert.register
+def can_convert_polyopt_replacevarwitheq(model: PolyOpt, converter: ReplaceVarWithEq) -> bool:
+    raise NotImplementedError()
+
+
+#  IntSetValue
+@convert.register
+def convert_polyopt_intsetvalue(model: PolyOpt, converter: IntSetValue) -> PolyOpt:
+    assert can_convert(model, converter)
+    raise NotImplementedError()
+
+
+@can_convert.register
+def can_convert_polyopt_intsetvalue(model: PolyOpt, converter: IntSetValue) -> bool:
+    raise NotImplementedError()
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+from itertools import groupby
+from math import isclose
+from numbers import Number
+from typing import Any, Container, Dict, Mapping, Set, Tuple, Union
+
+Monomial = Tuple[int, ...]
+
+
+# multiplies two monomials, keeping the indices sorted
+def _mul_monomials(mono1: Monomial, mono2: Monomial) -> Monomial:
+    if not mono1:
+        return mono2
+    if not mono2:
+        return mono1
+    return tuple(sorted(mono1 + mono2))
+
+
+# approximate comparison of coefficients, consistent with the rounding used in
+# SympyOpt comparisons
+def _isclose(coeff1, coeff2) -> bool:
+    return isclose(coeff1, coeff2, rel_tol=1e-12, abs_tol=1e-12)
+
+
+class Poly:
+    """Sparse polynomial over integer-indexed variables
+
+    Polynomial is stored as a dictionary terms mapping monomials to nonzero
+    coefficients. Monomial is a sorted tuple of variable indices, in which the
+    power of a variable is encoded by repetitions, for example (0, 0, 3)
+    denotes x0**2 * x3 and () denotes the constant term. Poly supports
+    addition, subtraction, multiplication, nonnegative integer powers and
+    division by numbers. Polynomials should be treated as immutable.
+
+    :param terms: dictionary mapping monomials to coefficients, defaults to
+        zero polynomial
+    """
+
+    def __init__(self, terms: Mapping[Monomial, Any] = None) -> None:
+        self.terms: Dict[Monomial, Any] = dict()
+        if terms is not None:
+            for mono, coeff in terms.items():
+                self._iadd_term(tuple(sorted(mono)), coeff)
+
+    @staticmethod
+    def var(idx: int) -> Poly:
+        """Create the polynomial consisting of a single variable
+
+        :param idx: index of the variable
+        :return: the polynomial x_idx
+        """
+        poly = Poly()
+        poly.terms[(idx,)] = 1
+        return poly
+
+    @staticmethod
+    def _coerce(obj) -> Poly:
+        if isinstance(obj, Poly):
+            return obj
+        if isinstance(obj, Number):
+            poly = Poly()
+            if obj != 0:
+                poly.terms[()] = obj
+            return poly
+        raise TypeError(f"Cannot use {type(obj)} as a polynomial")
+
+    # adds coeff * mono to self in place, mono needs to be sorted
+    def _iadd_term(self, mono: Monomial, coeff) -> None:
+        new_coeff = self.terms.get(mono, 0) + coeff
+        if new_coeff == 0:
+            self.terms.pop(mono, None)
+        else:
+            self.terms[mono] = new_coeff
+
+    # adds scale * other to self in place. Should be used only on polynomials
+    # owned by the caller, as Poly are otherwise immutable
+    def _iadd_scaled(self, other: Poly, scale=1) -> Poly:
+        for mono, coeff in other.terms.items():
+            self._iadd_term(mono, scale * coeff)
+        return self
+
+    def copy(self) -> Poly:
+        """Return a shallow copy of the polynomial
+
+        :return: the copy
+        """
+        poly = Poly()
+        poly.terms = dict(self.terms)
+        return poly
+
+    def __add__(self, other) -> Poly:
+        if not isinstance(other, (Poly, Number)):
+            return NotImplemented
+        return self.copy()._iadd_scaled(Poly._coerce(other))
+
+    def __radd__(self, other) -> Poly:
+        return self.__add__(other)
+
+    def __sub__(self, other) -> Poly:
+        if not isinstance(other, (Poly, Number)):
+            return NotImplemented
+        return self.copy()._iadd_scaled(Poly._coerce(other), -1)
+
+    def __rsub__(self, other) -> Poly:
+        if not isinstance(other, (Poly, Number)):
+            return NotImplemented
+        return Poly._coerce(other).copy()._iadd_scaled(self, -1)
+
+    def __neg__(self) -> Poly:
+        poly = Poly()
+        poly.terms = {mono: -coeff for mono, coeff in self.terms.items()}
+        return poly
+
+    def __mul__(self, other) -> Poly:
+        if isinstance(other, Number):
+            poly = Poly()
+            if other != 0:
+                poly.terms = {mono: other * coeff for mono, coeff in self.terms.items()}
+            return poly
+        if not isinstance(other, Poly):
+            return NotImplemented
+        terms: Dict[Monomial, Any] = dict()
+        for mono1, coeff1 in self.terms.items():
+            for mono2, coeff2 in other.terms.items():
+                mono = _mul_monomials(mono1, mono2)
+                terms[mono] = terms.get(mono, 0) + coeff1 * coeff2
+        poly = Poly()
+        poly.terms = {mono: coeff for mono, coeff in terms.items() if coeff != 0}
+        return poly
+
+    def __rmul__(self, other) -> Poly:
+        return self.__mul__(other)
+
+    def __truediv__(self, other) -> Poly:
+        if not isinstance(other, Number):
+            return NotImplemented
+        return Poly({mono: coeff / other for mono, coeff in self.terms.items()})
+
+    def __pow__(self, exp: int) -> Poly:
+        assert isinstance(exp, int) and exp >= 0
+        result = Poly._coerce(1)
+        base = self
+        while exp > 0:
+            if exp % 2 == 1:
+                result = result * base
+            exp //= 2
+            if exp > 0:
+                base = base * base
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another polynomial or a number
+
+        Coefficients are compared approximately.
+        """
+        if isinstance(other, Number):
+            other = Poly._coerce(other)
+        if not isinstance(other, Poly):
+            return False
+        for mono in self.terms.keys() | other.terms.keys():
+            if not _isclose(self.terms.get(mono, 0), other.terms.get(mono, 0)):
+                return False
+        return True
+
+    # coefficients are compared approximately, thus no hash is consistent with
+    # the equality
+    __hash__ = None  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def is_number(self) -> bool:
+        """Check if the polynomial is a constant
+
+        :return: flag stating if polynomial is constant
+        """
+        return all(not mono for mono in self.terms)
+
+    def constant(self):
+        """Return the constant term of the polynomial
+
+        :return: the constant term
+        """
+        return self.terms.get((), 0)
+
+    def degree(self) -> int:
+        """Return the total degree of the polynomial
+
+        Degree of the zero polynomial is 0.
+
+        :return: the total degree
+        """
+        return max((len(mono) for mono in self.terms), default=0)
+
+    def variables(self) -> Set[int]:
+        """Return the indices of variables present in the polynomial
+
+        :return: set of indices
+        """
+        return {idx for mono in self.terms for idx in mono}
+
+    def subs(self, rule: Mapping[int, Poly]) -> Poly:
+        """Substitute polynomials for variables
+
+        All substitutions are done simultaneously in a single pass over the
+        terms. If no variable is substituted, the polynomial itself is
+        returned.
+
+        :param rule: dictionary mapping variable indices to polynomials
+        :return: polynomial after substitution
+        """
+        powers: Dict[Tuple[int, int], Poly] = dict()
+        result = Poly()
+        changed = False
+        for mono, coeff in self.terms.items():
+            if not any(idx in rule for idx in mono):
+                result._iadd_term(mono, coeff)
+                continue
+            changed = True
+            kept = []
+            term = Poly._coerce(coeff)
+            for idx, group in groupby(mono):
+                exp = len(list(group))
+                if idx in rule:
+                    if (idx, exp) not in powers:
+                        powers[(idx, exp)] = Poly._coerce(rule[idx]) ** exp
+                    term = term * powers[(idx, exp)]
+                else:
+                    kept.extend([idx] * exp)
+            if kept:
+                term = term * Poly({tuple(kept): 1})
+            result._iadd_scaled(term)
+        return result if changed else self
+
+    def _reduce_powers(self, bits: Container[int], spins: Container[int]) -> Poly:
+        # simplifies b**n = b for bits and s**(2n) = 1, s**(2n+1) = s for spins
+        poly = Poly()
+        for mono, coeff in self.terms.items():
+            new_mono = []
+            for idx, group in groupby(mono):
+                exp = len(list(group))
+                if idx in bits:
+                    new_mono.append(idx)
+                elif idx in spins:
+                    if exp % 2 == 1:
+                        new_mono.append(idx)
+                else:
+                    new_mono.extend([idx] * exp)
+            poly._iadd_term(tuple(new_mono), coeff)
+        return poly
+
+    def evaluate(self, values: Mapping[int, Any]):
+        """Evaluate the polynomial
+
+        Values can be numbers or NumPy arrays of the same shape, in which
+        case the polynomial is evaluated element-wise.
+
+        :param values: dictionary mapping variable indices to values
+        :return: the value of the polynomial
+        """
+        result = self.constant()
+        for mono, coeff in self.terms.items():
+            if not mono:
+                continue
+            term = coeff
+            for idx in mono:
+                term = term * values[idx]
+            result = result + term
+        return result
+
+    def to_str(self, names: Union[Mapping[int, str], None] = None) -> str:
+        """Return the string representation of the polynomial
+
+        :param names: dictionary mapping variable indices to names, defaults
+            to x{index}
+        :return: the string
+        """
+        if not self.terms:
+            return "0"
+        monos = []
+        for mono, coeff in self.terms.items():
+            if names is None:
+                factors = [f"x{idx}" for idx in mono]
+            else:
+                factors = [names[idx] for idx in mono]
+            monos.append("*".join([str(coeff)] + factors))
+        return " + ".join(monos)
+
+    def __str__(self) -> str:
+        return self.to_str()
+
+    def __repr__(self) -> str:
+        return f"Poly({self.terms})"
@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+from typing import Dict, Mapping, Set
+
+import omniqubo.utils.utils as utils
+from omniqubo.constraints import INEQ_GEQ_SENSE
+from omniqubo.model import MAX_SENSE, MIN_SENSE, ModelAbs
+
+from .constraints import ConstraintEq, ConstraintIneq, ConstraintPolyOpt
+from .poly import Poly
+from .vars import BitVar, IntVar, RealVar, SpinVar, VarAbsPolyOpt
+
+
+class PolyOpt(ModelAbs):
+    """Optimization modeling language based on sparse polynomials
+
+    The object consist of a dictionary of named constraint, objective function
+    which defaults to zero polynomial, sense equal to MIN_SENSE or MAX_SENSE
+    and dictionary of variables. Contrary to SympyOpt, objective and
+    constraints are stored as Poly objects, i.e. sparse maps from monomials
+    over integer variable indices into coefficients. This makes conversions
+    of large models much faster, at the price of supporting only polynomial
+    models.
+    """
+
+    def __init__(self) -> None:
+        self.constraints: Dict[str, ConstraintPolyOpt] = dict()
+        self.objective: Poly = Poly()
+        self.sense = MIN_SENSE
+        self.variables: Dict[str, VarAbsPolyOpt] = dict()
+        self._vars_by_idx: Dict[int, VarAbsPolyOpt] = dict()
+        self._bit_idxs: Set[int] = set()
+        self._spin_idxs: Set[int] = set()
+        self._next_idx = 0
+
+    # saves the objective
+    def _set_objective(self, obj: Poly) -> None:
+        obj = Poly._coerce(obj)
+        unknown_vars = [idx for idx in obj.variables() if idx not in self._vars_by_idx]
+        if unknown_vars:
+            raise ValueError(
+                f"Variables {unknown_vars} uknown. Use PolyOpt methods to define variables"
+            )
+        self.objective = obj
+
+    def minimize(self, obj: Poly) -> None:
+        """Set the function to be minimized
+
+        All variables must be already included in the model.
+
+        :param obj: minimized expression
+        :raises ValueError: if variables are not present in the model
+        """
+        self.sense = MIN_SENSE
+        self._set_objective(obj)
+
+    def maximize(self, obj: Poly) -> None:
+        """Set the function to be maximized
+
+        All variables must be already included in the model.
+
+        :param obj: maximized expression
+        :raises ValueError: if variables are not present in the model
+        """
+        self.sense = MAX_SENSE
+        self._set_objective(obj)
+
+    def add_constraint(self, constraint: ConstraintPolyOpt, name: str = None) -> None:
+        """Add constraint to the model
+
+        If name is not provided, a random string is generated. All variables
+        must be already included in the model.
+
+        :param constraint: The constraint
+        :param name: name of the constraint, defaults to random name
+        :raises ValueError: if variables are not present in the model
+        """
+        if name in self.constraints.keys():
+            raise ValueError(f"Constraint {name} already exists")
+        if name is None:
+            name = utils.gen_random_str()
+            while name in self.constraints.keys():
+                name = utils.gen_random_str()
+        unknown_vars = constraint._list_unknown_vars(self._vars_by_idx.keys())
+        if len(unknown_vars) != 0:
+            raise ValueError(
+                f"Variables {unknown_vars} uknown. Use PolyOpt methods to define variables"
+            )
+        self.constraints[name] = constraint
+
+    def list_constraints(self) -> Dict[str, ConstraintPolyOpt]:
+        """Return the dictionary of the constraints
+
+        :return: Dictionary of the constraints.
+        """
+        return self.constraints
+
+    def get_objective(self) -> Poly:
+        """Return the objective function
+
+        :return: The objective function
+        """
+        return self.objective
+
+    def get_constraint(self, name: str) -> ConstraintPolyOpt:
+        """Return the constraint of the given name
+
+        :param name: name of the constraint
+        :return: the constraint
+        """
+        return self.constraints[name]
+
+    def get_var(self, name: str) -> Poly:
+        """Return the variable of the given name
+
+        .. note::
+            a Poly object is returned, not the object of class VarAbs
+
+        :param name: name of the variable
+        :return: the variable
+        """
+        return Poly.var(self.variables[name].idx)
+
+    def get_vars(self) -> Dict[str, Poly]:
+        """Return the dictionary of variables
+
+        .. note::
+            values of the dictionary are Poly objects, not the object of class
+            VarAbs.
+
+        :return: dictionary of variables
+        """
+        return {name: Poly.var(var.idx) for name, var in self.variables.items()}
+
+    # registers a newly created variable under the next free index
+    def _add_var(self, var: VarAbsPolyOpt) -> Poly:
+        self.variables[var.name] = var
+        self._vars_by_idx[var.idx] = var
+        if isinstance(var, BitVar):
+            self._bit_idxs.add(var.idx)
+        elif isinstance(var, SpinVar):
+            self._spin_idxs.add(var.idx)
+        self._next_idx += 1
+        return Poly.var(var.idx)
+
+    # removes the variable from the model. Index of the variable is never reused
+    def _pop_var(self, name: str) -> VarAbsPolyOpt:
+        var = self.variables.pop(name)
+        self._vars_by_idx.pop(var.idx)
+        self._bit_idxs.discard(var.idx)
+        self._spin_idxs.discard(var.idx)
+        return var
+
+    def _check_new_name(self, name: str) -> None:
+        if name in self.variables.keys():
+            raise ValueError(f"Variable {name} already exists")
+
+    def int_var(self, name: str, lb: int = None, ub: int = None) -> Poly:
+        """Create and return integer variable
+
+        :param name: name of the variable
+        :param lb: minimal value, defaults to -INF
+        :param ub: maximal value, defaults to INF
+        :raises ValueError: if the name is already used
+        :return: the variable as a polynomial
+        """
+        self._check_new_name(name)
+        return self._add_var(IntVar(name, self._next_idx, lb, ub))
+
+    def real_var(self, name: str, lb: float = None, ub: float = None) -> Poly:
+        """Create and return real variable
+
+        :param name: name of the variable
+        :param lb: minimal value, defaults to -INF
+        :param ub: maximal value, defaults to INF
+        :raises ValueError: if the name is already used
+        :return: the variable as a polynomial
+        """
+        self._check_new_name(name)
+        return self._add_var(RealVar(name, self._next_idx, lb, ub))
+
+    def bit_var(self, name: str) -> Poly:
+        """Create and return binary variable
+
+        :param name: name of the variable
+        :raises ValueError: if the name is already used
+        :return: the variable as a polynomial
+        """
+        self._check_new_name(name)
+        return self._add_var(BitVar(name, self._next_idx))
+
+    def spin_var(self, name: str) -> Poly:
+        """Create and return spin variable
+
+        :param name: name of the variable
+        :raises ValueError: if the name is already used
+        :return: the variable as a polynomial
+        """
+        self._check_new_name(name)
+        return self._add_var(SpinVar(name, self._next_idx))
+
+    # dictionary from indices into names of variables present in poly
+    def _names(self, poly: Poly) -> Dict[int, str]:
+        return {idx: self._vars_by_idx[idx].name for idx in poly.variables()}
+
+    # rewrites poly of the model2 using variable indices of self. Variables
+    # are matched by names
+    def _reindex(self, poly: Poly, model2: PolyOpt) -> Poly:
+        mapping: Mapping[int, int] = {
+            idx: self.variables[name].idx for idx, name in model2._names(poly).items()
+        }
+        return Poly(
+            {tuple(mapping[idx] for idx in mono): coeff for mono, coeff in poly.terms.items()}
+        )
+
+    def __eq__(self, model2) -> bool:
+        """Check if two optimization models equal
+
+        Equality is equivalent to: same sense, approximately same objective
+        function, same constraints list, and same variables. Variables of both
+        models are matched by names, not indices.
+        """
+        if not isinstance(model2, PolyOpt):
+            return False
+        if self.sense != model2.sense:
+            return False
+        if self.variables.keys() != model2.variables.keys():
+            return False
+        for k in self.variables:
+            if not self.variables[k] == model2.variables[k]:
+                return False
+        if self.objective != self._reindex(model2.objective, model2):
+            return False
+        if self.constraints.keys() != model2.constraints.keys():
+            return False
+        for k in self.constraints:
+            c2 = model2.constraints[k]
+            left = self._reindex(c2.exprleft, model2)
+            right = self._reindex(c2.exprright, model2)
+            if isinstance(c2, ConstraintEq):
+                c2 = ConstraintEq(left, right)
+            else:
+                assert isinstance(c2, ConstraintIneq)
+                c2 = ConstraintIneq(left, right, c2.sense)
+            if not self.constraints[k] == c2:
+                return False
+        return True
+
+    def __str__(self) -> str:
+        out_string = "PolyOpt instance\n"
+        out_string += "minimize:\n" if self.sense == MIN_SENSE else "maximize\n"
+        out_string += f"   {self.objective.to_str(self._names(self.objective))}\n"
+        if self.constraints:
+            out_string += "such that:\n"
+            for name, c in self.constraints.items():
+                left = c.exprleft.to_str(self._names(c.exprleft))
+                right = c.exprright.to_str(self._names(c.exprright))
+                if isinstance(c, ConstraintIneq):
+                    sense = ">=" if c.sense == INEQ_GEQ_SENSE else "<="
+                else:
+                    sense = "=="
+                out_string += f"   {name}: {left} {sense} {right}\n"
+        if self.variables:
+            out_string += "variables:\n"
+            for name in self.variables:
+                out_string += f"   {name}: {self.variables[name]}\n"
+        return out_string
+
+    # simplifies the polynomial based on the powers of bits and spins
+    def _bitspin_simp(self, poly: Poly) -> Poly:
+        return poly._reduce_powers(self._bit_idxs, self._spin_idxs)
+
+    # checks the order of all constraints
+    def _are_constrs_poly(self, order=None) -> bool:
+        if order is None:
+            return True
+        for c in self.constraints.values():
+            for expr in [c.exprleft, c.exprright]:
+                if self._bitspin_simp(expr).degree() > order:
+                    return False
+        return True
+
+    def _are_vars_int(self) -> bool:
+        return all(isinstance(v, (BitVar, IntVar)) for v in self.variables.values())
+
+    def is_ilp(self) -> bool:
+        """Check if model is Integer Linear Program (ILP)
+
+        Model is ILP if all variables are BitVar or IntVar,
+        and objective and constraints are linear
+
+        :return: flag stating if the model is ILP
+        """
+        if not self._are_vars_int():
+            return False
+        if self._bitspin_simp(self.objective).degree() > 1:
+            return False
+        return self._are_constrs_poly(order=1)
+
+    def is_qip(self) -> bool:
+        """Check if model is Quadratic Integer Program (QIP)
+
+        Model is QIP if all variables are BitVar or IntVar,  objective is
+        quadratic polynomial, and constraints are linear.
+
+        :return: flag stating if the model is QIP
+        """
+        if not self._are_vars_int():
+            return False
+        if self._bitspin_simp(self.objective).degree() > 2:
+            return False
+        return self._are_constrs_poly(order=1)
+
+    def is_pip(self) -> bool:
+        """Check if model is Polynomial Integer Program (PIP)
+
+        Model is PIP if all variables are BitVar or IntVar. Objective and
+        constraints are always polynomials.
+
+        :return: flag stating if the model is PIP
+        """
+        return self._are_vars_int()
+
+    def is_qcqp(self) -> bool:
+        """Check if model is Quadratically Constrained Quadratic Program (QCQP)
+
+        Model is QCQP if all variables are BitVar or IntVar, objective and
+        constraints are quadratic polynomials.
+
+        :return: flag stating if the model is QCQP
+        """
+        if not self._are_vars_int():
+            return False
+        if self._bitspin_simp(self.objective).degree() > 2:
+            return False
+        return self._are_constrs_poly(order=2)
+
+    def is_bm(self) -> bool:
+        """Check if model is Binary Model (BM)
+
+        Model is BM if all variables are BitVar or SpinVar.
+
+        :return: flag stating if the model is BM
+        """
+        return len(self._bit_idxs) + len(self._spin_idxs) == len(self.variables)
+
+    def is_qubo(self) -> bool:
+        """Check if model is Quadratic Unconstrained Binary Optimization (QUBO)
+
+        Model is QUBO if all variables are BitVar, objective function is
+        quadratic polynomial and there are no constraints.
+
+        :return: flag stating if the model is QUBO
+        """
+        if len(self.list_constraints()) > 0:
+            return False
+        if len(self._bit_idxs) != len(self.variables):
+            return False
+        return self._bitspin_simp(self.objective).degree() <= 2
+
+    def is_ising(self, locality: int = None) -> bool:
+        """Check if model is an Ising Model
+
+        Model is Ising model if all variables are SpinVar, objective function
+        is a polynomial of at most locality order and there are no constraints.
+
+        :param locality: maximal locality, defaults to 2
+        :return: flag stating if the model is Ising mode with given locality
+        """
+        if locality is None:
+            locality = 2
+        assert locality > 0
+        if len(self.list_constraints()) > 0:
+            return False
+        if len(self._spin_idxs) != len(self.variables):
+            return False
+        return self._bitspin_simp(self.objective).degree() <= locality
+
+    def is_hobo(self) -> bool:
+        """Check if model is Higher Order Binary Optimization (HOBO)
+
+        Model is HOBO if all variables are BitVar and there are no
+        constraints.
+
+        :return: flag stating if the model is HOBO
+        """
+        if len(self.list_constraints()) > 0:
+            return False
+        return len(self._bit_idxs) == len(self.variables)
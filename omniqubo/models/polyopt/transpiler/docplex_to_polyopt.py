@@ -0,0 +1,123 @@
+from typing import Any, Dict
+
+from docplex.mp.basic import Expr
+from docplex.mp.constr import ComparisonType, LinearConstraint, QuadraticConstraint
+from docplex.mp.dvar import Var
+from docplex.mp.linear import ConstantExpr, LinearExpr, MonomialExpr, ZeroExpr
+from docplex.mp.model import Model
+from docplex.mp.quad import QuadExpr
+
+from omniqubo.transpiler import TranspilerAbs
+
+from ..constraints import INEQ_GEQ_SENSE, ConstraintEq, ConstraintIneq
+from ..poly import Monomial, Poly
+from ..polyopt import PolyOpt
+
+
+class DocplexToPolyopt(TranspilerAbs):
+    """Transpiler for transforming Docplex model into PolyOpt model
+
+    Transpiler can transform any quadratic program with quadratic constraints,
+    which has bit, integer, or real variables only. Coefficients are read
+    directly from docplex term dictionaries, without intermediate symbolic
+    expressions.
+    """
+
+    def _add_constraints(self, model: Model, polyopt: PolyOpt):
+        for cstr in model.iter_constraints():
+            if isinstance(cstr, (LinearConstraint, QuadraticConstraint)):
+                name = cstr.name
+                sense = cstr.sense
+                left = self._get_expr(cstr.left_expr, polyopt)
+                right = self._get_expr(cstr.right_expr, polyopt)
+                if sense == ComparisonType.EQ:
+                    polyopt.add_constraint(ConstraintEq(left, right), name=name)
+                elif sense == ComparisonType.GE:
+                    polyopt.add_constraint(ConstraintIneq(left, right, INEQ_GEQ_SENSE), name=name)
+                elif sense == ComparisonType.LE:
+                    polyopt.add_constraint(ConstraintIneq(left, right), name=name)
+                else:
+                    ValueError(f"Unknown sense {sense}")  # pragma: no cover
+            else:
+                ValueError(f"Constraint type {type(cstr)} not implemented")  # pragma: no cover
+
+    def _get_expr(self, obj: Expr, polyopt: PolyOpt) -> Poly:
+        terms: Dict[Monomial, Any] = dict()
+
+        def add_term(mono: Monomial, coeff) -> None:
+            terms[mono] = terms.get(mono, 0) + coeff
+
+        def idx(var: Var) -> int:
+            return polyopt.variables[var.name].idx
+
+        if isinstance(obj, ZeroExpr):
+            pass
+        elif isinstance(obj, ConstantExpr):
+            add_term((), obj._constant)
+        elif isinstance(obj, Var):
+            add_term((idx(obj),), 1)
+        elif isinstance(obj, MonomialExpr):
+            add_term((idx(obj._dvar),), obj._coef)
+        elif isinstance(obj, LinearExpr):
+            for var, val in obj._terms.items():
+                add_term((idx(var),), val)
+            add_term((), obj._constant)
+        elif isinstance(obj, QuadExpr):
+            for (first, sec), val in obj._quadterms.items():
+                add_term((idx(first), idx(sec)), val)
+            for var, val in obj._linexpr._terms.items():
+                add_term((idx(var),), val)
+            add_term((), obj._linexpr._constant)
+        else:
+            raise ValueError(f"Unknown objective type {type(obj)}, {obj}")  # pragma: no cover
+        return Poly(terms)
+
+    def _add_objective(self, model: Model, polyopt: PolyOpt) -> None:
+        obj = model.objective_expr
+        expr = self._get_expr(obj, polyopt)
+        if model.is_minimized():
+            polyopt.minimize(expr)
+        else:
+            polyopt.maximize(expr)
+
+    def _add_variables(self, model: Model, polyopt: PolyOpt):
+        vars = model._vars_by_name
+        for name, var in vars.items():
+            if var.cplex_typecode == "B":  # bit
+                polyopt.bit_var(name)
+            elif var.cplex_typecode == "I":  # integer
+                polyopt.int_var(name, lb=var._lb, ub=var.ub)
+            elif var.cplex_typecode == "C":  # continuous
+                polyopt.real_var(name, lb=var._lb, ub=var.ub)
+            elif var.cplex_typecode == "S":  # semi-continuous
+                raise NotImplementedError("Docplex semi-continuous types not implemented")
+            elif var.cplex_typecode == "N":  # semi-integer
+                raise NotImplementedError("Docplex semi-integer types not implemented")
+            else:
+                raise ValueError(f"Unknown cplex_typecode {var.cplex_typecode}")  # pragma: no cover
+
+    def transpile(self, model: Model) -> PolyOpt:
+        """Transpile model into PolyOpt model
+
+        :param model: model to be transpiled
+        :return: equivalent PolyOpt model
+        """
+        polyopt = PolyOpt()
+        self._add_variables(model, polyopt)
+        self._add_objective(model, polyopt)
+        self._add_constraints(model, polyopt)
+        return polyopt
+
+    def can_transpile(self, model: Model) -> bool:
+        """Check if model can be transpiled
+
+        Currently equivalent to the fact that all variables are bits, integers,
+        or real.
+
+        :type model: model to be transpiled
+        :return: flag denoting if model can be transpiled
+        """
+        for var in model._vars_by_name.values():
+            if var.cplex_typecode not in "BCI":
+                return False
+        return True
@@ -0,0 +1,88 @@
+from typing import Dict, Tuple, Union
+
+import dimod
+import numpy as np
+
+from omniqubo.model import MIN_SENSE
+from omniqubo.transpiler import TranspilerAbs
+
+from ..polyopt import PolyOpt
+from ..vars import BitVar
+
+
+class PolyOptToDimod(TranspilerAbs):
+    """Transpile PolyOpt model into Dimod object
+
+    At the moment mode can only be None, "dimod_bqm" or "dimod_cqm", first two
+    return dimod.BinaryQuadraticModel, and the last one return in
+    dimod.ConstrainedQuadraticModel. Transpiler assumes the output model is a
+    QUBO or Ising model, and it is minimization problem.
+
+    :param mode: type of the model returned by transpile
+    """
+
+    def __init__(self, mode: str = None) -> None:
+        if mode is None:
+            mode = "dimod_bqm"
+        assert mode == "dimod_bqm" or mode == "dimod_cqm"
+        self.mode = mode
+
+    # computes linear biases, quadratic biases in (row, col, bias) form and
+    # offset of the objective, where variables are indexed according to
+    # labels_idx
+    def _get_vectors(
+        self, model: PolyOpt, labels_idx: Dict[int, int]
+    ) -> Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray, np.ndarray], float]:
+        obj = model._bitspin_simp(model.objective)
+        offset = float(obj.terms.get((), 0))
+        lin_terms = [(mono[0], coeff) for mono, coeff in obj.terms.items() if len(mono) == 1]
+        quad_terms = [(mono, coeff) for mono, coeff in obj.terms.items() if len(mono) == 2]
+
+        linear = np.zeros(len(labels_idx))
+        lin_idxs = np.fromiter((labels_idx[idx] for idx, _ in lin_terms), np.int64, len(lin_terms))
+        linear[lin_idxs] = np.fromiter((c for _, c in lin_terms), float, len(lin_terms))
+
+        n_quad = len(quad_terms)
+        rows = np.fromiter((labels_idx[mono[0]] for mono, _ in quad_terms), np.int64, n_quad)
+        cols = np.fromiter((labels_idx[mono[1]] for mono, _ in quad_terms), np.int64, n_quad)
+        biases = np.fromiter((c for _, c in quad_terms), float, n_quad)
+        return linear, (rows, cols, biases), offset
+
+    # TODO update for CQM
+    def transpile(
+        self, model: PolyOpt
+    ) -> Union[dimod.BinaryQuadraticModel, dimod.ConstrainedQuadraticModel]:
+        """Transpile PolyOpt model into dimod model
+
+        The model is built with dimod.BinaryQuadraticModel.from_numpy_vectors.
+        All variables of the model are included, even if they do not appear in
+        the objective function.
+
+        :param model: model to be transpiled
+        :return: newly constructed model
+        """
+        assert self.can_transpile(model)
+        if len(model.variables) == 0:
+            vartype = dimod.BINARY
+        else:
+            var = next(iter(model.variables.values()))
+            vartype = dimod.BINARY if isinstance(var, BitVar) else dimod.SPIN
+
+        labels = list(model.variables.keys())
+        labels_idx = {var.idx: i for i, var in enumerate(model.variables.values())}
+        linear, quadratic, offset = self._get_vectors(model, labels_idx)
+        return dimod.BinaryQuadraticModel.from_numpy_vectors(
+            linear, quadratic, offset, vartype, variable_order=labels
+        )
+
+    def can_transpile(self, model: PolyOpt) -> bool:
+        """Check if PolyOpt can be transpiled
+
+        Currently equivalent to the fact that PolyOpt is minimization problem
+        and QUBO or Ising model.
+
+        :param model: checked model
+        :return: flag denoting if model can be transpiled
+        """
+        # TODO update for CQM
+        return (model.is_qubo() or model.is_ising(locality=2)) and model.sense == MIN_SENSE
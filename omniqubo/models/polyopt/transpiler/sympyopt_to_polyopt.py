@@ -0,0 +1,124 @@
+from typing import Any, Dict, List
+
+from sympy import Add, Expr, Integer, Mul, Pow, Symbol, expand
+
+from omniqubo.model import MIN_SENSE
+from omniqubo.models.sympyopt.constraints import ConstraintEq as ConstraintEqSympyOpt
+from omniqubo.models.sympyopt.constraints import ConstraintIneq as ConstraintIneqSympyOpt
+from omniqubo.models.sympyopt.constraints import LinearConstraints
+from omniqubo.models.sympyopt.sympyopt import SympyOpt
+from omniqubo.models.sympyopt.vars import BitVar, IntVar, RealVar, SpinVar
+from omniqubo.transpiler import TranspilerAbs
+
+from ..constraints import ConstraintEq, ConstraintIneq
+from ..poly import Monomial, Poly
+from ..polyopt import PolyOpt
+
+
+# converts sympy number into int if possible, and float otherwise
+def _get_coeff(number: Expr):
+    if isinstance(number, Integer):
+        return int(number)
+    return float(number)
+
+
+class SympyOptToPolyopt(TranspilerAbs):
+    """Transpiler for transforming SympyOpt model into PolyOpt model
+
+    Transpiler can transform SympyOpt models which objective function and
+    constraints are polynomials.
+    """
+
+    def _get_expr(self, expr: Expr, polyopt: PolyOpt) -> Poly:
+        terms: Dict[Monomial, Any] = dict()
+        for term in Add.make_args(expand(expr)):
+            coeff, factors = term.as_coeff_Mul()
+            mono: List[int] = []
+            for factor in Mul.make_args(factors):
+                if factor.is_number:
+                    continue
+                elif isinstance(factor, Symbol):
+                    mono.append(polyopt.variables[factor.name].idx)
+                elif (
+                    isinstance(factor, Pow)
+                    and isinstance(factor.base, Symbol)
+                    and isinstance(factor.exp, Integer)
+                    and factor.exp > 0
+                ):
+                    mono.extend([polyopt.variables[factor.base.name].idx] * int(factor.exp))
+                else:
+                    raise ValueError(f"Expression {expr} is not a polynomial")
+            key = tuple(sorted(mono))
+            terms[key] = terms.get(key, 0) + _get_coeff(coeff)
+        return Poly(terms)
+
+    def _add_variables(self, model: SympyOpt, polyopt: PolyOpt) -> None:
+        for name, var in model.variables.items():
+            if isinstance(var, BitVar):
+                polyopt.bit_var(name)
+            elif isinstance(var, SpinVar):
+                polyopt.spin_var(name)
+            elif isinstance(var, IntVar):
+                polyopt.int_var(name, lb=var.lb, ub=var.ub)
+            elif isinstance(var, RealVar):
+                polyopt.real_var(name, lb=var.lb, ub=var.ub)
+            else:
+                raise ValueError(f"Unknown variable type {type(var)}")  # pragma: no cover
+
+    def _add_constraints(self, model: SympyOpt, polyopt: PolyOpt) -> None:
+        constraints: Dict[str, Any] = dict()
+        for name, c in model.constraints.items():
+            if isinstance(c, LinearConstraints):
+                constraints.update(c.to_constraints())
+            else:
+                constraints[name] = c
+        for name, c in constraints.items():
+            if isinstance(c, ConstraintEqSympyOpt):
+                left = self._get_expr(c.exprleft, polyopt)
+                right = self._get_expr(c.exprright, polyopt)
+                c_new: Any = ConstraintEq(left, right)
+            elif isinstance(c, ConstraintIneqSympyOpt):
+                left = self._get_expr(c.exprleft, polyopt)
+                right = self._get_expr(c.exprright, polyopt)
+                c_new = ConstraintIneq(left, right, c.sense)
+            else:
+                raise ValueError(f"Constraint type {type(c)} not implemented")  # pragma: no cover
+            c_new.check_interpret = c.check_interpret
+            polyopt.add_constraint(c_new, name=name)
+
+    def transpile(self, model: SympyOpt) -> PolyOpt:
+        """Transpile SympyOpt model into PolyOpt model
+
+        :param model: model to be transpiled
+        :raises ValueError: if objective or constraints are not polynomials
+        :return: equivalent PolyOpt model
+        """
+        polyopt = PolyOpt()
+        self._add_variables(model, polyopt)
+        obj = self._get_expr(model.objective, polyopt)
+        if model.sense == MIN_SENSE:
+            polyopt.minimize(obj)
+        else:
+            polyopt.maximize(obj)
+        self._add_constraints(model, polyopt)
+        return polyopt
+
+    def can_transpile(self, model: SympyOpt) -> bool:
+        """Check if model can be transpiled
+
+        Model can be transpiled if objective function and constraints are
+        polynomials.
+
+        :type model: model to be transpiled
+        :return: flag denoting if model can be transpiled
+        """
+        if not model.objective.is_polynomial():
+            return False
+        for c in model.constraints.values():
+            if isinstance(c, LinearConstraints):
+                continue
+            if not isinstance(c, (ConstraintEqSympyOpt, ConstraintIneqSympyOpt)):
+                return False
+            if not c.exprleft.is_polynomial() or not c.exprright.is_polynomial():
+                return False
+        return True
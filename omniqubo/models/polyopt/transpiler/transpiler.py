@@ -0,0 +1,35 @@
+from copy import deepcopy
+
+from omniqubo.models.sympyopt.sympyopt import SympyOpt
+from omniqubo.transpiler import _get_lazy_transpiler
+
+from ..polyopt import PolyOpt
+from .sympyopt_to_polyopt import SympyOptToPolyopt
+
+# transpilers are imported only if the model of given type is transpiled, so
+# that importing omniqubo does not import all the modelling frameworks
+_TRANSPILERS = [
+    ("docplex.mp.model", "Model", ".docplex_to_polyopt", "DocplexToPolyopt"),
+]
+
+
+def transpile(model) -> PolyOpt:
+    """Transpile optimization problem into PolyOpt model
+
+    Only accepts PolyOpt, SympyOpt or Docplex model. Docplex is imported
+    only when its model is passed.
+
+    :param model: model to be transpiled
+    :raises ValueError: if the argument is of inappropriate type
+    :return: transpiled model
+    """
+    if isinstance(model, PolyOpt):
+        return deepcopy(model)
+    elif isinstance(model, SympyOpt):
+        return SympyOptToPolyopt().transpile(model)
+    transpiler = _get_lazy_transpiler(model, _TRANSPILERS, __package__)
+    if transpiler is None:
+        raise ValueError(f"Unknown model type: {type(model)}")
+    polyopt = transpiler.transpile(model)
+    assert isinstance(polyopt, PolyOpt)
+    return polyopt
@@ -0,0 +1,176 @@
+from sympy.core.evalf import INF
+
+from omniqubo.vars import VarAbs
+
+
+class VarAbsPolyOpt(VarAbs):
+    """Abstract class for PolyOpt variables
+
+    Apart from the name, each variable has a unique integer index used in the
+    monomials of polynomials.
+
+    :param name: name of the variable
+    :param idx: index of the variable
+    """
+
+    __slots__ = ("idx",)
+
+    def __init__(self, name: str, idx: int) -> None:
+        self.idx = idx
+        super().__init__(name)
+
+
+class IntVar(VarAbsPolyOpt):
+    """Integer variable for PolyOpt
+
+    If lb or ub are not specified, they are set to -INF or INF respectively.
+    lb must be strictly smaller than ub.
+
+    :param name: name of the variable
+    :param idx: index of the variable
+    :param lb: minimal value, defaults to None
+    :param ub: maximal value, defaults to None
+    """
+
+    __slots__ = ("lb", "ub")
+
+    def __init__(self, name: str, idx: int, lb: int = None, ub: int = None) -> None:
+        if lb is None:
+            lb = -INF
+        if ub is None:
+            ub = INF
+        assert lb < ub
+        self.lb = lb
+        self.ub = ub
+        super().__init__(name, idx)
+
+    def __eq__(self, o: object) -> bool:
+        """Compare with another IntVar instance
+
+        Variables equal if they have the same name, lb and ub.
+        """
+        if not isinstance(o, IntVar):
+            return False
+        return self.name == o.name and self.lb == o.lb and self.ub == o.ub
+
+    def __str__(self) -> str:
+        return f"Integer {self.lb} <= {self.name} <= {self.ub}"
+
+    def get_lb(self) -> int:
+        """Outputs the lower bound of the variable"""
+        return self.lb
+
+    def get_ub(self) -> int:
+        """Outputs the upper bound of the variable"""
+        return self.ub
+
+
+class RealVar(VarAbsPolyOpt):
+    """Real variable for PolyOpt
+
+    If lb or ub are not specified, they are set to -INF or INF respectively.
+    lb must be strictly smaller than ub.
+
+    :param name: name of the variable
+    :param idx: index of the variable
+    :param lb: minimal value, defaults to None
+    :param ub: maximal value, defaults to None
+    """
+
+    __slots__ = ("lb", "ub")
+
+    def __init__(self, name: str, idx: int, lb: float = None, ub: float = None) -> None:
+        if lb is None:
+            lb = -INF
+        if ub is None:
+            ub = INF
+        assert lb < ub
+        self.lb = lb
+        self.ub = ub
+        super().__init__(name, idx)
+
+    def __eq__(self, o: object) -> bool:
+        """Compare with another RealVar instance
+
+        Variables equal if they have the same name, lb and ub.
+        """
+        if not isinstance(o, RealVar):
+            return False
+        return self.name == o.name and self.lb == o.lb and self.ub == o.ub
+
+    def __str__(self) -> str:
+        return f"Real {self.lb} <= {self.name} <= {self.ub}"
+
+    def get_lb(self) -> float:
+        """Outputs the lower bound of the variable"""
+        return self.lb
+
+    def get_ub(self) -> float:
+        """Outputs the upper bound of the variable"""
+        return self.ub
+
+
+class BitVar(VarAbsPolyOpt):
+    """Binary variable for PolyOpt
+
+    :param name: name of the variable
+    :param idx: index of the variable
+    """
+
+    __slots__ = ()
+
+    def __init__(self, name: str, idx: int) -> None:
+        super().__init__(name, idx)
+
+    def __eq__(self, o: object) -> bool:
+        """Compare with another BitVar instance
+
+        Variables equal if they have the same name.
+        """
+        if not isinstance(o, BitVar):
+            return False
+        return self.name == o.name
+
+    def __str__(self) -> str:
+        return f"Bit {self.name}"
+
+    def get_lb(self) -> int:
+        """Outputs the lower bound of the variable (always 0)"""
+        return 0
+
+    def get_ub(self) -> int:
+        """Outputs the upper bound of the variable (always 1)"""
+        return 1
+
+
+class SpinVar(VarAbsPolyOpt):
+    """Spin variable for PolyOpt
+
+    :param name: name of the variable
+    :param idx: index of the variable
+    """
+
+    __slots__ = ()
+
+    def __init__(self, name: str, idx: int) -> None:
+        super().__init__(name, idx)
+
+    def __eq__(self, o: object) -> bool:
+        """Compare with another SpinVar instance
+
+        Variables equal if they have the same name.
+        """
+        if not isinstance(o, SpinVar):
+            return False
+        return self.name == o.name
+
+    def __str__(self) -> str:
+        return f"Spin {self.name}"
+
+    def get_lb(self) -> int:
+        """Outputs the lower bound of the variable (always -1)"""
+        return -1
+
+    def get_ub(self) -> int:
+        """Outputs the upper bound of the variable (always 1)"""
+        return 1
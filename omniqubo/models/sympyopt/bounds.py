@@ -0,0 +1,178 @@
+from fractions import Fraction
+from math import isinf
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sympy import Add, Expr, Integer, Mul, Number, Pow, Rational, Symbol
+
+from .sympyopt import SympyOpt
+from .vars import BIT_VTYPE, SPIN_VTYPE
+
+# bounds are exact integers or fractions, floats are used only for infinities
+Bound = Union[int, Fraction, float]
+
+
+# converts number into exact integer or fraction. Floats are converted via
+# their shortest representation, so that 0.1 becomes 1/10
+def _exact(value: Union[int, float, Number]) -> Bound:
+    if isinstance(value, Integer):
+        return int(value)
+    if isinstance(value, Rational):
+        return Fraction(int(value.p), int(value.q))
+    if isinstance(value, Number):
+        value = float(value)
+    if isinstance(value, float):
+        if isinf(value):
+            return value
+        return Fraction(repr(value))
+    return value
+
+
+# product of bounds with convention 0 * inf = 0
+def _mul(a: Bound, b: Bound) -> Bound:
+    if a == 0 or b == 0:
+        return 0
+    return a * b
+
+
+# bounds of the product of two independent intervals
+def _interval_mul(a: Tuple[Bound, Bound], b: Tuple[Bound, Bound]) -> Tuple[Bound, Bound]:
+    products = [_mul(x, y) for x in a for y in b]
+    return min(products), max(products)
+
+
+# bounds of the integer power of an interval
+def _interval_pow(lb: Bound, ub: Bound, exp: int) -> Tuple[Bound, Bound]:
+    low, high = pow(lb, exp), pow(ub, exp)
+    if exp % 2 == 1 or lb >= 0:
+        return low, high
+    if ub <= 0:
+        return high, low
+    return 0, max(low, high)
+
+
+class ExprBounds:
+    """Interval bounds of polynomial expressions over the variables of SympyOpt
+
+    Lower and upper bounds are computed together in a single pass over the
+    expression, using the bounds of the variables of the model and exact
+    integer/rational arithmetic. Bounds of each subexpression are memoized,
+    thus shared subexpressions are bounded only once. The bounds are tight
+    for linear expressions. Powers of bits and spins are bounded using
+    b^n = b and s^(2n) = 1.
+
+    Bounds are valid as long as the bounds of the variables are not changed,
+    thus the object should be created for each conversion.
+
+    :param model: model providing the bounds of the variables
+    """
+
+    def __init__(self, model: SympyOpt) -> None:
+        self.model = model
+        self._cache: Dict[Expr, Tuple[Bound, Bound]] = dict()
+
+    def __call__(self, expr: Expr) -> Tuple[Bound, Bound]:
+        """Compute lower and upper bound of the expression
+
+        :param expr: polynomial expression over the variables of the model
+        :raises ValueError: if expr is not a polynomial over the variables of
+            the model
+        :return: the lower and the upper bound
+        """
+        bounds = self._cache.get(expr)
+        if bounds is None:
+            bounds = self._bounds(expr)
+            self._cache[expr] = bounds
+        return bounds
+
+    def get_lb(self, expr: Expr) -> Bound:
+        """Compute lower bound of the expression
+
+        :param expr: polynomial expression over the variables of the model
+        :return: the lower bound
+        """
+        return self(expr)[0]
+
+    def get_ub(self, expr: Expr) -> Bound:
+        """Compute upper bound of the expression
+
+        :param expr: polynomial expression over the variables of the model
+        :return: the upper bound
+        """
+        return self(expr)[1]
+
+    def linear_bounds(
+        self, rows: Sequence[Tuple[Dict[Symbol, float], float]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute bounds of many linear expressions at once
+
+        Each linear expression is given as a pair of a dictionary mapping the
+        variables into their coefficients and the offset. The expressions are
+        stored as rows of a sparse matrix with columns indexed by the ids of
+        the variables, so that all bounds are computed with a few sparse
+        matrix-vector products with the bounds of the variables, in floating
+        point arithmetic.
+
+        :param rows: coefficients and offsets of the linear expressions
+        :return: arrays of the lower and the upper bounds
+        """
+        variables = self.model.variables
+        row_ids: List[int] = []
+        col_ids: List[int] = []
+        data: List[float] = []
+        for row, (coeffs, _) in enumerate(rows):
+            for sym, coeff in coeffs.items():
+                if coeff != 0:
+                    row_ids.append(row)
+                    col_ids.append(variables.get_id(sym.name))
+                    data.append(coeff)
+        var_lb, var_ub = variables.lbs, variables.ubs
+        offsets = np.array([offset for _, offset in rows], dtype=float)
+
+        # positive and negative parts are stored separately, so that zero
+        # coefficients are never multiplied by infinite bounds
+        data_arr = np.array(data, dtype=float)
+        row_arr, col_arr = np.array(row_ids, dtype=int), np.array(col_ids, dtype=int)
+        shape = (len(rows), len(var_lb))
+        pos, neg = data_arr > 0, data_arr < 0
+        mat_pos = csr_matrix((data_arr[pos], (row_arr[pos], col_arr[pos])), shape=shape)
+        mat_neg = csr_matrix((data_arr[neg], (row_arr[neg], col_arr[neg])), shape=shape)
+        lb = mat_pos.dot(var_lb) + mat_neg.dot(var_ub) + offsets
+        ub = mat_pos.dot(var_ub) + mat_neg.dot(var_lb) + offsets
+        return lb, ub
+
+    def _bounds(self, expr: Expr) -> Tuple[Bound, Bound]:
+        if isinstance(expr, Symbol):
+            if expr.name not in self.model.variables:
+                raise ValueError(f"Symbol {expr} is not a variable of the model")
+            var = self.model.variables[expr.name]
+            return _exact(var.get_lb()), _exact(var.get_ub())
+        elif isinstance(expr, Number):
+            value = _exact(expr)
+            return value, value
+        elif isinstance(expr, Add):
+            lb: Bound = 0
+            ub: Bound = 0
+            for arg in expr.args:
+                arg_lb, arg_ub = self(arg)
+                lb += arg_lb
+                ub += arg_ub
+            return lb, ub
+        elif isinstance(expr, Mul):
+            bounds: Tuple[Bound, Bound] = (1, 1)
+            for arg in expr.args:
+                bounds = _interval_mul(bounds, self(arg))
+            return bounds
+        elif isinstance(expr, Pow):
+            if not (isinstance(expr.exp, Integer) and expr.exp > 0):
+                raise ValueError(f"Power {expr} cannot be handled")
+            exp = int(expr.exp)
+            if isinstance(expr.base, Symbol) and expr.base.name in self.model.variables:
+                vtype = self.model.variables.get_vtype(expr.base.name)
+                if vtype == BIT_VTYPE:
+                    return 0, 1
+                if vtype == SPIN_VTYPE:
+                    return (1, 1) if exp % 2 == 0 else (-1, 1)
+            return _interval_pow(*self(expr.base), exp)
+        raise ValueError(f"Algebraic expression {type(expr)} cannot be handled")
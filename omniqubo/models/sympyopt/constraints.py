@@ -1,10 +1,11 @@
-from copy import deepcopy
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, List, Sequence, Union
 
-from sympy import Expr, Float, S, preorder_traversal
+import numpy as np
+from scipy.sparse import csr_matrix
+from sympy import Add, Expr, Float, S, Symbol, preorder_traversal
 from sympy.core.function import expand
 
-from omniqubo.constraints import ConstraintAbs
+from omniqubo.constraints import INEQ_GEQ_SENSE, INEQ_LEQ_SENSE, ConstraintAbs
 
 from .utils import _approx_sympy_expr
 from .vars import VarAbs
@@ -16,6 +17,8 @@ def _list_unknown_vars(obj: Expr, vars: Iterable[str]) -> Iterable:
 
 
 class ConstraintSympyopt(ConstraintAbs):
+    __slots__ = ("exprleft", "exprright")
+
     def __init__(self) -> None:
         super().__init__()
         pass
@@ -30,14 +33,17 @@ class ConstraintEq(ConstraintSympyopt):
     :param exprright: The right expression of the equality
     """
 
+    __slots__ = ()
+
     def __init__(self, exprleft: Expr, exprright: Expr) -> None:
         if not isinstance(exprleft, Expr):
             exprleft = S(exprleft)
         if not isinstance(exprright, Expr):
             exprright = S(exprright)
 
-        self.exprleft = deepcopy(exprleft)
-        self.exprright = deepcopy(exprright)
+        # sympy expressions are immutable, so they can be shared between constraints
+        self.exprleft = exprleft
+        self.exprright = exprright
         super().__init__()
 
     def is_eq_constraint(self) -> bool:
@@ -91,10 +97,6 @@ class ConstraintEq(ConstraintSympyopt):
         return list(lvars_uknown) + list(rvars_uknown)
 
 
-INEQ_LEQ_SENSE = "leq"
-INEQ_GEQ_SENSE = "geq"
-
-
 class ConstraintIneq(ConstraintSympyopt):
     """Inequality constraint for SympyOpt
 
@@ -106,6 +108,8 @@ class ConstraintIneq(ConstraintSympyopt):
     :param sense: the sense of the inequality
     """
 
+    __slots__ = ("sense",)
+
     def __init__(self, exprleft: Expr, exprright: Expr, sense: str = None) -> None:
         if not isinstance(exprleft, Expr):
             exprleft = S(exprleft)
@@ -114,8 +118,8 @@ class ConstraintIneq(ConstraintSympyopt):
         if sense is None:
             sense = INEQ_LEQ_SENSE
 
-        self.exprleft = deepcopy(exprleft)
-        self.exprright = deepcopy(exprright)
+        self.exprleft = exprleft
+        self.exprright = exprright
         if sense != INEQ_GEQ_SENSE and sense != INEQ_LEQ_SENSE:
             raise ValueError(f"incorrect sense {sense}")
         self.sense = sense
@@ -170,3 +174,159 @@ class ConstraintIneq(ConstraintSympyopt):
         lvars_uknown = _list_unknown_vars(self.exprleft, vars)
         rvars_uknown = _list_unknown_vars(self.exprleft, vars)
         return list(lvars_uknown) + list(rvars_uknown)
+
+
+# sense of equality rows of LinearConstraints
+EQ_SENSE = "eq"
+_SENSES = (EQ_SENSE, INEQ_LEQ_SENSE, INEQ_GEQ_SENSE)
+
+
+# converts float into int if it is integral, so that expressions stay exact
+def _get_number(value: float) -> Expr:
+    return S(int(value)) if value.is_integer() else S(value)
+
+
+class LinearConstraints(ConstraintAbs):
+    """Block of linear constraints for SympyOpt
+
+    Stores the rows of A x (sense) b in columnar form: a sparse matrix of
+    coefficients A, the names of the variables of its columns, and arrays
+    of senses, right-hand sides and names of the rows. Senses are EQ_SENSE,
+    INEQ_LEQ_SENSE or INEQ_GEQ_SENSE. This way constraint systems with many
+    rows are stored without creating Sympy expressions. Like other
+    constraints, blocks are not modified in place; new blocks are created
+    instead.
+
+    :param matrix: matrix of the coefficients, anything accepted by
+        scipy.sparse.csr_matrix
+    :param varnames: names of the variables of the columns
+    :param senses: senses of the rows, or a single sense for all rows
+    :param rhs: right-hand sides of the rows, or a single value for all rows
+    :param names: names of the rows
+    :param checks: flags for checking the rows in interpretation, or a single
+        flag for all rows, defaults to checking all rows
+    """
+
+    __slots__ = ("matrix", "varnames", "senses", "rhs", "names", "checks")
+
+    def __init__(
+        self,
+        matrix: Any,
+        varnames: Sequence[str],
+        senses: Union[str, Sequence[str], np.ndarray],
+        rhs: Union[float, Sequence[float], np.ndarray],
+        names: Sequence[str],
+        checks: Union[bool, Sequence[bool], np.ndarray] = None,
+    ) -> None:
+        self.matrix = csr_matrix(matrix, dtype=float)
+        self.matrix.eliminate_zeros()
+        self.varnames = list(varnames)
+        rows_no = self.matrix.shape[0]
+        self.senses = np.broadcast_to(np.asarray(senses, dtype=object), (rows_no,)).copy()
+        self.rhs = np.broadcast_to(np.asarray(rhs, dtype=float), (rows_no,)).copy()
+        self.names = list(names)
+        if checks is None:
+            checks = True
+        self.checks = np.broadcast_to(np.asarray(checks, dtype=bool), (rows_no,)).copy()
+        if len(set(self.varnames)) != len(self.varnames):
+            raise ValueError("Variables of the columns are repeated")
+        if self.matrix.shape[1] != len(self.varnames):
+            raise ValueError("Number of columns differs from the number of variables")
+        if len(self.names) != rows_no:
+            raise ValueError("Number of rows differs from the number of names")
+        unknown_senses = set(self.senses) - set(_SENSES)
+        if unknown_senses:
+            raise ValueError(f"incorrect senses {unknown_senses}")
+        super().__init__()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def is_eq_constraint(self) -> bool:
+        """Check if all rows of the block are equalities
+
+        :return: the flag
+        """
+        return bool((self.senses == EQ_SENSE).all())
+
+    def is_ineq_constraint(self) -> bool:
+        """Check if all rows of the block are inequalities
+
+        :return: the flag
+        """
+        return bool((self.senses != EQ_SENSE).all())
+
+    def select(self, mask: np.ndarray) -> "LinearConstraints":
+        """Return the block of the selected rows
+
+        :param mask: boolean array, True for selected rows
+        :return: new block
+        """
+        return LinearConstraints(
+            self.matrix[mask],
+            self.varnames,
+            self.senses[mask],
+            self.rhs[mask],
+            [name for name, flag in zip(self.names, mask.tolist()) if flag],
+            self.checks[mask],
+        )
+
+    def to_constraints(self) -> Dict[str, Union[ConstraintEq, ConstraintIneq]]:
+        """Return the rows as Sympy constraints
+
+        :return: dictionary mapping names of the rows into constraints
+        """
+        symbols = [Symbol(name) for name in self.varnames]
+        matrix = self.matrix
+        constraints: Dict[str, Union[ConstraintEq, ConstraintIneq]] = dict()
+        for i, name in enumerate(self.names):
+            start, end = matrix.indptr[i], matrix.indptr[i + 1]
+            expr = Add(
+                *(
+                    _get_number(coeff) * symbols[col]
+                    for col, coeff in zip(
+                        matrix.indices[start:end].tolist(), matrix.data[start:end].tolist()
+                    )
+                )
+            )
+            rhs = _get_number(float(self.rhs[i]))
+            if self.senses[i] == EQ_SENSE:
+                c: Union[ConstraintEq, ConstraintIneq] = ConstraintEq(expr, rhs)
+            else:
+                c = ConstraintIneq(expr, rhs, self.senses[i])
+            c.check_interpret = bool(self.checks[i])
+            constraints[name] = c
+        return constraints
+
+    def __eq__(self, sec: object) -> bool:
+        """Compares two blocks of linear constraints
+
+        Blocks are equal if they have the same rows, the same senses and the
+        same coefficients of the variables, up to the order of the columns.
+        """
+        if not isinstance(sec, LinearConstraints):
+            return False
+        if self.names != sec.names or list(self.senses) != list(sec.senses):
+            return False
+        if not np.allclose(self.rhs, sec.rhs):
+            return False
+        varnames = sorted(set(self.varnames) | set(sec.varnames))
+        diff = self._reordered(varnames) - sec._reordered(varnames)
+        return diff.nnz == 0 or np.allclose(diff.data, 0)
+
+    # matrix with columns ordered as varnames
+    def _reordered(self, varnames: List[str]) -> csr_matrix:
+        cols = {name: i for i, name in enumerate(varnames)}
+        coo = self.matrix.tocoo()
+        new_cols = np.array([cols[name] for name in self.varnames], dtype=np.int64)
+        return csr_matrix(
+            (coo.data, (coo.row, new_cols[coo.col])), shape=(len(self), len(varnames))
+        )
+
+    def __str__(self) -> str:
+        return f"Linear constraints block of {len(self)} rows and {len(self.varnames)} variables"
+
+    # outputs list of variables which are not in vars
+    # important for verification if all variables are in the model
+    def _list_unknown_vars(self, vars: Iterable[str]) -> List:
+        return [name for name in self.varnames if name not in vars]
@@ -1,14 +1,17 @@
 import re
-from math import ceil, prod
-from typing import Callable, Dict, List, Union
+from copy import copy
+from math import ceil, floor, isinf
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
-from pandas import DataFrame
-from sympy import Add, Expr, Integer, Mul, Number, Pow, Symbol, expand, lambdify
+import numpy as np
+from scipy.sparse import csr_matrix, hstack
+from sympy import Add, Expr, Integer, Mul, Pow, S, Symbol, expand, lambdify
 from sympy.core.evalf import INF
 
 from omniqubo.converters.converter import can_convert, convert
 from omniqubo.converters.eq_to_objective import EqToObj
 from omniqubo.converters.ineq_to_eq import IneqToEq
+from omniqubo.converters.presolve import Presolve
 from omniqubo.converters.quadratize import QuadratizePyqubo
 from omniqubo.converters.simple_manipulation import (
     MakeMax,
@@ -29,31 +32,282 @@ from omniqubo.converters.varreplace import (
     VarOneHot,
     VarPracticalBinary,
     VarReplace,
+    VarReplaceBatch,
     _binary_encoding_coeff,
 )
-from omniqubo.models.sympyopt.constraints import INEQ_GEQ_SENSE, ConstraintEq, ConstraintIneq
-from omniqubo.models.sympyopt.vars import BitVar, IntVar
+from omniqubo.converters.verifier import EQ_CTYPE, GEQ_CTYPE, LEQ_CTYPE, ConstraintsVerifier
+from omniqubo.models.sympyopt.constraints import (
+    EQ_SENSE,
+    INEQ_GEQ_SENSE,
+    INEQ_LEQ_SENSE,
+    ConstraintEq,
+    ConstraintIneq,
+    LinearConstraints,
+    _get_number,
+)
+from omniqubo.models.sympyopt.vars import BIT_VTYPE, SPIN_VTYPE, BitVar, IntVar, SpinVar
 
+from .bounds import Bound, ExprBounds
 from .sympyopt import MAX_SENSE, MIN_SENSE, SympyOpt
 
 # for explanation of how each convert and can_convert works, see documentation
 # of appropriate converter class
 
 
-# transforms sympy-based constraint a ==/<=/>= b into a function computing a - b
-# https://stackoverflow.com/questions/64475745/how-to-express-dataframe-operations-using-symbols
-def _eq_to_verifier(c: Union[ConstraintEq, ConstraintIneq]):
-    def verifier(df: DataFrame):
-        expr = c.exprleft - c.exprright
-        callable_obj = lambdify(list(expr.free_symbols), expr)
-        return callable_obj(**{str(a): df[str(a)] for a in expr.atoms() if isinstance(a, Symbol)})
+# NumPy-vectorized function computing the value of sympy expression. The
+# expression is compiled once, and recompiled after unpickling, as lambdified
+# functions cannot be pickled
+class _SympyFunction:
+    def __init__(self, expr: Expr) -> None:
+        self.expr = expr
+        self.varnames = sorted(a.name for a in expr.free_symbols)
+        self._compile()
+
+    def _compile(self) -> None:
+        self._fun = lambdify([Symbol(name) for name in self.varnames], self.expr, "numpy")
+
+    def __call__(self, values: Dict[str, np.ndarray]) -> np.ndarray:
+        return self._fun(*[values[name] for name in self.varnames])
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_fun"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._compile()
+
+
+# returns coefficients of the variables of linear expression and its offset,
+# or None if expr is not linear. Coefficients are kept as Sympy numbers, so
+# that exact models stay exact
+def _linear_terms(expr: Expr) -> Optional[Tuple[Dict[Symbol, Expr], Expr]]:
+    coeffs: Dict[Symbol, Expr] = dict()
+    offset = S.Zero
+    for term in Add.make_args(expand(expr)):
+        coeff, factor = term.as_coeff_Mul()
+        if factor.is_number:
+            offset += term
+        elif isinstance(factor, Symbol):
+            coeffs[factor] = coeffs.get(factor, S.Zero) + coeff
+        else:
+            return None
+    return coeffs, offset
+
+
+# as _linear_terms, but with float coefficients for computations in NumPy
+def _float_linear_terms(expr: Expr) -> Optional[Tuple[Dict[Symbol, float], float]]:
+    linear = _linear_terms(expr)
+    if linear is None:
+        return None
+    coeffs, offset = linear
+    return {sym: float(coeff) for sym, coeff in coeffs.items()}, float(offset)
+
+
+# adds constraint expr ==/<=/>= 0 into the verifier. Linear expressions are
+# stored as sparse rows, others are compiled into NumPy functions
+def _add_to_verifier(verifier: ConstraintsVerifier, expr: Expr, ctype: str) -> None:
+    linear = _linear_terms(expr)
+    if linear is None:
+        fun = _SympyFunction(expr)
+        verifier.add_nonlinear(fun, fun.varnames, ctype)
+        return
+    coeffs, offset = linear
+    verifier.add_linear({sym.name: coeff for sym, coeff in coeffs.items()}, offset, ctype)
+
+
+# LinearConstraints
+
+_SENSE_CTYPES = {EQ_SENSE: EQ_CTYPE, INEQ_LEQ_SENSE: LEQ_CTYPE, INEQ_GEQ_SENSE: GEQ_CTYPE}
+
+
+# returns the blocks of linear constraints with rows matching the name,
+# mapped into the boolean masks of the matching rows
+def _matching_block_rows(model: SympyOpt, name: str, is_regexp: bool) -> Dict[str, np.ndarray]:
+    if is_regexp:
+        _rex = re.compile(name)
+    masks: Dict[str, np.ndarray] = dict()
+    for bname, c in model.constraints.items():
+        if isinstance(c, LinearConstraints):
+            if is_regexp:
+                matches = (_rex.fullmatch(row) is not None for row in c.names)
+            else:
+                matches = (row == name for row in c.names)
+            mask = np.fromiter(matches, dtype=bool, count=len(c))
+            if mask.any():
+                masks[bname] = mask
+    return masks
+
+
+# checks if the model has rows of the given name in the blocks, and all of
+# them are equalities (eq=True) or inequalities (eq=False)
+def _has_block_row(model: SympyOpt, name: str, eq: bool) -> bool:
+    senses: List[np.ndarray] = []
+    for bname, mask in _matching_block_rows(model, name, False).items():
+        block = model.constraints[bname]
+        assert isinstance(block, LinearConstraints)
+        senses.append(block.senses[mask])
+    if not senses:
+        return False
+    is_eq = np.concatenate(senses) == EQ_SENSE
+    return bool(is_eq.all() if eq else (~is_eq).all())
+
 
-    return verifier
+# removes the rows in mask from the block, and the block if it becomes empty
+def _remove_block_rows(model: SympyOpt, bname: str, mask: np.ndarray) -> None:
+    block = model.constraints[bname]
+    assert isinstance(block, LinearConstraints)
+    if mask.all():
+        del model.constraints[bname]
+    else:
+        model.constraints[bname] = block.select(~mask)
+
+
+# adds the rows of the block into the verifier
+def _add_block_to_verifier(verifier: ConstraintsVerifier, block: LinearConstraints) -> None:
+    ctypes = [_SENSE_CTYPES[sense] for sense in block.senses]
+    verifier.add_linear_block(block.matrix, block.varnames, -block.rhs, ctypes)
+
+
+# returns the masks of the rows of the block which always hold and which never
+# hold, as in _is_trivial. Bounds of A_i x - b_i are computed for all rows at
+# once from the bounds of the variables, with positive and negative
+# coefficients multiplied separately
+def _block_trivial_rows(
+    model: SympyOpt, block: LinearConstraints
+) -> Tuple[np.ndarray, np.ndarray]:
+    ids = model.variables.get_ids(block.varnames)
+    var_lb, var_ub = model.variables.lbs[ids], model.variables.ubs[ids]
+    matrix = block.matrix
+    pos, neg = matrix.multiply(matrix > 0).tocsr(), matrix.multiply(matrix < 0).tocsr()
+    lb = pos @ var_lb + neg @ var_ub - block.rhs
+    ub = pos @ var_ub + neg @ var_lb - block.rhs
+
+    is_eq, is_leq = block.senses == EQ_SENSE, block.senses == INEQ_LEQ_SENSE
+    is_geq = block.senses == INEQ_GEQ_SENSE
+    trivial = (is_eq & (lb == 0) & (ub == 0)) | (is_leq & (ub <= 0)) | (is_geq & (lb >= 0))
+    unsatisfiable = (~is_geq & (lb > 0)) | (~is_leq & (ub < 0))
+    return trivial, unsatisfiable
+
+
+# returns the rows of the block in mask as the coefficients and the offsets of
+# the expressions A_i x - b_i, with zero coefficients skipped
+def _block_linear_rows(
+    block: LinearConstraints, mask: np.ndarray
+) -> List[Tuple[Dict[str, float], float]]:
+    matrix = block.matrix
+    rows: List[Tuple[Dict[str, float], float]] = []
+    for i in np.flatnonzero(mask).tolist():
+        start, end = matrix.indptr[i], matrix.indptr[i + 1]
+        cols, data = matrix.indices[start:end].tolist(), matrix.data[start:end].tolist()
+        coeffs = {block.varnames[col]: coeff for col, coeff in zip(cols, data) if coeff != 0}
+        rows.append((coeffs, -float(block.rhs[i])))
+    return rows
 
 
 # EqToObj
 
 
+# returns expanded polynomial as a dictionary mapping monomials into their
+# coefficients, with powers of bits and spins reduced. Returns None if expr is
+# not a polynomial
+def _poly_terms(model: SympyOpt, expr: Expr) -> Optional[Dict[Expr, Expr]]:
+    terms = dict()  # type: Dict[Expr, Expr]
+    for term in Add.make_args(expand(expr)):
+        coeff, mono = term.as_coeff_Mul()
+        for factor in Mul.make_args(mono):
+            if isinstance(factor, Pow) and isinstance(factor.base, Symbol):
+                if not (isinstance(factor.exp, Integer) and factor.exp > 0):
+                    return None
+            elif not isinstance(factor, Symbol) and not factor.is_number:
+                return None
+        mono = model._bitspin_simp_rec(mono)
+        terms[mono] = terms.get(mono, 0) + coeff
+    return terms
+
+
+# adds (a.x + offset)^2 = x^T (a a^T) x + 2 offset a.x + offset^2 into
+# penalties. The quadratic form is computed as NumPy outer product, and only
+# its diagonal depends on the variable types: b^2 = b, s^2 = 1. The arrays
+# hold the Sympy coefficients, so that the penalty is exact
+def _add_linear_square(
+    model: SympyOpt, penalties: Dict[Expr, Expr], coeffs: Dict[Symbol, Expr], offset: Expr
+) -> None:
+    syms = list(coeffs.keys())
+    a = np.empty(len(syms), dtype=object)
+    a[:] = list(coeffs.values())
+    quad = np.outer(a, a)
+    diag = quad.diagonal()
+    vtypes = model.variables.vtypes[model.variables.get_ids(sym.name for sym in syms)]
+    is_bit, is_spin = vtypes == BIT_VTYPE, vtypes == SPIN_VTYPE
+    lin = 2 * offset * a + np.where(is_bit, diag, 0)
+    const = offset * offset + diag[is_spin].sum()
+    for sym, lin_coeff, diag_coeff, squared in zip(
+        syms, lin.tolist(), diag.tolist(), (~(is_bit | is_spin)).tolist()
+    ):
+        if squared:
+            penalties[sym ** 2] = penalties.get(sym ** 2, 0) + diag_coeff
+        penalties[sym] = penalties.get(sym, 0) + lin_coeff
+    rows, cols = np.triu_indices(len(syms), 1)
+    for i, j, coeff in zip(rows.tolist(), cols.tolist(), (2 * quad[rows, cols]).tolist()):
+        mono = syms[i] * syms[j]
+        penalties[mono] = penalties.get(mono, 0) + coeff
+    penalties[S.One] = penalties.get(S.One, 0) + const
+
+
+# adds expanded expr ** 2 into penalties, which maps monomials into their
+# coefficients. Products of monomials are reduced with b^2 = b and s^2 = 1
+# for bits and spins, so that the penalties never have to be expanded again.
+# Squares of non-polynomial expressions are stored as they are
+def _add_square(model: SympyOpt, penalties: Dict[Expr, Expr], expr: Expr) -> None:
+    linear = _linear_terms(expr)
+    if linear is not None:
+        _add_linear_square(model, penalties, *linear)
+        return
+    terms = _poly_terms(model, expr)
+    if terms is None:
+        square = expr ** 2
+        penalties[square] = penalties.get(square, 0) + 1
+        return
+    items = list(terms.items())
+    for i, (mono1, coeff1) in enumerate(items):
+        for j in range(i, len(items)):
+            mono2, coeff2 = items[j]
+            mono = model._bitspin_simp_rec(mono1 * mono2)
+            coeff = coeff1 * coeff2 if i == j else 2 * coeff1 * coeff2
+            penalties[mono] = penalties.get(mono, 0) + coeff
+
+
+# adds sum_r (A_r x - b_r)^2 over the rows of the block into penalties. The
+# quadratic form A^T A is computed as a sparse product, and like in
+# _add_linear_square only its diagonal depends on the variable types. Blocks
+# store floats, thus integral coefficients are turned back into integers
+def _add_block_squares(model: SympyOpt, penalties: Dict[Expr, Expr], block: LinearConstraints):
+    cols = np.unique(block.matrix.indices)
+    matrix = block.matrix[:, cols]
+    syms = [model.variables[block.varnames[col]].var for col in cols.tolist()]
+    quad = (matrix.T @ matrix).tocoo()
+    diag = quad.diagonal()
+    vtypes = model.variables.vtypes[model.variables.get_ids(sym.name for sym in syms)]
+    is_bit, is_spin = vtypes == BIT_VTYPE, vtypes == SPIN_VTYPE
+    lin = -2 * (matrix.T @ block.rhs) + np.where(is_bit, diag, 0)
+    const = block.rhs @ block.rhs + diag[is_spin].sum()
+    for sym, lin_coeff, diag_coeff, squared in zip(
+        syms, lin.tolist(), diag.tolist(), (~(is_bit | is_spin)).tolist()
+    ):
+        if squared:
+            penalties[sym ** 2] = penalties.get(sym ** 2, 0) + _get_number(diag_coeff)
+        penalties[sym] = penalties.get(sym, 0) + _get_number(lin_coeff)
+    upper = quad.row < quad.col
+    for i, j, coeff in zip(
+        quad.row[upper].tolist(), quad.col[upper].tolist(), (2 * quad.data[upper]).tolist()
+    ):
+        mono = syms[i] * syms[j]
+        penalties[mono] = penalties.get(mono, 0) + _get_number(coeff)
+    penalties[S.One] = penalties.get(S.One, 0) + _get_number(float(const))
+
+
 @convert.register
 def convert_sympyopt_eqtoobj(model: SympyOpt, converter: EqToObj):
     assert can_convert(model, converter)
@@ -64,20 +318,34 @@ def convert_sympyopt_eqtoobj(model: SympyOpt, converter: EqToObj):
             c = model.constraints[cname]
             if _rex.fullmatch(cname) and isinstance(c, ConstraintEq):
                 constr_names.append(cname)
-    else:
+    elif converter.name in model.constraints:
         assert isinstance(model.constraints[converter.name], ConstraintEq)
         constr_names.append(converter.name)
+    block_rows = _matching_block_rows(model, converter.name, converter.is_regexp)
 
-    converter.data["verifiers"] = []
+    converter.data["verifier"] = ConstraintsVerifier()
+    # penalties are accumulated term by term, and added to the objective once,
+    # so that the objective is rebuilt only once
+    penalties = dict()  # type: Dict[Expr, Expr]
     for cname in constr_names:
         c = model.constraints.pop(cname)
         assert isinstance(c, ConstraintEq)
-        if model.sense == MIN_SENSE:
-            model.objective += converter.penalty * (c.exprleft - c.exprright) ** 2
-        else:
-            model.objective -= converter.penalty * (c.exprleft - c.exprright) ** 2
+        _add_square(model, penalties, c.exprleft - c.exprright)
         if c.check_interpret:
-            converter.data["verifiers"].append(_eq_to_verifier(c))
+            _add_to_verifier(converter.data["verifier"], c.exprleft - c.exprright, EQ_CTYPE)
+    for bname, mask in block_rows.items():
+        block = model.constraints[bname]
+        assert isinstance(block, LinearConstraints)
+        mask &= block.senses == EQ_SENSE
+        if mask.any():
+            rows = block.select(mask)
+            _remove_block_rows(model, bname, mask)
+            _add_block_squares(model, penalties, rows)
+            _add_block_to_verifier(converter.data["verifier"], rows.select(rows.checks))
+    if penalties:
+        scale = converter.penalty if model.sense == MIN_SENSE else -converter.penalty
+        penalty = Add(*[coeff * mono for mono, coeff in penalties.items()])
+        model.objective = model.objective + scale * penalty
     return model
 
 
@@ -87,104 +355,66 @@ def can_convert_sympyopt_eqtoobj(model: SympyOpt, converter: EqToObj) -> bool:
         return True
     name = converter.name
     if name not in model.constraints:
-        return False
+        return _has_block_row(model, name, eq=True)
     return isinstance(model.constraints[name], ConstraintEq)
 
 
 # IneqToEq
 
-# if lbs and ubs are bound of expressions in a product, outputs the smallest
-# possible value
-# it assumes that list1 is element-wise smaller than list2 of the same size
-def _get_min_product(lbs: List[float], ubs: List[float]) -> float:
-    switchers_number = sum(lb * ub <= 0 for lb, ub in zip(lbs, ubs))
-    if switchers_number == 0:
-        # sign will be always the same irrespectively of chosen lb or ub
-        neg_no = sum(lb < 0 for lb in lbs)
-        if neg_no % 2 == 0:
-            return prod(min(abs(lb), abs(ub)) for lb, ub in zip(lbs, ubs))
-        else:
-            return -prod(max(abs(lb), abs(ub)) for lb, ub in zip(lbs, ubs))
-    else:
-        # here we can always choose lb or ub to be negative
-        result = prod(ub if abs(lb) < abs(ub) else lb for lb, ub in zip(lbs, ubs))
-        if result <= 0:
-            return result
-        # we need to switch one variable
-        values = []
-        for lb, ub in zip(lbs, ubs):
-            chosen, not_chosen = (ub, lb) if abs(lb) < abs(ub) else (lb, ub)
-            values.append(result * not_chosen / chosen)
-        return min(values)
-
-
-# if lbs and ubs are bound of expressions in a product, outputs the largest
-# possible value
-# it assumes that list1 is element-wise smaller than list2 of the same size
-def _get_max_product(lbs: List[float], ubs: List[float]) -> float:
-    return -_get_min_product([-x for x in ubs], [-x for x in lbs])
-
-
-# gets upperbound on the sympy expression. Model is used for getting var bounds
-# tight for linear expression
-def _get_upperbound(expr: Expr, model: SympyOpt) -> float:
-    if isinstance(expr, Symbol):
-        return model.variables[expr.name].get_ub()
-    elif isinstance(expr, Number):
-        return float(expr.evalf())
-    elif isinstance(expr, Add):
-        return sum(_get_upperbound(x, model) for x in expr._args)
-    elif isinstance(expr, Mul):
-        # this is complicated as it depends on the number of negative values
-        # chosen
-        lbs = [_get_lowerbound(x, model) for x in expr._args]
-        ubs = [_get_upperbound(x, model) for x in expr._args]
-
-        return _get_max_product(lbs, ubs)
-    elif isinstance(expr, Pow):
-        # HACK 1: it assumes exponent is an integer
-        # HACK 2: does not work tightly with spins. Would require a lowerbound
-        # with abs, which is difficult to implement
-        assert isinstance(expr.exp, Integer)
-        baselb = _get_lowerbound(expr.base, model)
-        baseub = _get_upperbound(expr.base, model)
-        return max(float(baselb ** expr.exp), float(baseub ** expr.exp))
-    else:
-        raise ValueError(f"Algebraic expression {type(expr)} cannot be handled")  # pragma: no cover
-
-
-# gets lowerbound on the sympy expression. Model is used for getting var bounds
-# tight for linear expression
-def _get_lowerbound(expr: Expr, model: SympyOpt) -> float:
-    if isinstance(expr, Symbol):
-        return model.variables[expr.name].get_lb()
-    elif isinstance(expr, Number):
-        return float(expr.evalf())
-    elif isinstance(expr, Add):
-        return sum(_get_lowerbound(x, model) for x in expr._args)
-    elif isinstance(expr, Mul):
-        # this is complicated as it depends on the number of negative values
-        # chosen
-        lbs = [_get_lowerbound(x, model) for x in expr._args]
-        ubs = [_get_upperbound(x, model) for x in expr._args]
-
-        return _get_min_product(lbs, ubs)
-    elif isinstance(expr, Pow):
-        # HACK 1: it assumes exponent is an integer
-        # HACK 2: does not work tightly with spins. Would require a lowerbound
-        # with abs, which is difficult to implement
-        assert isinstance(expr.exp, Integer)
-        if expr.exp % 2 == 1:
-            return float(_get_lowerbound(expr.base, model) ** expr.exp)
-        else:
-            baselb = _get_lowerbound(expr.base, model)
-            baseub = _get_upperbound(expr.base, model)
-            if baselb * baseub <= 0:
-                return 0
-            else:
-                return min(float(baselb ** expr.exp), float(baseub ** expr.exp))
+# replaces the inequalities of the block in mask with equalities with slack
+# variables. The bounds of the slack variables are computed for all rows at
+# once from the bounds of the variables
+def _block_ineq_to_eq(model: SympyOpt, converter: IneqToEq, bname: str, mask: np.ndarray) -> None:
+    block = model.constraints[bname]
+    assert isinstance(block, LinearConstraints)
+    rows = np.flatnonzero(mask & (block.senses != EQ_SENSE))
+    if rows.size == 0:
+        return
+    ids = model.variables.get_ids(block.varnames)
+    lbs, ubs = model.variables.lbs[ids], model.variables.ubs[ids]
+    coo = block.matrix[rows].tocoo()
+    data, cols = coo.data, coo.col
+    low = np.bincount(
+        coo.row, np.where(data > 0, data * lbs[cols], data * ubs[cols]), minlength=rows.size
+    )
+    high = np.bincount(
+        coo.row, np.where(data > 0, data * ubs[cols], data * lbs[cols]), minlength=rows.size
+    )
+    rhs = block.rhs[rows]
+    geq = block.senses[rows] == INEQ_GEQ_SENSE
+    slack_bounds = np.where(geq, high - rhs, rhs - low)
+    if (slack_bounds < 0).any():
+        cname = block.names[rows[np.argmax(slack_bounds < 0)]]
+        raise ValueError(f"Inequality {cname} is not satisfiable")
+
+    has_slack = slack_bounds > 0
+    slack_rows = rows[has_slack]
+    slack_names = [f"{block.names[row]}{INTER_STR_SEP}slack" for row in slack_rows.tolist()]
+    model.int_vars(slack_names, 0, [ceil(bound) for bound in slack_bounds[has_slack].tolist()])
+    slack_matrix = csr_matrix(
+        (np.where(geq[has_slack], -1.0, 1.0), (slack_rows, np.arange(len(slack_names)))),
+        shape=(len(block), len(slack_names)),
+    )
+    senses, checks = block.senses.copy(), block.checks.copy()
+    senses[rows] = EQ_SENSE
+    checks[rows] = False
+    new_block = LinearConstraints(
+        hstack([block.matrix, slack_matrix], format="csr"),
+        block.varnames + slack_names,
+        senses,
+        block.rhs,
+        block.names,
+        checks,
+    )
+    model.constraints[bname] = new_block
+
+    row_mask = np.zeros(len(block), dtype=bool)
+    row_mask[rows] = True
+    converter.data["slack_names"].extend(slack_names)
+    if converter.check_slack:
+        _add_block_to_verifier(converter.data["verifier"], new_block.select(row_mask))
     else:
-        raise ValueError(f"Algebraic expression {type(expr)} cannot be handled")  # pragma: no cover
+        _add_block_to_verifier(converter.data["verifier"], block.select(row_mask))
 
 
 @convert.register
@@ -198,19 +428,22 @@ def convert_sympyopt_ineqtoeq(model: SympyOpt, converter: IneqToEq):
             c = model.constraints[cname]
             if _rex.fullmatch(cname) and isinstance(c, ConstraintIneq):
                 constr_names.append(cname)
-    else:
+    elif converter.name in model.constraints:
         assert isinstance(model.constraints[converter.name], ConstraintIneq)
         constr_names.append(converter.name)
+    block_rows = _matching_block_rows(model, converter.name, converter.is_regexp)
 
-    converter.data["verifiers"] = []
+    converter.data["verifier"] = ConstraintsVerifier()
+    converter.data["slack_names"] = []
+    bounds = ExprBounds(model)
     for cname in constr_names:
         c = model.constraints.pop(cname)
         assert isinstance(c, ConstraintIneq)
 
         if c.sense == INEQ_GEQ_SENSE:
-            slack_bound = -_get_lowerbound(expand(c.exprright - c.exprleft), model)
+            slack_bound = -bounds.get_lb(expand(c.exprright - c.exprleft))
         else:  # INEQ_LEQ_SENSE
-            slack_bound = -_get_lowerbound(expand(c.exprleft - c.exprright), model)
+            slack_bound = -bounds.get_lb(expand(c.exprleft - c.exprright))
         slack_name = f"{cname}{INTER_STR_SEP}slack"
         if slack_bound == 0:
             slack_var = 0  # no need for a variable
@@ -227,11 +460,16 @@ def convert_sympyopt_ineqtoeq(model: SympyOpt, converter: IneqToEq):
         c_new.check_interpret = False
         model.add_constraint(c_new, cname)
 
+        if slack_name != "":
+            converter.data["slack_names"].append(slack_name)
         if converter.check_slack:
-            converter.data["verifiers"].append((_eq_to_verifier(c_new), slack_name))
+            expr = c_new.exprleft - c_new.exprright
+            _add_to_verifier(converter.data["verifier"], expr, EQ_CTYPE)
         else:
-            ctype = "geq" if c.sense == INEQ_GEQ_SENSE else "leq"
-            converter.data["verifiers"].append((_eq_to_verifier(c), slack_name, ctype))
+            ctype = GEQ_CTYPE if c.sense == INEQ_GEQ_SENSE else LEQ_CTYPE
+            _add_to_verifier(converter.data["verifier"], c.exprleft - c.exprright, ctype)
+    for bname, mask in block_rows.items():
+        _block_ineq_to_eq(model, converter, bname, mask)
 
     return model
 
@@ -242,7 +480,7 @@ def can_convert_sympyopt_ineqtoeq(model: SympyOpt, converter: IneqToEq) -> bool:
         return True
     name = converter.name
     if name not in model.constraints:
-        return False
+        return _has_block_row(model, name, eq=False)
     return isinstance(model.constraints[name], ConstraintIneq)
 
 
@@ -266,8 +504,10 @@ def can_convert_sympyopt_quadratizepyqubo(model: SympyOpt, converter: Quadratize
 @convert.register
 def convert_sympyopt_makemax(model: SympyOpt, converter: MakeMax) -> SympyOpt:
     assert can_convert(model, converter)
+    # objective is negated in place, as it may contain parameters, which are
+    # not variables of the model
     if model.sense == MIN_SENSE:
-        model.minimize(-model.get_objective())
+        model.objective = -model.objective
         model.sense = MAX_SENSE
     return model
 
@@ -284,7 +524,7 @@ def can_convert_sympyopt_makemax(model: SympyOpt, converter: MakeMax) -> bool:
 def convert_sympyopt_makemin(model: SympyOpt, converter: MakeMin) -> SympyOpt:
     assert can_convert(model, converter)
     if model.sense == MAX_SENSE:
-        model.minimize(-model.get_objective())
+        model.objective = -model.objective
         model.sense = MIN_SENSE
     return model
 
@@ -297,32 +537,42 @@ def can_convert_sympyopt_makemin(model: SympyOpt, converter: MakeMin) -> bool:
 # RemoveConstraint
 
 
+# returns type of the constraint exprleft - exprright (ctype) 0
+def _get_ctype(c: Union[ConstraintEq, ConstraintIneq]) -> str:
+    if isinstance(c, ConstraintEq):
+        return EQ_CTYPE
+    return GEQ_CTYPE if c.sense == INEQ_GEQ_SENSE else LEQ_CTYPE
+
+
 @convert.register
 def convert_sympyopt_removeconstraint(model: SympyOpt, converter: RemoveConstraint) -> SympyOpt:
     assert can_convert(model, converter)
-    converter.data["verifiers"] = []
+    converter.data["verifier"] = ConstraintsVerifier()
 
     to_be_removed: List[str] = []
     if converter.is_regexp:
         _rex = re.compile(converter.name)
         to_be_removed = []
-        for cname in model.constraints:
-            if _rex.fullmatch(cname):
+        for cname, c in model.constraints.items():
+            if _rex.fullmatch(cname) and not isinstance(c, LinearConstraints):
                 to_be_removed.append(cname)
-    else:
+    elif converter.name in model.constraints:
         to_be_removed.append(converter.name)
+    block_rows = _matching_block_rows(model, converter.name, converter.is_regexp)
 
     for cname in to_be_removed:
         c = model.constraints.pop(cname)
 
         if converter.check_constraint:
-            if isinstance(c, ConstraintEq):
-                ctype = "eq"
-            else:
-                assert isinstance(c, ConstraintIneq)
-                ctype = "geq" if c.sense == INEQ_GEQ_SENSE else "leq"
             assert isinstance(c, (ConstraintEq, ConstraintIneq))
-            converter.data["verifiers"].append((_eq_to_verifier(c), ctype))
+            ctype = _get_ctype(c)
+            _add_to_verifier(converter.data["verifier"], c.exprleft - c.exprright, ctype)
+    for bname, mask in block_rows.items():
+        block = model.constraints[bname]
+        assert isinstance(block, LinearConstraints)
+        _remove_block_rows(model, bname, mask)
+        if converter.check_constraint:
+            _add_block_to_verifier(converter.data["verifier"], block.select(mask))
     return model
 
 
@@ -330,37 +580,419 @@ def convert_sympyopt_removeconstraint(model: SympyOpt, converter: RemoveConstrai
 def can_convert_sympyopt_removeconstraint(model: SympyOpt, converter: RemoveConstraint) -> bool:
     if converter.is_regexp:
         return True
-    return converter.name in model.constraints
+    name = converter.name
+    return name in model.constraints or bool(_matching_block_rows(model, name, False))
 
 
 # RemoveTrivialConstraints
 
 
+# checks if constraint expr (ctype) 0 always holds, provided lb <= expr <= ub.
+# Raises ValueError if it never holds
+def _is_trivial(cname: str, ctype: str, lb: Bound, ub: Bound) -> bool:
+    if ctype == EQ_CTYPE:
+        satisfiable, trivial = lb <= 0 <= ub, lb == ub == 0
+    elif ctype == LEQ_CTYPE:
+        satisfiable, trivial = lb <= 0, ub <= 0
+    else:  # GEQ_CTYPE
+        satisfiable, trivial = ub >= 0, lb >= 0
+    if not satisfiable:
+        raise ValueError(f"Constraint {cname} is not satisfiable")
+    return trivial
+
+
 @convert.register
 def convert_sympyopt_removetrivialConstraints(
     model: SympyOpt, converter: RemoveTrivialConstraints
 ) -> SympyOpt:
     assert can_convert(model, converter)
-    raise NotImplementedError()
+
+    constr_names: List[str] = []
+    if converter.is_regexp:
+        _rex = re.compile(converter.name)
+        for cname in model.constraints:
+            c = model.constraints[cname]
+            if _rex.fullmatch(cname) and isinstance(c, (ConstraintEq, ConstraintIneq)):
+                constr_names.append(cname)
+    elif isinstance(model.constraints.get(converter.name), (ConstraintEq, ConstraintIneq)):
+        constr_names.append(converter.name)
+    block_rows = _matching_block_rows(model, converter.name, converter.is_regexp)
+
+    # linear constraints are bounded all at once, others one by one
+    bounds = ExprBounds(model)
+    linear_names: List[str] = []
+    linear_rows: List[Tuple[Dict[Symbol, float], float]] = []
+    lbs: Dict[str, Bound] = dict()
+    ubs: Dict[str, Bound] = dict()
+    for cname in constr_names:
+        c = model.constraints[cname]
+        assert isinstance(c, (ConstraintEq, ConstraintIneq))
+        expr = expand(c.exprleft - c.exprright)
+        linear = _float_linear_terms(expr)
+        if linear is None:
+            lbs[cname], ubs[cname] = bounds(expr)
+        else:
+            linear_names.append(cname)
+            linear_rows.append(linear)
+    if linear_rows:
+        lb_arr, ub_arr = bounds.linear_bounds(linear_rows)
+        lbs.update(zip(linear_names, lb_arr.tolist()))
+        ubs.update(zip(linear_names, ub_arr.tolist()))
+
+    # model is updated only if all constraints are satisfiable
+    trivial_names: List[str] = []
+    for cname in constr_names:
+        c = model.constraints[cname]
+        assert isinstance(c, (ConstraintEq, ConstraintIneq))
+        if _is_trivial(cname, _get_ctype(c), lbs[cname], ubs[cname]):
+            trivial_names.append(cname)
+    trivial_masks: Dict[str, np.ndarray] = dict()
+    for bname, mask in block_rows.items():
+        block = model.constraints[bname]
+        assert isinstance(block, LinearConstraints)
+        trivial_mask, unsatisfiable = _block_trivial_rows(model, block)
+        unsatisfiable &= mask
+        if unsatisfiable.any():
+            row = block.names[np.flatnonzero(unsatisfiable)[0]]
+            raise ValueError(f"Constraint {row} is not satisfiable")
+        trivial_mask &= mask
+        if trivial_mask.any():
+            trivial_masks[bname] = trivial_mask
+
+    converter.data["verifier"] = ConstraintsVerifier()
+    for bname, mask in trivial_masks.items():
+        block = model.constraints[bname]
+        assert isinstance(block, LinearConstraints)
+        _remove_block_rows(model, bname, mask)
+        checked = mask & block.checks
+        if checked.any():
+            _add_block_to_verifier(converter.data["verifier"], block.select(checked))
+    linear_idx = {cname: i for i, cname in enumerate(linear_names)}
+    for cname in trivial_names:
+        c = model.constraints.pop(cname)
+        assert isinstance(c, (ConstraintEq, ConstraintIneq))
+        if not c.check_interpret:
+            continue
+        ctype = _get_ctype(c)
+        if cname in linear_idx:
+            coeffs, offset = linear_rows[linear_idx[cname]]
+            converter.data["verifier"].add_linear(
+                {sym.name: coeff for sym, coeff in coeffs.items()}, offset, ctype
+            )
+        else:
+            _add_to_verifier(converter.data["verifier"], c.exprleft - c.exprright, ctype)
+    return model
 
 
 @can_convert.register
 def can_convert_sympyopt_removetrivialConstraints(
     model: SympyOpt, converter: RemoveTrivialConstraints
 ) -> bool:
-    return True
+    if converter.is_regexp:
+        return True
+    name = converter.name
+    if isinstance(model.constraints.get(name), (ConstraintEq, ConstraintIneq)):
+        return True
+    return bool(_matching_block_rows(model, name, False))
+
+
+# Presolve
+
+# tolerance for rounding the bounds of integer variables and for comparing
+# the constraints
+_PRESOLVE_EPS = 1e-9
+
+# linear constraint sum_j coeffs[x_j] * x_j + offset (ctype) 0 given as name,
+# coeffs, offset and ctype
+_LinearRow = Tuple[str, Dict[str, float], float, str]
+
+
+# returns inequalities sum_j a_j x_j <= rhs equivalent to the constraint
+def _leq_rows(
+    coeffs: Dict[str, float], offset: float, ctype: str
+) -> List[Tuple[Dict[str, float], float]]:
+    leq = (coeffs, -offset)
+    geq = ({name: -coeff for name, coeff in coeffs.items()}, offset)
+    if ctype == LEQ_CTYPE:
+        return [leq]
+    elif ctype == GEQ_CTYPE:
+        return [geq]
+    return [leq, geq]
+
+
+# minimal value of coeff * x for lb <= x <= ub, coeff is nonzero
+def _min_term(coeff: float, lb: float, ub: float) -> float:
+    return coeff * lb if coeff > 0 else coeff * ub
+
+
+# single round of bound tightening. For sum_j a_j x_j <= rhs, a_k x_k is at
+# most rhs minus the minimal value of the other terms. Only variables in
+# integral are tightened, and their bounds are rounded; spins are kept in
+# {-1, 1}. Returns True if any bound was changed
+def _tighten_bounds(
+    rows: List[_LinearRow],
+    bounds: Dict[str, Tuple[float, float]],
+    integral: Dict[str, Union[IntVar, BitVar, SpinVar]],
+) -> bool:
+    changed = False
+    for cname, coeffs, offset, ctype in rows:
+        for leq_coeffs, rhs in _leq_rows(coeffs, offset, ctype):
+            mins = {name: _min_term(coeff, *bounds[name]) for name, coeff in leq_coeffs.items()}
+            inf_no = sum(isinf(val) for val in mins.values())
+            finite = sum(val for val in mins.values() if not isinf(val))
+            for name, coeff in leq_coeffs.items():
+                if name not in integral or inf_no > 1 or (inf_no == 1 and not isinf(mins[name])):
+                    continue
+                rest = finite if isinf(mins[name]) else finite - mins[name]
+                limit = (rhs - rest) / coeff
+                lb, ub = bounds[name]
+                if coeff > 0:
+                    ub = min(ub, floor(limit + _PRESOLVE_EPS))
+                else:
+                    lb = max(lb, ceil(limit - _PRESOLVE_EPS))
+                if isinstance(integral[name], SpinVar):
+                    lb, ub = (1 if lb > -1 else lb), (-1 if ub < 1 else ub)
+                if lb > ub:
+                    raise ValueError(f"Constraint {cname} is not satisfiable")
+                if (lb, ub) != bounds[name]:
+                    bounds[name] = (lb, ub)
+                    changed = True
+    return changed
+
+
+# returns the positions of duplicated and dominated constraints in rows.
+# Constraints are normalized, so that the coefficient of the first variable is
+# 1, and grouped by the normalized coefficients. From each group, at most one
+# equality, or the tightest <= and >= inequalities are kept
+def _redundant_rows(rows: List[_LinearRow]) -> List[int]:
+    groups: Dict[tuple, Dict[str, List[Tuple[float, int]]]] = dict()
+    for pos, (_, coeffs, offset, ctype) in enumerate(rows):
+        names = sorted(coeffs)
+        first = coeffs[names[0]]
+        key = tuple((name, round(coeffs[name] / first, 9)) for name in names)
+        if ctype == EQ_CTYPE:
+            kind = EQ_CTYPE
+        elif (ctype == LEQ_CTYPE) == (first > 0):
+            kind = LEQ_CTYPE
+        else:
+            kind = GEQ_CTYPE
+        group = groups.setdefault(key, {EQ_CTYPE: [], LEQ_CTYPE: [], GEQ_CTYPE: []})
+        group[kind].append((-offset / first, pos))
+
+    redundant: List[int] = []
+    for group in groups.values():
+        eqs, leqs, geqs = group[EQ_CTYPE], sorted(group[LEQ_CTYPE]), sorted(group[GEQ_CTYPE])
+        if eqs:
+            # all other constraints are implied by the first equality
+            val = eqs[0][0]
+            implied = [(abs(val - val_new) <= _PRESOLVE_EPS, pos) for val_new, pos in eqs[1:]]
+            implied += [(val <= val_new + _PRESOLVE_EPS, pos) for val_new, pos in leqs]
+            implied += [(val >= val_new - _PRESOLVE_EPS, pos) for val_new, pos in geqs]
+            for satisfiable, pos in implied:
+                if not satisfiable:
+                    raise ValueError(f"Constraint {rows[pos][0]} is not satisfiable")
+                redundant.append(pos)
+            continue
+        if leqs and geqs and leqs[0][0] < geqs[-1][0] - _PRESOLVE_EPS:
+            raise ValueError(f"Constraint {rows[leqs[0][1]][0]} is not satisfiable")
+        redundant.extend(pos for _, pos in leqs[1:])
+        redundant.extend(pos for _, pos in geqs[:-1])
+    return redundant
+
+
+@convert.register
+def convert_sympyopt_presolve(model: SympyOpt, converter: Presolve) -> SympyOpt:
+    assert can_convert(model, converter)
+
+    constr_names: List[str] = []
+    if converter.is_regexp:
+        _rex = re.compile(converter.name)
+        for cname in model.constraints:
+            c = model.constraints[cname]
+            if _rex.fullmatch(cname) and isinstance(c, (ConstraintEq, ConstraintIneq)):
+                constr_names.append(cname)
+    elif isinstance(model.constraints.get(converter.name), (ConstraintEq, ConstraintIneq)):
+        constr_names.append(converter.name)
+    block_rows = _matching_block_rows(model, converter.name, converter.is_regexp)
+
+    # only linear constraints are used. Each row is identified by the name of
+    # the constraint, or by the name of the block and the index of the row
+    rows: List[_LinearRow] = []
+    origins: List[Tuple[str, Optional[int]]] = []
+    for cname in constr_names:
+        c = model.constraints[cname]
+        assert isinstance(c, (ConstraintEq, ConstraintIneq))
+        linear = _float_linear_terms(c.exprleft - c.exprright)
+        if linear is not None:
+            coeffs = {sym.name: coeff for sym, coeff in linear[0].items() if coeff != 0}
+            rows.append((cname, coeffs, linear[1], _get_ctype(c)))
+            origins.append((cname, None))
+    for bname, mask in block_rows.items():
+        block = model.constraints[bname]
+        assert isinstance(block, LinearConstraints)
+        row_ids = np.flatnonzero(mask).tolist()
+        for i, (coeffs, offset) in zip(row_ids, _block_linear_rows(block, mask)):
+            rows.append((block.names[i], coeffs, offset, _SENSE_CTYPES[block.senses[i]]))
+            origins.append((bname, i))
+
+    # bounds are tightened locally, model is updated only if all constraints
+    # are satisfiable
+    bounds: Dict[str, Tuple[float, float]] = dict()
+    integral: Dict[str, Union[IntVar, BitVar, SpinVar]] = dict()
+    for _, coeffs, _, _ in rows:
+        for name in coeffs:
+            var = model.variables[name]
+            bounds[name] = (var.get_lb(), var.get_ub())
+            if isinstance(var, (IntVar, BitVar, SpinVar)):
+                integral[name] = var
+    for _ in range(converter.max_iter):
+        if not _tighten_bounds(rows, bounds, integral):
+            break
+    fixed = {name: int(lb) for name, (lb, ub) in bounds.items() if name in integral and lb == ub}
+
+    # constraints are checked with the tightened bounds and the fixed
+    # variables replaced with their values
+    removed: List[int] = []
+    reduced_rows: List[_LinearRow] = []
+    reduced_ids: List[int] = []
+    for pos, (cname, coeffs, offset, ctype) in enumerate(rows):
+        offset += sum(coeff * fixed[name] for name, coeff in coeffs.items() if name in fixed)
+        coeffs = {name: coeff for name, coeff in coeffs.items() if name not in fixed}
+        lb = offset + sum(_min_term(coeff, *bounds[name]) for name, coeff in coeffs.items())
+        ub = offset - sum(_min_term(-coeff, *bounds[name]) for name, coeff in coeffs.items())
+        if abs(lb) <= _PRESOLVE_EPS:
+            lb = 0.0
+        if abs(ub) <= _PRESOLVE_EPS:
+            ub = 0.0
+        if _is_trivial(cname, ctype, lb, ub):
+            removed.append(pos)
+        else:
+            reduced_rows.append((cname, coeffs, offset, ctype))
+            reduced_ids.append(pos)
+    removed.extend(reduced_ids[pos] for pos in _redundant_rows(reduced_rows))
+
+    # removed constraints are checked with the original rows, before the
+    # fixed variables are replaced
+    converter.data["fixed"] = fixed
+    converter.data["verifier"] = ConstraintsVerifier()
+    removed_masks: Dict[str, np.ndarray] = dict()
+    for pos in sorted(removed):
+        _, coeffs, offset, ctype = rows[pos]
+        key, row = origins[pos]
+        if row is not None:
+            mask = removed_masks.setdefault(key, np.zeros(len(block_rows[key]), dtype=bool))
+            mask[row] = True
+            continue
+        c = model.constraints.pop(key)
+        if c.check_interpret:
+            converter.data["verifier"].add_linear(coeffs, offset, ctype)
+    for bname, mask in removed_masks.items():
+        block = model.constraints[bname]
+        assert isinstance(block, LinearConstraints)
+        _remove_block_rows(model, bname, mask)
+        checked = mask & block.checks
+        if checked.any():
+            _add_block_to_verifier(converter.data["verifier"], block.select(checked))
+
+    for name, (lb, ub) in bounds.items():
+        var = model.variables[name]
+        if name not in fixed and isinstance(var, IntVar) and (lb, ub) != (var.lb, var.ub):
+            # variables are copied, as they may be shared with the model history
+            var = copy(var)
+            var.lb, var.ub = lb, ub
+            model.variables[name] = var
+    if fixed:
+        _sub_expression(model, {model.variables[name].var: S(val) for name, val in fixed.items()})
+        for name in fixed:
+            del model.variables[name]
+    return model
+
+
+@can_convert.register
+def can_convert_sympyopt_presolve(model: SympyOpt, converter: Presolve) -> bool:
+    if converter.is_regexp:
+        return True
+    name = converter.name
+    if isinstance(model.constraints.get(name), (ConstraintEq, ConstraintIneq)):
+        return True
+    return bool(_matching_block_rows(model, name, False))
 
 
 # general commands for VarReplace
 
 # substitute expression for symbols for objective and all constraints
 # note: rule_dict is much faster than replacing symbols one by one
+# note: constraints are replaced, not modified, as they may be shared with
+# the model history
 def _sub_expression(model: SympyOpt, rule_dict: Dict[Symbol, Expr]):
     model.objective = model.objective.xreplace(rule_dict)
-    for c in model.constraints.values():
-        if isinstance(c, (ConstraintEq, ConstraintIneq)):
-            c.exprleft = c.exprleft.xreplace(rule_dict)
-            c.exprright = c.exprright.xreplace(rule_dict)
+    rules_by_name = None  # type: Optional[Dict[str, Expr]]
+    for name, c in list(model.constraints.items()):
+        if isinstance(c, LinearConstraints):
+            if rules_by_name is None:
+                rules_by_name = {sym.name: expr for sym, expr in rule_dict.items()}
+            block = _sub_block(c, rules_by_name)
+            if block is not None:
+                if block is not c:
+                    model.constraints[name] = block
+                continue
+            # substitution is not linear, thus the rows become Sympy constraints
+            del model.constraints[name]
+            for cname, row in c.to_constraints().items():
+                model.constraints[cname] = _sub_constraint(row, rule_dict)
+        elif isinstance(c, (ConstraintEq, ConstraintIneq)):
+            model.constraints[name] = _sub_constraint(c, rule_dict)
+
+
+# returns the constraint with the substituted expressions, or the same
+# constraint if nothing changed
+def _sub_constraint(
+    c: Union[ConstraintEq, ConstraintIneq], rule_dict: Dict[Symbol, Expr]
+) -> Union[ConstraintEq, ConstraintIneq]:
+    exprleft = c.exprleft.xreplace(rule_dict)
+    exprright = c.exprright.xreplace(rule_dict)
+    if exprleft is not c.exprleft or exprright is not c.exprright:
+        c = copy(c)
+        c.exprleft = exprleft
+        c.exprright = exprright
+    return c
+
+
+# substitutes linear expressions for the variables of the block, as the
+# product of its matrix with the sparse matrix of the substitution. Returns
+# the same block if none of its variables is replaced, and None if some of the
+# substituted expressions is not linear
+def _sub_block(block: LinearConstraints, rules: Dict[str, Expr]) -> Optional[LinearConstraints]:
+    replaced = [col for col, name in enumerate(block.varnames) if name in rules]
+    if not replaced:
+        return block
+    rows = [col for col, name in enumerate(block.varnames) if name not in rules]
+    varnames = [block.varnames[col] for col in rows]
+    var_idx = {name: i for i, name in enumerate(varnames)}
+    cols = list(range(len(varnames)))
+    coeffs = [1.0] * len(varnames)
+    offsets = np.zeros(len(block.varnames))
+    for col in replaced:
+        linear = _float_linear_terms(rules[block.varnames[col]])
+        if linear is None:
+            return None
+        for sym, coeff in linear[0].items():
+            if sym.name not in var_idx:
+                var_idx[sym.name] = len(varnames)
+                varnames.append(sym.name)
+            rows.append(col)
+            cols.append(var_idx[sym.name])
+            coeffs.append(coeff)
+        offsets[col] = linear[1]
+    substitution = csr_matrix((coeffs, (rows, cols)), shape=(len(block.varnames), len(varnames)))
+    return LinearConstraints(
+        block.matrix @ substitution,
+        varnames,
+        block.senses,
+        block.rhs - block.matrix @ offsets,
+        block.names,
+        block.checks,
+    )
 
 
 # looks for a matching variables names according to the name (perhaps regular
@@ -412,7 +1044,9 @@ def convert_sympyopt_setintvarbounds(model: SympyOpt, converter: SetIntVarBounds
 
     varnames = _matching_varnames(model, converter, filtering_fun=filtering_fun)
     for vname in varnames:
-        var = model.variables[vname]
+        # variable is replaced, not modified, as it may be shared with the
+        # model history
+        var = copy(model.variables[vname])
         assert isinstance(var, IntVar)
         if converter.lb is not None and var.get_lb() == -INF:
             assert converter.lb < var.ub
@@ -420,6 +1054,7 @@ def convert_sympyopt_setintvarbounds(model: SympyOpt, converter: SetIntVarBounds
         if converter.ub is not None and var.get_ub() == INF:
             assert var.lb < converter.ub
             var.ub = converter.ub
+        model.variables[vname] = var
     return model
 
 
@@ -451,37 +1086,41 @@ def _get_expr_add_constr_onehot(model: SympyOpt, var: IntVar) -> Expr:
     name = var.name
     lb = var.lb
     ub = var.ub
-    xs = [model.bit_var(f"{name}{INTER_STR_SEP}OH_{i}") for i in range(ub - lb + 1)]
+    xs = model.bit_vars(f"{name}{INTER_STR_SEP}OH", ub - lb + 1)
 
     # add constraint
-    c = ConstraintEq(sum(x for x in xs), 1)
+    c = ConstraintEq(Add(*xs), 1)
     model.add_constraint(c, name=f"{INTER_STR_SEP}OH_{name}")
 
-    return sum(v * x for x, v in zip(xs, range(lb, ub + 1)))
+    return Add(*(v * x for x, v in zip(xs, range(lb, ub + 1))))
 
 
-@convert.register
-def convert_sympyopt_varonehot(model: SympyOpt, converter: VarOneHot) -> SympyOpt:
-    assert can_convert(model, converter)
-
+# removes matching variables from the model, returning their substitution
+# for the objective and constraints
+def _replace_varonehot(model: SympyOpt, converter: VarOneHot) -> Dict[Symbol, Expr]:
     def filtering_fun(vname: str):
         return _can_convert_int(model, vname)
 
     var_to_replace = _matching_varnames(model, converter, filtering_fun)
 
-    rule_dict = dict()
+    rule_dict = dict()  # type: Dict[Symbol, Expr]
     for vname in var_to_replace:
         var = model.variables[vname]
         assert isinstance(var, IntVar)
         rule_dict[var.var] = _get_expr_add_constr_onehot(model, var)
 
-    _sub_expression(model, rule_dict)
-
     converter.data["bounds"] = dict()
     for vname in var_to_replace:
         var = model.variables.pop(vname)
         assert isinstance(var, IntVar)
         converter.data["bounds"][vname] = (var.lb, var.ub)
+    return rule_dict
+
+
+@convert.register
+def convert_sympyopt_varonehot(model: SympyOpt, converter: VarOneHot) -> SympyOpt:
+    assert can_convert(model, converter)
+    _sub_expression(model, _replace_varonehot(model, converter))
     return model
 
 
@@ -500,32 +1139,36 @@ def _get_expr_binary(model: SympyOpt, var: IntVar) -> Expr:
     lb: int = var.lb
     ub: int = var.ub
     vals = _binary_encoding_coeff(lb, ub)
-    vars = [model.bit_var(f"{name}{INTER_STR_SEP}BIN_{i}") for i in range(len(vals))]
-    return lb + sum(val * x for val, x in zip(vals, vars))
+    vars = model.bit_vars(f"{name}{INTER_STR_SEP}BIN", len(vals))
+    return lb + Add(*(val * x for val, x in zip(vals, vars)))
 
 
-@convert.register
-def convert_sympyopt_varbinary(model: SympyOpt, converter: VarBinary) -> SympyOpt:
-    assert can_convert(model, converter)
-
+# removes matching variables from the model, returning their substitution
+# for the objective and constraints
+def _replace_varbinary(model: SympyOpt, converter: VarBinary) -> Dict[Symbol, Expr]:
     def filtering_fun(vname: str):
         return _can_convert_int(model, vname)
 
     var_to_replace = _matching_varnames(model, converter, filtering_fun)
 
-    rule_dict = dict()
+    rule_dict = dict()  # type: Dict[Symbol, Expr]
     for vname in var_to_replace:
         var = model.variables[vname]
         assert isinstance(var, IntVar)
         rule_dict[var.var] = _get_expr_binary(model, var)
 
-    _sub_expression(model, rule_dict)
-
     converter.data["bounds"] = dict()
     for vname in var_to_replace:
         var = model.variables.pop(vname)
         assert isinstance(var, IntVar)
         converter.data["bounds"][vname] = (var.lb, var.ub)
+    return rule_dict
+
+
+@convert.register
+def convert_sympyopt_varbinary(model: SympyOpt, converter: VarBinary) -> SympyOpt:
+    assert can_convert(model, converter)
+    _sub_expression(model, _replace_varbinary(model, converter))
     return model
 
 
@@ -559,9 +1202,9 @@ def _can_convert_trivitb_sing(model: SympyOpt, name: str) -> bool:
     return isinstance(var, IntVar) and var.ub - var.lb == 1
 
 
-@convert.register
-def convert_sympyopt_trivialinttobit(model: SympyOpt, converter: TrivialIntToBit) -> SympyOpt:
-    assert can_convert(model, converter)
+# removes matching variables from the model, returning their substitution
+# for the objective and constraints
+def _replace_trivialinttobit(model: SympyOpt, converter: TrivialIntToBit) -> Dict[Symbol, Expr]:
     converter.data["lb"] = dict()
     if converter.is_regexp:
 
@@ -578,21 +1221,28 @@ def convert_sympyopt_trivialinttobit(model: SympyOpt, converter: TrivialIntToBit
     # you cannot
     if not converter.is_regexp:
         if not _can_convert_trivitb_sing(model, var_to_replace[0]):
-            return model
+            return dict()
 
-    rule_dict = dict()
-    for vname in var_to_replace:
+    bit_vars = [BitVar(f"{vname}{INTER_STR_SEP}itb") for vname in var_to_replace]
+    model.variables.add_vars(bit_vars)
+
+    rule_dict = dict()  # type: Dict[Symbol, Expr]
+    for vname, bit_var in zip(var_to_replace, bit_vars):
         var = model.variables[vname]
         assert isinstance(var, IntVar)  # for mypy
-        bit_var = model.bit_var(f"{vname}{INTER_STR_SEP}itb")
-        rule_dict[var.var] = var.lb + bit_var
-
-    _sub_expression(model, rule_dict)
+        rule_dict[var.var] = var.lb + bit_var.var
 
     for vname in var_to_replace:
         var = model.variables.pop(vname)
         assert isinstance(var, IntVar)
         converter.data["lb"][vname] = var.lb
+    return rule_dict
+
+
+@convert.register
+def convert_sympyopt_trivialinttobit(model: SympyOpt, converter: TrivialIntToBit) -> SympyOpt:
+    assert can_convert(model, converter)
+    _sub_expression(model, _replace_trivialinttobit(model, converter))
     return model
 
 
@@ -618,25 +1268,30 @@ def _can_convert_bittospin_sing(model: SympyOpt, name: str) -> bool:
     return isinstance(model.variables[name], BitVar)
 
 
-@convert.register
-def convert_sympyopt_bittospin(model: SympyOpt, converter: BitToSpin) -> SympyOpt:
-    assert can_convert(model, converter)
-
+# removes matching variables from the model, returning their substitution
+# for the objective and constraints
+def _replace_bittospin(model: SympyOpt, converter: BitToSpin) -> Dict[Symbol, Expr]:
     def filtering_fun(vname: str):
         return _can_convert_bittospin_sing(model, vname)
 
     var_to_replace = _matching_varnames(model, converter, filtering_fun)
 
-    rule_dict = dict()
+    rule_dict = dict()  # type: Dict[Symbol, Expr]
     for vname in var_to_replace:
         var = model.variables[vname].var
         rule_dict[var] = _get_expr_bittospin(model, converter, vname)
-    _sub_expression(model, rule_dict)
 
     converter.data["varnames"] = set(var_to_replace)
     for vname in var_to_replace:
         model.variables.pop(vname)
 
+    return rule_dict
+
+
+@convert.register
+def convert_sympyopt_bittospin(model: SympyOpt, converter: BitToSpin) -> SympyOpt:
+    assert can_convert(model, converter)
+    _sub_expression(model, _replace_bittospin(model, converter))
     return model
 
 
@@ -647,6 +1302,35 @@ def can_convert_sympyopt_bittospin(model: SympyOpt, converter: BitToSpin) -> boo
     return _can_convert_bittospin_sing(model, converter.varname)
 
 
+# VarReplaceBatch
+
+_VARREPLACE_RULES = {
+    VarOneHot: _replace_varonehot,
+    VarBinary: _replace_varbinary,
+    TrivialIntToBit: _replace_trivialinttobit,
+    BitToSpin: _replace_bittospin,
+}  # type: Dict[type, Callable[..., Dict[Symbol, Expr]]]
+
+
+@convert.register
+def convert_sympyopt_varreplacebatch(model: SympyOpt, converter: VarReplaceBatch) -> SympyOpt:
+    assert can_convert(model, converter)
+    rule_dict = dict()  # type: Dict[Symbol, Expr]
+    for conv in converter.converters:
+        assert can_convert(model, conv)
+        rules = _VARREPLACE_RULES[type(conv)](model, conv)
+        # new variables of the previous substitutions may be replaced as well
+        rule_dict = {sym: expr.xreplace(rules) for sym, expr in rule_dict.items()}
+        rule_dict.update(rules)
+    _sub_expression(model, rule_dict)
+    return model
+
+
+@can_convert.register
+def can_convert_sympyopt_varreplacebatch(model: SympyOpt, converter: VarReplaceBatch) -> bool:
+    return all(type(conv) in _VARREPLACE_RULES for conv in converter.converters)
+
+
 #  SpinToBit
 @convert.register
 def convert_sympyopt_spintobit(model: SympyOpt, converter: SpinToBit) -> SympyOpt:
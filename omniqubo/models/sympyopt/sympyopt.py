@@ -1,15 +1,82 @@
 from __future__ import annotations
 
-from typing import Dict
+from itertools import product
+from typing import Any, Container, Dict, List, Optional, Sequence, Set, Tuple, Union
 
-from sympy import Expr, Integer, S, Symbol, core, expand, total_degree
+import numpy as np
+from scipy.sparse import csr_matrix
+from sympy import Add, Expr, Integer, Mul, Pow, S, Symbol, core, expand
 
 import omniqubo.utils.utils as utils
 from omniqubo.model import MAX_SENSE, MIN_SENSE, ModelAbs
 
-from .constraints import ConstraintAbs, ConstraintEq, ConstraintIneq, _list_unknown_vars
+from .constraints import (
+    ConstraintAbs,
+    ConstraintEq,
+    ConstraintIneq,
+    LinearConstraints,
+    _list_unknown_vars,
+)
 from .utils import _approx_sympy_expr
-from .vars import BitVar, IntVar, RealVar, SpinVar, VarAbsSympyOpt
+from .vars import (
+    BIT_VTYPE,
+    SPIN_VTYPE,
+    BitVar,
+    IntVar,
+    RealVar,
+    SpinVar,
+    SympyOptVars,
+    VarAbsSympyOpt,
+)
+
+
+# computes total degree of expanded polynomial term by term, much faster than
+# sympy.total_degree which builds a dense representation of the polynomial.
+# Only the symbols named in varnames are counted, so that parameters are
+# treated as coefficients
+def _total_degree(expr: Expr, varnames: Container[str]) -> int:
+    degree = 0
+    for term in Add.make_args(expr):
+        term_degree = 0
+        for factor in Mul.make_args(term):
+            if isinstance(factor, Symbol):
+                if factor.name in varnames:
+                    term_degree += 1
+            elif isinstance(factor, Pow) and isinstance(factor.base, Symbol):
+                if factor.base.name in varnames:
+                    term_degree += int(factor.exp)
+        degree = max(degree, term_degree)
+    return degree
+
+
+# repeats a single value, or None, for each of the length variables
+def _broadcast(values: Any, length: int) -> List[Any]:
+    if values is None or np.ndim(values) == 0:
+        return [values] * length
+    return list(values)
+
+
+# names of the variables of an array, in row-major order
+def _block_names(prefix: str, shape: Tuple[int, ...]) -> List[str]:
+    if len(shape) == 1:
+        return [f"{prefix}_{i}" for i in range(shape[0])]
+    return [f"{prefix}_" + "_".join(map(str, idx)) for idx in product(*map(range, shape))]
+
+
+# cache of the degrees of the expressions after bit/spin reduction. Each
+# entry stores the variables of the expression, so that it is valid only as
+# long as these variables were not replaced. Cache is emptied when copied or
+# pickled, as then the variables are recreated
+class _DegreeCache:
+    def __init__(self) -> None:
+        self.entries = dict()  # type: Dict[Expr, Tuple[Optional[int], List[VarAbsSympyOpt]]]
+
+    def __reduce__(self) -> Tuple[type, Tuple]:
+        return _DegreeCache, ()
+
+
+# maximal number of cached expressions per expression in the model
+_DEGREE_CACHE_FACTOR = 4
 
 
 class SympyOpt(ModelAbs):
@@ -25,7 +92,10 @@ class SympyOpt(ModelAbs):
         self.constraints: Dict[str, ConstraintAbs] = dict()
         self.objective: Expr = S(0)
         self.sense = MIN_SENSE
-        self.variables: Dict[str, VarAbsSympyOpt] = dict()
+        self.variables: SympyOptVars = SympyOptVars()
+        self._degrees = _DegreeCache()
+        # names of the blocks of linear constraints, including removed ones
+        self._blocks: Set[str] = set()
 
     # saves the objective
     def _set_objective(self, obj: Expr) -> None:
@@ -60,6 +130,19 @@ class SympyOpt(ModelAbs):
         self.sense = MAX_SENSE
         self._set_objective(obj)
 
+    # checks if the name is used by a constraint or by a row of a block of
+    # linear constraints, as they share a single namespace. Blocks are added
+    # only with add_linear_constraints and converters replace them under the
+    # same name, thus only the names in self._blocks are checked
+    def _is_used_name(self, name: str) -> bool:
+        if name in self.constraints:
+            return True
+        for bname in self._blocks:
+            block = self.constraints.get(bname)
+            if isinstance(block, LinearConstraints) and name in block.names:
+                return True
+        return False
+
     def add_constraint(self, constraint: ConstraintAbs, name: str = None) -> None:
         """Add constraint to the model
 
@@ -68,15 +151,16 @@ class SympyOpt(ModelAbs):
 
         :param constraint: The constraint
         :param name: name of the constraint, defaults to random name
-        :raises ValueError: if variables are not present in the model
+        :raises ValueError: if variables are not present in the model or the
+            name is already used by a constraint or a row of linear constraints
         """
-        if name in self.constraints.keys():
+        if name is not None and self._is_used_name(name):
             raise ValueError(f"Constraint {name} already exists")
         if name is None:
             # HACK: (optional) function may check the probability of getting string,
             # and if needed increase the name length
             name = utils.gen_random_str()
-            while name in self.constraints.keys():
+            while self._is_used_name(name):
                 name = utils.gen_random_str()
         unknown_vars = constraint._list_unknown_vars(self.variables.keys())
         if len(unknown_vars) != 0:
@@ -85,6 +169,77 @@ class SympyOpt(ModelAbs):
             )
         self.constraints[name] = constraint
 
+    def add_linear_constraints(
+        self,
+        matrix: Any,
+        senses: Union[str, Sequence[str]],
+        rhs: Union[float, Sequence[float]],
+        names: Sequence[str] = None,
+        variables: Sequence[Union[str, Symbol]] = None,
+        name: str = None,
+    ) -> str:
+        """Add block of linear constraints matrix @ x (senses) rhs to the model
+
+        The rows are stored in a single LinearConstraints block, without
+        creating Sympy expressions. IneqToEq, EqToObj, RemoveConstraint,
+        RemoveTrivialConstraints, Presolve and variable replacements operate
+        on the block directly, selecting its rows by their names.
+
+        :param matrix: matrix of the coefficients, a SciPy sparse matrix,
+            a dense array or a (data, (row, col)) tuple in COO format
+        :param senses: senses of the rows, EQ_SENSE, INEQ_LEQ_SENSE or
+            INEQ_GEQ_SENSE, or a single sense for all rows
+        :param rhs: right-hand sides of the rows, or a single value for all rows
+        :param names: names of the rows, defaults to name_0, name_1, ...
+        :param variables: variables (or their names) of the columns, defaults
+            to all variables of the model in the order of creation
+        :param name: name of the block, defaults to random name
+        :raises ValueError: if variables are not present in the model, or
+            names are already used
+        :return: name of the block
+        """
+        if name is None:
+            name = utils.gen_random_str()
+            while name in self.constraints.keys():
+                name = utils.gen_random_str()
+        elif name in self.constraints.keys():
+            raise ValueError(f"Constraint {name} already exists")
+        if variables is None:
+            varnames = list(self.variables)
+        else:
+            varnames = [var if isinstance(var, str) else var.name for var in variables]
+        if isinstance(matrix, tuple):
+            # shape of COO input is given explicitly, as the last rows and
+            # columns may be empty
+            if names is not None:
+                rows_no = len(names)
+            elif np.ndim(rhs) > 0:
+                rows_no = np.size(rhs)
+            else:
+                rows_no = int(np.max(matrix[1][0], initial=-1)) + 1
+            matrix = csr_matrix(matrix, shape=(rows_no, len(varnames)), dtype=float)
+        else:
+            matrix = csr_matrix(matrix, dtype=float)
+        if names is None:
+            names = _block_names(name, (matrix.shape[0],))
+        block = LinearConstraints(matrix, varnames, senses, rhs, names)
+
+        unknown_vars = block._list_unknown_vars(self.variables.keys())
+        if unknown_vars:
+            raise ValueError(
+                f"Variables {unknown_vars[:5]} uknown. Use SympyOpt methods to define variables"
+            )
+        used = set(self.constraints.keys())
+        for bname in self._blocks:
+            c = self.constraints.get(bname)
+            if isinstance(c, LinearConstraints):
+                used.update(c.names)
+        if len(set(block.names)) != len(block) or not used.isdisjoint(block.names):
+            raise ValueError("Names of the constraints are already used")
+        self.constraints[name] = block
+        self._blocks.add(name)
+        return name
+
     def list_constraints(self) -> Dict[str, ConstraintAbs]:
         """Return the dictionary of the constraints
 
@@ -185,6 +340,67 @@ class SympyOpt(ModelAbs):
         self.variables[name] = var
         return var.var
 
+    # registers the block of new variables, returning array of their symbols
+    def _add_vars(self, variables: Sequence[VarAbsSympyOpt], shape: Tuple[int, ...]) -> np.ndarray:
+        self.variables.add_vars(variables)
+        symbols = np.empty(len(variables), dtype=object)
+        symbols[:] = [var.var for var in variables]
+        return symbols.reshape(shape)
+
+    def int_vars(
+        self,
+        names: Sequence[str],
+        lbs: Union[int, Sequence[int]] = None,
+        ubs: Union[int, Sequence[int]] = None,
+    ) -> np.ndarray:
+        """Create and return a block of integer variables
+
+        Equivalent to calling int_var for each name, but the variables are
+        registered in the model at once.
+
+        :param names: names of the variables
+        :param lbs: minimal values, or a single value for all variables,
+            defaults to -INF
+        :param ubs: maximal values, or a single value for all variables,
+            defaults to INF
+        :raises ValueError: if any name is already used or repeated
+        :return: 1D array of the Sympy variables
+        """
+        lb_list, ub_list = _broadcast(lbs, len(names)), _broadcast(ubs, len(names))
+        if not len(names) == len(lb_list) == len(ub_list):
+            raise ValueError("names, lbs and ubs have different lengths")
+        variables = [IntVar(name, lb, ub) for name, lb, ub in zip(names, lb_list, ub_list)]
+        return self._add_vars(variables, (len(variables),))
+
+    def bit_vars(self, prefix: str, shape: Union[int, Tuple[int, ...]]) -> np.ndarray:
+        """Create and return an array of binary variables
+
+        The variables are named after prefix and their indices, e.g. x_0_1 for
+        prefix x and index (0, 1), and are registered in the model at once.
+
+        :param prefix: prefix of the names of the variables
+        :param shape: shape of the array
+        :raises ValueError: if any name is already used
+        :return: array of the Sympy variables of the given shape
+        """
+        shape = tuple(np.atleast_1d(shape))
+        names = _block_names(prefix, shape)
+        return self._add_vars([BitVar(name) for name in names], shape)
+
+    def spin_vars(self, prefix: str, shape: Union[int, Tuple[int, ...]]) -> np.ndarray:
+        """Create and return an array of spin variables
+
+        The variables are named like in bit_vars.
+
+        :param prefix: prefix of the names of the variables
+        :param shape: shape of the array
+        :raises ValueError: if any name is already used
+        :return: array of the Sympy variables of the given shape
+        """
+        shape = tuple(np.atleast_1d(shape))
+        names = _block_names(prefix, shape)
+        return self._add_vars([SpinVar(name) for name in names], shape)
+
     def __eq__(self, model2) -> bool:
         """Check if two optimization models equal
 
@@ -229,11 +445,10 @@ class SympyOpt(ModelAbs):
             return expr
         if isinstance(expr, core.power.Pow):
             if isinstance(expr.exp, Integer) and expr.exp > 0 and isinstance(expr.base, Symbol):
-                name = expr.base.name
-                var = self.variables[name]
-                if isinstance(var, BitVar):
+                vtype = self.variables.get_vtype(expr.base.name)
+                if vtype == BIT_VTYPE:
                     return expr.base  # because b^n = b
-                elif isinstance(var, SpinVar):
+                elif vtype == SPIN_VTYPE:
                     if expr.exp % 2 == 0:
                         return S(1)  # because s^(2n) = 1
                     else:
@@ -254,26 +469,55 @@ class SympyOpt(ModelAbs):
     def _bitspin_simp(self, expr: Expr) -> Expr:
         expr = expand(expr)
         if isinstance(expr, core.add.Add):
-            new_expr = S(0)
-            for el in expr._args:
-                new_expr += self._bitspin_simp_rec(el)
-            return new_expr
+            # single Add call, as summing terms one by one is quadratic
+            return Add(*[self._bitspin_simp_rec(el) for el in expr._args])
         else:
             return self._bitspin_simp_rec(expr)
 
+    # returns the degree of the expression after bit/spin simplification, or
+    # None if it is not a polynomial. Results are cached, so that the
+    # expressions are expanded only once
+    def _degree(self, expr: Expr) -> Optional[int]:
+        entries = self._degrees.entries
+        if expr in entries:
+            cached, variables = entries[expr]
+            if all(self.variables.get(var.name) is var for var in variables):
+                return cached
+        variables = [self.variables[s.name] for s in expr.free_symbols if s.name in self.variables]
+        degree = None  # type: Optional[int]
+        if expr.is_polynomial():
+            degree = _total_degree(self._bitspin_simp(expr), self.variables)
+        if len(entries) >= _DEGREE_CACHE_FACTOR * (len(self.constraints) + 1):
+            entries.clear()
+        entries[expr] = (degree, variables)
+        return degree
+
     # checks if all constraints are polynomials, and checks the order
     def _are_constrs_poly(self, order=None) -> bool:
         for c in self.constraints.values():
+            if isinstance(c, LinearConstraints):
+                continue  # linear rows are polynomials of degree at most 1
             if not isinstance(c, (ConstraintEq, ConstraintIneq)):
                 return False
             for expr in [c.exprleft, c.exprright]:
-                if not expr.is_polynomial():
+                degree = self._degree(expr)
+                if degree is None:
+                    return False
+                if order is not None and degree > order:
                     return False
-                if order is not None:
-                    if total_degree(self._bitspin_simp(expr)) > order:
-                        return False
         return True
 
+    # checks if the objective is a polynomial of at most given order
+    def _is_obj_poly(self, order=None) -> bool:
+        degree = self._degree(self.objective)
+        if degree is None:
+            return False
+        return order is None or degree <= order
+
+    # checks if all variables are of the given types
+    def _are_vars(self, *vtypes: type) -> bool:
+        return self.variables.count(*vtypes) == len(self.variables)
+
     def is_ilp(self) -> bool:
         """Check if model is Integer Linear Program (ILP)
 
@@ -282,12 +526,9 @@ class SympyOpt(ModelAbs):
 
         :return: flag stating if the model is ILP
         """
-        if not all(isinstance(v, (BitVar, IntVar)) for v in self.variables.values()):
-            return False
-        if not self.objective.is_polynomial():
+        if not self._are_vars(BitVar, IntVar):
             return False
-        objective_copy = self._bitspin_simp(self.objective)
-        if total_degree(objective_copy) > 1:
+        if not self._is_obj_poly(order=1):
             return False
         if not self._are_constrs_poly(order=1):
             return False
@@ -301,12 +542,9 @@ class SympyOpt(ModelAbs):
 
         :return: flag stating if the model is QIP
         """
-        if not all(isinstance(v, (BitVar, IntVar)) for v in self.variables.values()):
+        if not self._are_vars(BitVar, IntVar):
             return False
-        if not self.objective.is_polynomial():
-            return False
-        objective_copy = self._bitspin_simp(self.objective)
-        if total_degree(objective_copy) > 2:
+        if not self._is_obj_poly(order=2):
             return False
         if not self._are_constrs_poly(order=1):
             return False
@@ -322,9 +560,9 @@ class SympyOpt(ModelAbs):
 
         :return: flag stating if the model is PIP
         """
-        if not all(isinstance(v, (BitVar, IntVar)) for v in self.variables.values()):
+        if not self._are_vars(BitVar, IntVar):
             return False
-        if not self.objective.is_polynomial():
+        if not self._is_obj_poly():
             return False
         if not self._are_constrs_poly():
             return False
@@ -338,12 +576,9 @@ class SympyOpt(ModelAbs):
 
         :return: flag stating if the model is QCQP
         """
-        if not all(isinstance(v, (BitVar, IntVar)) for v in self.variables.values()):
-            return False
-        if not self.objective.is_polynomial():
+        if not self._are_vars(BitVar, IntVar):
             return False
-        objective_copy = self._bitspin_simp(self.objective)
-        if total_degree(objective_copy) > 2:
+        if not self._is_obj_poly(order=2):
             return False
         if not self._are_constrs_poly(order=2):
             return False
@@ -356,8 +591,7 @@ class SympyOpt(ModelAbs):
 
         :return: flag stating if the model is BM
         """
-        vars = self.variables.values()
-        return all(isinstance(v, (BitVar, SpinVar)) for v in vars)
+        return self._are_vars(BitVar, SpinVar)
 
     def is_qubo(self) -> bool:
         """Check if model is Quadratic Unconstrained Binary Optimization (QUBO)
@@ -369,12 +603,9 @@ class SympyOpt(ModelAbs):
         """
         if len(self.list_constraints()) > 0:
             return False
-        if not all(isinstance(v, BitVar) for v in self.variables.values()):
+        if not self._are_vars(BitVar):
             return False
-        if not self.objective.is_polynomial():
-            return False
-        objective_copy = self._bitspin_simp(self.objective)
-        return total_degree(objective_copy) <= 2
+        return self._is_obj_poly(order=2)
 
     def is_ising(self, locality: int = None) -> bool:
         """Check if model is an Ising Model
@@ -391,12 +622,9 @@ class SympyOpt(ModelAbs):
         assert locality > 0
         if len(self.list_constraints()) > 0:
             return False
-        if not all(isinstance(v, SpinVar) for v in self.variables.values()):
-            return False
-        if not self.objective.is_polynomial():
+        if not self._are_vars(SpinVar):
             return False
-        objective_copy = self._bitspin_simp(self.objective)
-        return total_degree(objective_copy) <= locality
+        return self._is_obj_poly(order=locality)
 
     def is_hobo(self) -> bool:
         """Check if model is Higher Order Binary Optimization (HOBO)
@@ -408,6 +636,6 @@ class SympyOpt(ModelAbs):
         """
         if len(self.list_constraints()) > 0:
             return False
-        if not all(isinstance(v, BitVar) for v in self.variables.values()):
+        if not self._are_vars(BitVar):
             return False
-        return self.objective.is_polynomial()
+        return self._is_obj_poly()
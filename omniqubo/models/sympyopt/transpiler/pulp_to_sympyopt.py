@@ -1,30 +1,134 @@
-from pulp import LpProblem
+from typing import List, Union
+
+import numpy as np
+from pulp import (
+    LpConstraint,
+    LpConstraintEQ,
+    LpConstraintGE,
+    LpConstraintLE,
+    LpContinuous,
+    LpInteger,
+    LpMaximize,
+    LpProblem,
+    LpVariable,
+)
+from sympy import Add, S
 
 from omniqubo.transpiler import TranspilerAbs
 
+from ..constraints import EQ_SENSE, INEQ_GEQ_SENSE, INEQ_LEQ_SENSE
 from ..sympyopt import SympyOpt
+from ..vars import BitVar, IntVar, RealVar
+
+_SENSES = {
+    LpConstraintEQ: EQ_SENSE,
+    LpConstraintLE: INEQ_LEQ_SENSE,
+    LpConstraintGE: INEQ_GEQ_SENSE,
+}
+
+
+# constraints in the order of insertion. PuLP 3 deprecates the dictionary of
+# constraints in favour of the callable returning the list
+def _get_constraints(model: LpProblem) -> List[LpConstraint]:
+    if callable(model.constraints):
+        return model.constraints()
+    return list(model.constraints.values())
+
+
+# PuLP accepts variables with a single feasible value or no value at all,
+# while variables of SympyOpt have lb strictly smaller than ub
+def _has_empty_range(var: LpVariable) -> bool:
+    lb, ub = var.lowBound, var.upBound
+    return lb is not None and ub is not None and lb >= ub
 
 
 class PulpToSympyopt(TranspilerAbs):
     """Transpiler for transforming PuLP LpProblem into SymptOpt model
 
-    Transpiler can transform any LpProblem.
+    Transpiler can transform any LpProblem. PuLP stores binary variables as
+    integer variables with bounds 0 and 1, thus all such variables become
+    bits. All constraints of LpProblem are linear, thus they are read
+    directly from the coefficient dictionaries into a single block of linear
+    constraints, without building Sympy expressions. Variables with
+    lowBound >= upBound, including the ones with a fixed value, are not
+    supported, such variables have to be replaced with their values before
+    transpiling.
     """
 
+    def _add_variables(self, model: LpProblem, sympyopt: SympyOpt) -> List[str]:
+        variables: List[Union[BitVar, IntVar, RealVar]] = []
+        for var in model.variables():
+            if _has_empty_range(var):
+                raise ValueError(
+                    f"Variable {var.name} has bounds {var.lowBound} >= {var.upBound}, "
+                    "replace it with its value before transpiling"
+                )
+            if var.cat == LpInteger:
+                if var.lowBound == 0 and var.upBound == 1:
+                    variables.append(BitVar(var.name))
+                else:
+                    variables.append(IntVar(var.name, lb=var.lowBound, ub=var.upBound))
+            elif var.cat == LpContinuous:
+                variables.append(RealVar(var.name, lb=var.lowBound, ub=var.upBound))
+            else:
+                raise ValueError(f"Unknown category {var.cat}")  # pragma: no cover
+        sympyopt.variables.add_vars(variables)
+        return [var.name for var in variables]
+
+    def _add_objective(self, model: LpProblem, sympyopt: SympyOpt) -> None:
+        expr = S(0)
+        if model.objective is not None:
+            terms = [coeff * sympyopt.get_var(var.name) for var, coeff in model.objective.items()]
+            expr = Add(*terms, model.objective.constant)
+        if model.sense == LpMaximize:
+            sympyopt.maximize(expr)
+        else:
+            sympyopt.minimize(expr)
+
+    def _add_constraints(self, model: LpProblem, sympyopt: SympyOpt, varnames: List[str]) -> None:
+        constraints = _get_constraints(model)
+        if not constraints:
+            return
+        cols = {name: col for col, name in enumerate(varnames)}
+        data: List[float] = []
+        row_ids: List[int] = []
+        col_ids: List[int] = []
+        senses: List[str] = []
+        rhs: List[float] = []
+        for row, cstr in enumerate(constraints):
+            data.extend(cstr.values())
+            col_ids.extend(cols[var.name] for var in cstr.keys())
+            row_ids.extend([row] * len(cstr))
+            senses.append(_SENSES[cstr.sense])
+            rhs.append(-cstr.constant)
+        sympyopt.add_linear_constraints(
+            (np.array(data, dtype=float), (np.array(row_ids), np.array(col_ids))),
+            senses,
+            rhs,
+            names=[cstr.name for cstr in constraints],
+            variables=varnames,
+        )
+
     def transpile(self, model: LpProblem) -> SympyOpt:
         """Transpile LpProblem into SympyOpt model
 
         :param model: model to be transpiled
+        :raises ValueError: if lowBound >= upBound for some variable
         :return: equivalent SympyOpt model
         """
-        raise NotImplementedError()
+        sympyopt = SympyOpt()
+        varnames = self._add_variables(model, sympyopt)
+        self._add_objective(model, sympyopt)
+        self._add_constraints(model, sympyopt, varnames)
+        return sympyopt
 
-    def can_transpile(self, _: LpProblem) -> bool:
+    def can_transpile(self, model: LpProblem) -> bool:
         """Check if model can be transpiled
 
-        Currently all LpProblem can be transpiled.
+        LpProblem can be transpiled if lowBound < upBound for all its
+        variables.
 
         :type model: model to be transpiled
         :return: flag denoting if model can be transpiled
         """
-        return True
+        return not any(_has_empty_range(var) for var in model.variables())
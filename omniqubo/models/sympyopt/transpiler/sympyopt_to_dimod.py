@@ -1,9 +1,10 @@
-from typing import Dict, Union
+from typing import List, Tuple, Union
 
 import dimod
-from sympy import Expr, core
+import numpy as np
+from sympy import Add, Mul, Pow, expand
 
-from omniqubo.models.sympyopt.vars import BitVar
+from omniqubo.models.sympyopt.vars import SPIN_VTYPE, BitVar
 from omniqubo.transpiler import TranspilerAbs
 
 from ..sympyopt import MIN_SENSE, SympyOpt
@@ -27,21 +28,54 @@ class SympyOptToDimod(TranspilerAbs):
         assert mode == "dimod_bqm" or mode == "dimod_cqm"
         self.mode = mode
 
-    def _convert_monomial(self, expr: Expr, linear: Dict, quadratic: Dict) -> float:
-        # assumes expr is expanded and simplified
-        if expr.is_number:
-            return float(expr)
-        if isinstance(expr, core.symbol.Symbol):
-            linear[expr.name] = 1.0
-        if isinstance(expr, core.mul.Mul):
-            if len(expr._args) == 2:
-                if expr._args[0].is_number:
-                    linear[expr._args[1].name] = expr._args[0]
+    # computes linear biases, quadratic biases in (row, col, bias) form and
+    # offset of the objective, where variables are ordered according to their
+    # ids in order. Objective is expanded once, and powers of bits and spins
+    # are reduced on the fly, instead of building the simplified expression.
+    # Biases are collected using the ids of the variables and reordered at once
+    def _get_vectors(
+        self, model: SympyOpt, order: np.ndarray
+    ) -> Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray, np.ndarray], float]:
+        variables = model.variables
+        is_spin = variables.vtypes == SPIN_VTYPE
+        linear = np.zeros(len(is_spin))
+        rows: List[int] = []
+        cols: List[int] = []
+        biases: List[float] = []
+        offset = 0.0
+
+        for term in Add.make_args(expand(model.objective)):
+            coeff, factors = term.as_coeff_Mul()
+            idxs: List[int] = []
+            for factor in Mul.make_args(factors):
+                if factor.is_number:
+                    continue
+                elif isinstance(factor, Pow):
+                    idx = variables.get_id(factor.base.name)
+                    # s^(2n) = 1 for spins, in all other cases b^n = b
+                    if is_spin[idx] and factor.exp % 2 == 0:
+                        continue
                 else:
-                    quadratic[(expr._args[0].name, expr._args[1].name)] = 1.0
-            if len(expr._args) == 3:
-                quadratic[(expr._args[1].name, expr._args[2].name)] = expr._args[0]
-        return 0.0
+                    idx = variables.get_id(factor.name)
+                idxs.append(idx)
+
+            if len(idxs) == 0:
+                offset += float(coeff)
+            elif len(idxs) == 1:
+                linear[idxs[0]] += float(coeff)
+            else:
+                rows.append(idxs[0])
+                cols.append(idxs[1])
+                biases.append(float(coeff))
+
+        positions = np.full(len(linear), -1, dtype=np.int64)
+        positions[order] = np.arange(len(order))
+        quadratic = (
+            positions[np.array(rows, dtype=np.int64)],
+            positions[np.array(cols, dtype=np.int64)],
+            np.array(biases, dtype=float),
+        )
+        return linear[order], quadratic, offset
 
     # TODO update for CQM
     def transpile(
@@ -49,12 +83,14 @@ class SympyOptToDimod(TranspilerAbs):
     ) -> Union[dimod.BinaryQuadraticModel, dimod.ConstrainedQuadraticModel]:
         """Transpile SympyOpt model into dimod model
 
+        The model is built with dimod.BinaryQuadraticModel.from_numpy_vectors.
+        All variables of the model are included, even if they do not appear in
+        the objective function.
+
         :param model: model to be transpiled
         :return: newly constructed model
         """
         assert self.can_transpile(model)
-        obj = model.objective
-        obj = model._bitspin_simp(obj)
         if len(model.variables) == 0:
             vartype = dimod.BINARY
         else:
@@ -63,16 +99,12 @@ class SympyOptToDimod(TranspilerAbs):
                 vartype = dimod.BINARY
             else:
                 vartype = dimod.SPIN
-        linear = {}  # type: Dict
-        quadratic = {}  # type: Dict
-        offset = 0.0
 
-        if isinstance(obj, core.add.Add):
-            for el in obj._args:
-                offset += self._convert_monomial(el, linear, quadratic)
-        else:
-            offset += self._convert_monomial(obj, linear, quadratic)
-        return dimod.BinaryQuadraticModel(linear, quadratic, offset=offset, vartype=vartype)
+        labels = list(model.variables.keys())
+        linear, quadratic, offset = self._get_vectors(model, model.variables.get_ids(labels))
+        return dimod.BinaryQuadraticModel.from_numpy_vectors(
+            linear, quadratic, offset, vartype, variable_order=labels
+        )
 
     def can_transpile(self, model: SympyOpt) -> bool:
         """Check if SympyOpt can be transpiled
@@ -1,23 +1,26 @@
 from copy import deepcopy
-from typing import Union
 
-from dimod import BinaryQuadraticModel, ConstrainedQuadraticModel
-from docplex.mp.model import Model
-from pulp import LpProblem
-from qiskit.opflow import PauliSumOp
-from qiskit_optimization import QuadraticProgram
+from omniqubo.transpiler import _get_lazy_transpiler
 
 from ..sympyopt import SympyOpt
-from .dimod_to_sympyopt import DimodToSympyopt
-from .docplex_to_sympyopt import DocplexToSympyopt
-from .pulp_to_sympyopt import PulpToSympyopt
-from .qiskit_to_sympyopt import QiskitToSympyopt
 
+# transpilers are imported only if the model of given type is transpiled, so
+# that importing omniqubo does not import all the modelling frameworks
+_TRANSPILERS = [
+    ("docplex.mp.model", "Model", ".docplex_to_sympyopt", "DocplexToSympyopt"),
+    ("pulp", "LpProblem", ".pulp_to_sympyopt", "PulpToSympyopt"),
+    ("qiskit_optimization", "QuadraticProgram", ".qiskit_to_sympyopt", "QiskitToSympyopt"),
+    ("qiskit.opflow", "PauliSumOp", ".qiskit_to_sympyopt", "QiskitToSympyopt"),
+    ("dimod", "BinaryQuadraticModel", ".dimod_to_sympyopt", "DimodToSympyopt"),
+    ("dimod", "ConstrainedQuadraticModel", ".dimod_to_sympyopt", "DimodToSympyopt"),
+]
 
-def transpile(model: Union[SympyOpt, Model]) -> SympyOpt:
+
+def transpile(model) -> SympyOpt:
     """Transpile optimization problem into SympyOpt model
 
-    Only accepts SympyOpt or Docplex model.
+    Accepts SympyOpt, Docplex, PuLP, qiskit and dimod models. Third-party
+    modelling frameworks are imported only when their model is passed.
 
     :param model: model to be transpiled
     :raises ValueError: if the argument is of inappropriate type
@@ -25,13 +28,9 @@ def transpile(model: Union[SympyOpt, Model]) -> SympyOpt:
     """
     if isinstance(model, SympyOpt):
         return deepcopy(model)
-    elif isinstance(model, Model):
-        return DocplexToSympyopt().transpile(model)
-    elif isinstance(model, LpProblem):
-        return PulpToSympyopt().transpile(model)
-    elif isinstance(model, (QuadraticProgram, PauliSumOp)):
-        return QiskitToSympyopt().transpile(model)
-    elif isinstance(model, (BinaryQuadraticModel, ConstrainedQuadraticModel)):
-        return DimodToSympyopt().transpile(model)
-    else:
+    transpiler = _get_lazy_transpiler(model, _TRANSPILERS, __package__)
+    if transpiler is None:
         raise ValueError(f"Unknown model type: {type(model)}")
+    sympyopt = transpiler.transpile(model)
+    assert isinstance(sympyopt, SympyOpt)
+    return sympyopt
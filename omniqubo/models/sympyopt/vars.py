@@ -1,10 +1,16 @@
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
 from sympy import Symbol
 from sympy.core.evalf import INF
 
-from omniqubo.vars import VarAbs
+from omniqubo.vars import VarAbs, VarsDict
 
 
 class VarAbsSympyOpt(VarAbs):
+    __slots__ = ("var",)
+
     def __init__(self, name: str) -> None:
         self.var = Symbol(name)
         super().__init__(name)
@@ -21,6 +27,8 @@ class IntVar(VarAbsSympyOpt):
     :param ub: maximal value, defaults to None
     """
 
+    __slots__ = ("lb", "ub")
+
     def __init__(self, name: str, lb: int = None, ub: int = None) -> None:
         if lb is None:
             lb = -INF
@@ -63,6 +71,8 @@ class RealVar(VarAbsSympyOpt):
     :param ub: maximal value, defaults to None
     """
 
+    __slots__ = ("lb", "ub")
+
     def __init__(self, name: str, lb: float = None, ub: float = None) -> None:
         if lb is None:
             lb = -INF
@@ -100,6 +110,8 @@ class BitVar(VarAbsSympyOpt):
     :param name: name of the variable
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str) -> None:
         super().__init__(name)
 
@@ -130,6 +142,8 @@ class SpinVar(VarAbsSympyOpt):
     :param name: name of the variable
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str) -> None:
         super().__init__(name)
 
@@ -152,3 +166,165 @@ class SpinVar(VarAbsSympyOpt):
     def get_ub(self) -> int:
         """Outputs the lower bound of the variable (always 1)"""
         return 1
+
+
+# codes of the types of the variables stored in SympyOptVars.vtypes, removed
+# variables have code NO_VTYPE
+NO_VTYPE = -1
+BIT_VTYPE = 0
+SPIN_VTYPE = 1
+INT_VTYPE = 2
+REAL_VTYPE = 3
+
+_VTYPE_CODES = {BitVar: BIT_VTYPE, SpinVar: SPIN_VTYPE, IntVar: INT_VTYPE, RealVar: REAL_VTYPE}
+
+
+class SympyOptVars(VarsDict):
+    """Dictionary of SympyOpt variables with integer ids
+
+    Behaves like VarsDict, but additionally assigns to each variable an
+    integer id, and stores the types and the bounds of the variables in NumPy
+    arrays indexed with the ids. This allows converters and transpilers to
+    work on arrays instead of looking up variable objects by names.
+
+    ids are assigned consecutively in the order of insertion and are kept
+    when a variable is replaced with a variable of the same name, for example
+    one with updated bounds. ids of removed variables are not reused, and
+    their entries have type NO_VTYPE and bounds 0. Copies of the dictionary
+    keep the ids.
+
+    :param variables: initial variables, defaults to no variables
+    """
+
+    def __init__(self, variables: Mapping[str, VarAbsSympyOpt] = None) -> None:
+        self._ids: Dict[str, int] = dict()
+        self._names: List[Optional[str]] = []
+        self._vtypes = np.empty(0, dtype=np.int8)
+        self._lbs = np.empty(0)
+        self._ubs = np.empty(0)
+        super().__init__(variables)
+
+    def __setitem__(self, name: str, var: VarAbsSympyOpt) -> None:
+        super().__setitem__(name, var)
+        idx = self._ids.get(name)
+        if idx is None:
+            idx = len(self._names)
+            self._ids[name] = idx
+            self._names.append(name)
+            if idx == len(self._vtypes):
+                # arrays grow geometrically, so that adding is amortized O(1)
+                size = max(2 * idx, 8)
+                self._vtypes = np.resize(self._vtypes, size)
+                self._lbs = np.resize(self._lbs, size)
+                self._ubs = np.resize(self._ubs, size)
+        self._vtypes[idx] = _VTYPE_CODES[type(var)]
+        self._lbs[idx] = var.get_lb()
+        self._ubs[idx] = var.get_ub()
+
+    def add_vars(self, variables: Sequence[VarAbsSympyOpt]) -> None:
+        """Add new variables at once
+
+        Equivalent to setting the variables one by one, but the arrays are
+        resized and filled once for the whole block.
+
+        :param variables: variables with names not present in the dictionary
+        :raises ValueError: if any name is already used or repeated
+        """
+        names = [var.name for var in variables]
+        if len(set(names)) != len(names) or not self._ids.keys().isdisjoint(names):
+            used = [name for name, num in Counter(names).items() if num > 1 or name in self._ids]
+            raise ValueError(f"Variables {used} already exist")
+        self._vars.update(zip(names, variables))
+        for vtype, num in Counter(type(var) for var in variables).items():
+            self._counts[vtype] = self._counts.get(vtype, 0) + num
+
+        start = len(self._names)
+        end = start + len(names)
+        self._ids.update(zip(names, range(start, end)))
+        self._names.extend(names)
+        if end > len(self._vtypes):
+            size = max(2 * start, end, 8)
+            self._vtypes = np.resize(self._vtypes, size)
+            self._lbs = np.resize(self._lbs, size)
+            self._ubs = np.resize(self._ubs, size)
+        self._vtypes[start:end] = [_VTYPE_CODES[type(var)] for var in variables]
+        self._lbs[start:end] = [var.get_lb() for var in variables]
+        self._ubs[start:end] = [var.get_ub() for var in variables]
+
+    def __delitem__(self, name: str) -> None:
+        super().__delitem__(name)
+        idx = self._ids.pop(name)
+        self._names[idx] = None
+        self._vtypes[idx] = NO_VTYPE
+        self._lbs[idx] = self._ubs[idx] = 0
+
+    def __copy__(self) -> "SympyOptVars":
+        new = SympyOptVars.__new__(SympyOptVars)
+        new._vars = dict(self._vars)
+        new._counts = dict(self._counts)
+        new._ids = dict(self._ids)
+        new._names = list(self._names)
+        new._vtypes = self._vtypes.copy()
+        new._lbs = self._lbs.copy()
+        new._ubs = self._ubs.copy()
+        return new
+
+    def __repr__(self) -> str:
+        return f"SympyOptVars({self._vars})"
+
+    # read-only view of the used part of the array
+    def _view(self, arr: np.ndarray) -> np.ndarray:
+        view = arr[: len(self._names)]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def vtypes(self) -> np.ndarray:
+        """Codes of the types of the variables indexed with ids"""
+        return self._view(self._vtypes)
+
+    @property
+    def lbs(self) -> np.ndarray:
+        """Lower bounds of the variables indexed with ids"""
+        return self._view(self._lbs)
+
+    @property
+    def ubs(self) -> np.ndarray:
+        """Upper bounds of the variables indexed with ids"""
+        return self._view(self._ubs)
+
+    def get_id(self, name: str) -> int:
+        """Return the id of the variable
+
+        :param name: name of the variable
+        :return: the id
+        """
+        return self._ids[name]
+
+    def get_name(self, idx: int) -> str:
+        """Return the name of the variable of given id
+
+        :param idx: id of the variable
+        :raises KeyError: if the variable was removed
+        :return: the name
+        """
+        name = self._names[idx]
+        if name is None:
+            raise KeyError(idx)
+        return name
+
+    def get_ids(self, names: Iterable[str]) -> np.ndarray:
+        """Return the ids of the variables
+
+        :param names: names of the variables
+        :return: array of the ids
+        """
+        return np.array([self._ids[name] for name in names], dtype=np.int64)
+
+    def get_vtype(self, name: str) -> int:
+        """Return the code of the type of the variable
+
+        :param name: name of the variable
+        :return: code of the type, e.g. BIT_VTYPE
+        """
+        return self._vtypes[self._ids[name]]
@@ -1,12 +1,14 @@
+import re
 from copy import deepcopy
-from typing import Callable, List
+from typing import Callable, Iterable, Iterator, List, Mapping, Sequence, Union
 
 from pandas.core.frame import DataFrame
 
 from .constants import DEFAULT_PENALTY_VALUE
-from .converters.converter import ConverterAbs, convert, interpret
+from .converters.converter import ConverterAbs, can_convert, convert, interpret
 from .converters.eq_to_objective import EqToObj
 from .converters.ineq_to_eq import IneqToEq
+from .converters.presolve import Presolve
 from .converters.quadratize import QuadratizePyqubo
 from .converters.simple_manipulation import (
     MakeMax,
@@ -25,12 +27,20 @@ from .converters.varreplace import (
     VarBinary,
     VarOneHot,
     VarPracticalBinary,
+    VarReplace,
+    VarReplaceBatch,
 )
+from .estimate import QuboEstimate, estimate_qubo, select_encodings
 from .model import ModelAbs
+from .model_history import ModelHistory, share_model
+from .models.polyopt import converters as _polyopt_converters  # noqa: F401
+from .models.polyopt.polyopt import PolyOpt
+from .models.polyopt.transpiler.transpiler import transpile as transpile_polyopt
+from .models.sympyopt import converters as _sympyopt_converters  # noqa: F401
 from .models.sympyopt.sympyopt import SympyOpt
-from .models.sympyopt.transpiler.sympyopt_to_dimod import SympyOptToDimod
-from .models.sympyopt.transpiler.sympyopt_to_qiskit import SympyOptToQiskit
 from .models.sympyopt.transpiler.transpiler import transpile
+from .parametric import ParametricBQM
+from .profiling import Profiler
 
 
 class Omniqubo:
@@ -39,39 +49,136 @@ class Omniqubo:
     Core class of the Omniqubo package, running transpiler, conversions
     and exports of the model, and interpreting the results.
 
+    Accepted model backends are "sympyopt" (default), which stores the model
+    as Sympy expressions, and "polyopt", which stores objective and
+    constraints as sparse polynomials. The latter can represent polynomial
+    models only, but is much faster for large models.
+
     :param model: model to be converted
     :param verbatim_logs: flag for saving models produced with each step
     :param model_backend: backend used for conversion
+    :param profiler: profiler measuring each conversion step, see
+        omniqubo.profiling.Profiler, defaults to no profiling
 
     """
 
-    def __init__(self, model, verbatim_logs: bool = False, model_backend=None) -> None:
-        self.orig_model = deepcopy(model)
+    def __init__(
+        self, model, verbatim_logs: bool = False, model_backend=None, profiler: Profiler = None
+    ) -> None:
         if model_backend is None or model_backend == "sympyopt":
-            self.model = transpile(self.orig_model)  # type: ModelAbs
+            self.model = transpile(model)  # type: ModelAbs
+        elif model_backend == "polyopt":
+            self.model = transpile_polyopt(model)
         else:
             raise ValueError(f"Unknown backend {model_backend}")  # pragma: no cover
+
+        # transpiling the model of the backend type already copies it, thus
+        # the original model can share its elements with the transpiled one
+        if type(model) is type(self.model):
+            self.orig_model = share_model(self.model)
+        else:
+            self.orig_model = deepcopy(model)
         self.logs = []  # type: List[ConverterAbs]
-        self.model_logs = []  # type: List[ModelAbs]
+        self.model_logs = ModelHistory()
         self.verbatim_logs = verbatim_logs
+        self.profiler = profiler
         if self.verbatim_logs:
-            self.model_logs.append(deepcopy(self.model))
+            self.model_logs.append(self.model)
 
     def convert(self, convstep: ConverterAbs):
         """Apply the conversion on the model
 
-        Conversion step are logged, and if varbatim_logs is true, then copy of
-        updated model is stored in self.model_logs.
+        Conversion step are logged, and if varbatim_logs is true, then updated
+        model is stored in self.model_logs. Only the changes with respect to
+        the previous model are stored, and the model of any step can be
+        reconstructed with self.model_logs[step]. If profiler was provided,
+        the conversion is measured with it.
 
         :param convstep: Chosen conversion method
         :return: updated model
         """
         self.logs.append(convstep)
-        self.model = convert(self.model, convstep)
+        if self.profiler is None:
+            self.model = convert(self.model, convstep)
+        else:
+            self.model = self.profiler.convert(self.model, convstep, len(self.logs) - 1)
         if self.verbatim_logs:
-            self.model_logs.append(deepcopy(self.model))
+            self.model_logs.append(self.model)
+        return self.model
+
+    def convert_fused(self, convsteps: Sequence[ConverterAbs]) -> ModelAbs:
+        """Apply several conversions, fusing the substitutions of variables
+
+        Conversion steps are applied in the given order and logged
+        individually, as with convert. Consecutive VarReplace converters
+        supported by the backend are applied together with VarReplaceBatch,
+        which substitutes the variables in a single pass over the objective
+        and constraints instead of a pass for each converter. If verbatim_logs
+        is true or profiler was provided, the steps are applied one by one, so
+        that each of them can be stored or measured.
+
+        :param convsteps: Chosen conversion methods
+        :return: updated model
+        """
+        if self.verbatim_logs or self.profiler is not None:
+            for convstep in convsteps:
+                self.convert(convstep)
+            return self.model
+
+        fused = []  # type: List[VarReplace]
+        for convstep in convsteps:
+            if isinstance(convstep, VarReplace) and can_convert(
+                self.model, VarReplaceBatch([convstep])
+            ):
+                fused.append(convstep)
+                continue
+            self._convert_varreplace(fused)
+            fused = []
+            self.convert(convstep)
+        self._convert_varreplace(fused)
         return self.model
 
+    # applies VarReplace converters with a single substitution, logging each
+    # of them for interpret
+    def _convert_varreplace(self, convsteps: List[VarReplace]) -> None:
+        if len(convsteps) == 1:
+            self.convert(convsteps[0])
+        elif convsteps:
+            self.logs.extend(convsteps)
+            self.model = convert(self.model, VarReplaceBatch(convsteps))
+
+    @staticmethod
+    def convert_batch(
+        models: Iterable,
+        recipe: Sequence[ConverterAbs],
+        export_mode: str = None,
+        model_backend: str = None,
+        processes: int = None,
+        max_pending: int = None,
+    ) -> Iterator:
+        """Convert many models with the same recipe across a process pool
+
+        Each model is converted in a separate Omniqubo object with converters
+        from recipe, and exported if export_mode is provided. Results are
+        yielded as BatchResult objects as soon as they are completed. Each
+        of them stores the index of the model, resulting model and the
+        picklable converters, which can be used to interpret the samples.
+        See omniqubo.batch.convert_batch for details.
+
+        :param models: models to be converted
+        :param recipe: converters applied on each model
+        :param export_mode: mode of the export, defaults to no export
+        :param model_backend: backend used for conversion
+        :param processes: number of worker processes, defaults to number of
+            CPUs, 0 converts the models in the current process
+        :param max_pending: maximal number of models submitted to the pool at
+            once, defaults to twice the number of processes
+        :return: iterator over the results
+        """
+        from .batch import convert_batch
+
+        return convert_batch(models, recipe, export_mode, model_backend, processes, max_pending)
+
     def interpret(self, samples: DataFrame) -> DataFrame:
         """Interpret optimization results
 
@@ -94,6 +201,29 @@ class Omniqubo:
             samples = interpret(samples, converter)
         return samples
 
+    def interpret_chunks(
+        self, samples, chunksize: int = None, columns: List[str] = None
+    ) -> Iterator[DataFrame]:
+        """Interpret optimization results chunk by chunk
+
+        Works as interpret, but samples are split into chunks of at most
+        chunksize rows, which are interpreted and yielded one by one. Thus
+        only a single chunk is kept in the memory at once. Accepted samples
+        are DataFrame, two-dimensional NumPy array (then columns have to be
+        provided), dimod SampleSet, or an iterable of any of them, for
+        example a generator reading the samples from a file.
+
+        :param samples: samples to be interpreted
+        :param chunksize: maximal number of rows in the chunk, defaults to
+            not splitting the samples
+        :param columns: names of the columns of NumPy arrays
+        :return: iterator over interpreted chunks with "feasible" flag
+        """
+        from .sampleset._chunks import iter_chunks
+
+        for chunk in iter_chunks(samples, chunksize, columns):
+            yield self.interpret(chunk)
+
     def to_qubo(self, penalty: float, quadratization_strength: float) -> ModelAbs:
         """Transform PIP into QUBO
 
@@ -130,6 +260,25 @@ class Omniqubo:
         self.spin_to_bit(".*")
         return self.model
 
+    def estimate(
+        self, mode: Union[str, Mapping[str, str]] = "binary", penalty: float = None
+    ) -> QuboEstimate:
+        """Estimate the size of the QUBO without converting the model
+
+        Predicts the number of binary variables, the number and density of
+        quadratic terms and the range of the coefficients of the QUBO produced
+        by transforming inequalities into equalities, encoding integer
+        variables, and shifting equalities into the objective. The model is not
+        changed. mode is either "binary" or "one-hot" and is used for all
+        integer variables, or a dictionary mapping names of the variables into
+        the encodings. Missing variables are encoded with "binary".
+
+        :param mode: encoding of the integer variables
+        :param penalty: penalty used for shifting equalities
+        :return: estimate of the QUBO, see omniqubo.estimate.QuboEstimate
+        """
+        return estimate_qubo(self.model, mode, penalty)
+
     def export(self, mode: str):
         """Export the model
 
@@ -143,15 +292,39 @@ class Omniqubo:
         :raises ValueError: if unknown mode
         :return: return the transpiled model
         """
+        # exporting transpilers are imported here, so that dimod and qiskit
+        # are imported only if needed
         if mode == "dimod_bqm" or mode == "dimod_cqm":
             if isinstance(self.model, SympyOpt):  # HACK
+                from .models.sympyopt.transpiler.sympyopt_to_dimod import SympyOptToDimod
+
                 return SympyOptToDimod(mode).transpile(self.model)
+            elif isinstance(self.model, PolyOpt):
+                from .models.polyopt.transpiler.polyopt_to_dimod import PolyOptToDimod
+
+                return PolyOptToDimod(mode).transpile(self.model)
         elif mode == "qiskit_qp" or mode == "qiski_pso":
             if isinstance(self.model, SympyOpt):  # HACK
+                from .models.sympyopt.transpiler.sympyopt_to_qiskit import SympyOptToQiskit
+
                 return SympyOptToQiskit(mode).transpile(self.model)
         else:
             raise ValueError(f"Unknown mode {mode}")  # pragma: no cover
 
+    def export_parametric(self) -> ParametricBQM:
+        """Export the model with symbolic parameters
+
+        Model, which penalties were given as parameters (see
+        omniqubo.parametric.parameter), is exported once into a form which
+        allows to create dimod.BinaryQuadraticModel for any values of the
+        parameters with ParametricBQM.bind. Samples of each of the models can
+        be interpreted with interpret. Only "sympyopt" backend supports
+        parameters.
+
+        :return: model with parameters
+        """
+        return ParametricBQM(self.model)
+
     def quadratize(self, quadratization_strength: float) -> ModelAbs:
         """Quadratize HOBO using pyqubo package
 
@@ -216,7 +389,10 @@ class Omniqubo:
         look for the constraint with such name explicitly.
 
         Inequality P(x) <= Q(x) is removed if max P(x) <= min Q(x), similarly for
-        >= inequality.
+        >= inequality. Equality P(x) == Q(x) is removed if P(x) - Q(x) is always
+        0. If some constraint can never be satisfied, ValueError is raised.
+        Removing trivial constraints is supported only by the sympyopt
+        backend.
 
         :param names: names of the remove constraints
         :param is_regexp: specifies if names should be treated as regular expression
@@ -225,6 +401,29 @@ class Omniqubo:
         self.convert(RemoveTrivialConstraints(names, is_regexp))
         return self.model
 
+    def presolve(self, names: str = ".*", is_regexp: bool = True, max_iter: int = 10) -> ModelAbs:
+        """Reduce the model using its linear constraints
+
+        If is_regexp is True, then names is considered to be a regular
+        expression with convention from re package. Otherwise, converter will
+        look for the constraint with such name explicitly.
+
+        Bounds of the integer variables are tightened using the linear
+        constraints, at most max_iter times, which reduces the number of bits
+        needed to encode them. Variables with a single feasible value are
+        replaced with this value. Constraints which always hold, duplicated
+        and dominated constraints are removed. If some constraint can never be
+        satisfied, ValueError is raised. Presolve is supported only by the
+        sympyopt backend.
+
+        :param names: names of the used constraints
+        :param is_regexp: specifies if names should be treated as regular expression
+        :param max_iter: maximal number of rounds of bound tightening
+        :return: updated model
+        """
+        self.convert(Presolve(names, is_regexp, max_iter))
+        return self.model
+
     def eq_to_obj(self, names: str, is_regexp: bool = True, penalty: float = None) -> ModelAbs:
         """Shift equality constraints to objective function
 
@@ -233,7 +432,9 @@ class Omniqubo:
         look for the constraint with such name explicitly. penalty should be
         sufficiently big nonnegative number. 0 penalty is allowed, but means
         that equality constraints will be ignored (equivalent to
-        rm_constraints) except feasibility will always be checked.
+        rm_constraints) except feasibility will always be checked. penalty can
+        also be a parameter created with omniqubo.parametric.parameter, see
+        export_parametric.
 
         :param names: names of shifted constraints
         :param is_regexp: specifies if names should be treated as regular expression
@@ -284,18 +485,63 @@ class Omniqubo:
         :raises ValueError: if mode value is not known
         :return: updated model
         """
+        convsteps = []  # type: List[ConverterAbs]
         if trivial_conv:
-            self.convert(TrivialIntToBit(names, is_regexp))
+            convsteps.append(TrivialIntToBit(names, is_regexp))
 
         if mode == "one-hot":
-            self.convert(VarOneHot(names, is_regexp))
+            convsteps.append(VarOneHot(names, is_regexp))
         elif mode == "binary":
-            self.convert(VarBinary(names, is_regexp))
+            convsteps.append(VarBinary(names, is_regexp))
         elif mode == "practical-binary":
-            self.convert(VarPracticalBinary(names, is_regexp, ub=kwargs["ub"]))
+            convsteps.append(VarPracticalBinary(names, is_regexp, ub=kwargs["ub"]))
         else:
             raise ValueError("Uknown mode {mode}")  # pragma: no cover
-        return self.model
+        return self.convert_fused(convsteps)
+
+    def auto_int_to_bits(
+        self,
+        names: str = ".*",
+        is_regexp: bool = True,
+        max_binaries: int = None,
+        max_density: float = None,
+        trivial_conv: bool = True,
+    ) -> ModelAbs:
+        """Convert integer variables to expression over bits with chosen encodings
+
+        If is_regexp is True, then names is considered to be a regular
+        expression with convention from re package. Otherwise, converter will
+        look for variables with such name explicitly. For each integer
+        variable "one-hot" or "binary" encoding is chosen, so that the final
+        QUBO has at most max_binaries binary variables and density of the
+        quadratic terms at most max_density, and the number of its quadratic
+        terms is minimal, see omniqubo.estimate.select_encodings. Variables of
+        each encoding are then converted in a single step. trivial_conv is
+        used as in int_to_bits.
+
+        :param names: names of converted variables
+        :param is_regexp: specifies if names should be treated as regular expression
+        :param max_binaries: maximal number of binary variables of the QUBO
+        :param max_density: maximal density of the quadratic terms of the QUBO
+        :param trivial_conv: specify the 2-range integer variable conversion behavior
+        :raises ValueError: if no encodings satisfying the limits were found
+        :return: updated model
+        """
+        if trivial_conv:
+            self.convert(TrivialIntToBit(names, is_regexp))
+
+        if is_regexp:
+            _rex = re.compile(names)
+            varnames = [vname for vname in self.model.variables if _rex.fullmatch(vname)]
+        else:
+            varnames = [names]
+        modes = select_encodings(self.model, varnames, max_binaries, max_density)
+        convsteps = []  # type: List[ConverterAbs]
+        for mode, converter in (("one-hot", VarOneHot), ("binary", VarBinary)):
+            selected = [vname for vname, vmode in modes.items() if vmode == mode]
+            if selected:
+                convsteps.append(converter("|".join(map(re.escape, selected)), True))
+        return self.convert_fused(convsteps)
 
     def int_to_value(self, names: str, value: int, is_regexp: bool = True) -> ModelAbs:
         """Set value to a variable
@@ -0,0 +1,101 @@
+from typing import Any, Dict, List, Set
+
+import numpy as np
+from sympy import Add, Expr, S, Symbol, expand
+
+from .model import ModelAbs
+from .model_history import share_model
+from .models.sympyopt.sympyopt import SympyOpt
+
+
+def parameter(name: str) -> Symbol:
+    """Create a symbolic parameter
+
+    Parameter can be used instead of a numeric penalty, for example in
+    Omniqubo.eq_to_obj. Model with parameters can be exported once with
+    Omniqubo.export_parametric, and then instantiated for many values of the
+    parameters. Parameters are nonnegative.
+
+    :param name: name of the parameter, different from names of the variables
+    :return: the parameter
+    """
+    return Symbol(name, nonnegative=True)
+
+
+# returns the parameters, i.e. symbols of the objective which are not variables
+def _get_parameters(model: SympyOpt) -> Set[Symbol]:
+    variables = {var.var for var in model.variables.values()}
+    return {s for s in model.objective.free_symbols if s not in variables}
+
+
+# splits objective affine in params into obj_0 + sum_p p * obj_p. Returns
+# dictionary mapping parameters into obj_p, with 1 mapped into obj_0
+def _split_objective(objective: Expr, params: Set[Symbol]) -> Dict[Expr, Expr]:
+    parts: Dict[Expr, List[Expr]] = {S.One: []}
+    for term in Add.make_args(expand(objective)):
+        rest, param = term.as_independent(*params, as_Add=False)
+        if param != S.One and param not in params:
+            raise ValueError(f"Objective is not affine in the parameters, term {term} found")
+        parts.setdefault(param, []).append(rest)
+    return {param: Add(*terms) for param, terms in parts.items()}
+
+
+class ParametricBQM:
+    """Binary Quadratic Model with symbolic parameters
+
+    The objective of the model is stored as obj_0 + sum_p p * obj_p, where
+    p are the parameters. Each obj_p is exported once into the NumPy vectors
+    of dimod.BinaryQuadraticModel, thus the model for given values of the
+    parameters is built with a few vector operations only, without repeating
+    the conversion.
+
+    :param model: SympyOpt model which objective is affine in the parameters
+    """
+
+    def __init__(self, model: ModelAbs) -> None:
+        from .models.sympyopt.transpiler.sympyopt_to_dimod import SympyOptToDimod
+
+        if not isinstance(model, SympyOpt):
+            raise ValueError("Parameters are supported only by the sympyopt backend")
+        params = _get_parameters(model)
+        self.params = sorted(p.name for p in params)
+        self.labels = list(model.variables.keys())
+        # linear biases, quadratic biases (rows, columns, values) and offset
+        # of the components, the constant component is indexed by empty string
+        self._vectors: Dict[str, Any] = dict()
+        for param, objective in _split_objective(model.objective, params).items():
+            component = share_model(model)
+            component.objective = objective
+            bqm = SympyOptToDimod("dimod_bqm").transpile(component)
+            self.vartype = bqm.vartype
+            key = "" if param == S.One else str(param)
+            self._vectors[key] = bqm.to_numpy_vectors(variable_order=self.labels)
+
+    def bind(self, **values: float):
+        """Create the model for the given values of the parameters
+
+        The model contains all interactions present in any of the components,
+        even if their bias is zero for the given values.
+
+        :param values: values of all the parameters
+        :raises ValueError: if the values do not match the parameters
+        :return: dimod.BinaryQuadraticModel for the given values
+        """
+        from dimod import BinaryQuadraticModel
+
+        if sorted(values) != self.params:
+            raise ValueError(f"Values for exactly the parameters {self.params} required")
+        linear = np.zeros(len(self.labels))
+        rows, cols, biases = [], [], []
+        offset = 0.0
+        for key, (ldata, (irow, icol, qdata), off) in self._vectors.items():
+            scale = values[key] if key else 1.0
+            linear += scale * ldata
+            rows.append(irow)
+            cols.append(icol)
+            biases.append(scale * qdata)
+            offset += scale * off
+        quadratic = (np.concatenate(rows), np.concatenate(cols), np.concatenate(biases))
+        return BinaryQuadraticModel.from_numpy_vectors(
+            linear, quadratic, offset, self.vartype, variable_order=self.labels
+        )
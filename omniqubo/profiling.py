@@ -0,0 +1,168 @@
+import logging
+import tracemalloc
+from contextlib import nullcontext
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+
+from sympy import Add
+
+from .converters.converter import ConverterAbs, convert
+from .model import ModelAbs
+from .models.polyopt.poly import Poly
+
+logger = logging.getLogger(__name__)
+
+
+# returns number of variables, constraints and terms of the objective
+def _model_size(model: ModelAbs) -> Dict[str, int]:
+    if isinstance(model.objective, Poly):
+        terms = len(model.objective.terms)
+    else:
+        terms = len(Add.make_args(model.objective))
+    return {
+        "variables": len(model.variables),
+        "constraints": len(model.constraints),
+        "objective_terms": terms,
+    }
+
+
+class ConversionProfile:
+    """Cost of a single conversion step
+
+    Stores the wall time of the conversion, the peak memory allocated during
+    the conversion (None if memory was not traced), and the sizes of the model
+    before and after the conversion, i.e. the number of variables,
+    constraints and terms of the objective.
+
+    :param step: index of the converter in Omniqubo.logs
+    :param converter: name of the converter class
+    """
+
+    def __init__(self, step: int, converter: str) -> None:
+        self.step = step
+        self.converter = converter
+        self.wall_time = 0.0
+        self.peak_memory: Optional[int] = None
+        self.before: Dict[str, int] = dict()
+        self.after: Dict[str, int] = dict()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the profile as a flat dictionary
+
+        Sizes of the model are stored with keys prefixed with "before_" and
+        "after_".
+
+        :return: dictionary with the profile
+        """
+        data: Dict[str, Any] = {
+            "step": self.step,
+            "converter": self.converter,
+            "wall_time": self.wall_time,
+            "peak_memory": self.peak_memory,
+        }
+        data.update({f"before_{key}": val for key, val in self.before.items()})
+        data.update({f"after_{key}": val for key, val in self.after.items()})
+        return data
+
+    def __repr__(self) -> str:
+        return f"ConversionProfile({self.as_dict()})"
+
+
+class Profiler:
+    """Profiler of the conversion steps
+
+    Passed to Omniqubo, the profiler measures each conversion step and stores
+    the ConversionProfile in self.profiles. Each profile is logged with
+    DEBUG level by the "omniqubo.profiling" logger, with the dictionary of
+    the profile in the "omniqubo_profile" attribute of the log record, and
+    passed to callback if provided.
+
+    If span is provided, each conversion is run in the context manager
+    span(name), where name is "omniqubo.convert.<converter>". For example
+    tracer.start_as_current_span of OpenTelemetry can be used. If the value
+    of the context manager has set_attribute method, the entries of the
+    profile are set as attributes.
+
+    .. note::
+        Memory is traced with tracemalloc, which slows down the conversion
+        significantly. Set memory to False for timing only. If tracemalloc
+        is already tracing, the tracing is kept running. On Python older than
+        3.9, the peak memory is then not measured and stays None, as the peak
+        can be reset only by restarting the tracing, which would discard the
+        traces.
+
+    :param memory: flag for tracing the peak memory, defaults to True
+    :param callback: function called with each profile
+    :param span: function creating context manager for each conversion
+    """
+
+    def __init__(
+        self,
+        memory: bool = True,
+        callback: Callable[[ConversionProfile], Any] = None,
+        span: Callable[[str], ContextManager] = None,
+    ) -> None:
+        self.memory = memory
+        self.callback = callback
+        self.span = span
+        self.profiles: List[ConversionProfile] = []
+
+    def convert(self, model: ModelAbs, converter: ConverterAbs, step: int) -> ModelAbs:
+        """Apply the converter on the model and profile it
+
+        :param model: converted model
+        :param converter: applied converter
+        :param step: index of the converter in Omniqubo.logs
+        :return: updated model
+        """
+        profile = ConversionProfile(step, type(converter).__name__)
+        profile.before = _model_size(model)
+        name = f"omniqubo.convert.{profile.converter}"
+        span: ContextManager[Any] = nullcontext() if self.span is None else self.span(name)
+        with span as span_obj:
+            model = self._measure(model, converter, profile)
+            profile.after = _model_size(model)
+            if hasattr(span_obj, "set_attribute"):
+                for key, val in profile.as_dict().items():
+                    if val is not None:
+                        span_obj.set_attribute(f"omniqubo.{key}", val)
+
+        self.profiles.append(profile)
+        logger.debug(
+            "conversion step %d (%s) took %.6f s",
+            profile.step,
+            profile.converter,
+            profile.wall_time,
+            extra={"omniqubo_profile": profile.as_dict()},
+        )
+        if self.callback is not None:
+            self.callback(profile)
+        return model
+
+    # runs the conversion, storing wall time and peak memory in the profile.
+    # If memory is already traced, tracing is not stopped afterwards
+    def _measure(
+        self, model: ModelAbs, converter: ConverterAbs, profile: ConversionProfile
+    ) -> ModelAbs:
+        started = measured = False
+        if self.memory:
+            # reset_peak is available since Python 3.9. Before, the peak of
+            # tracing started by the caller is not measured, as restarting
+            # the tracing would discard the traces of the caller
+            started = not tracemalloc.is_tracing()
+            measured = started or hasattr(tracemalloc, "reset_peak")
+            if started:
+                tracemalloc.start()
+            elif measured:
+                tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = perf_counter()
+        try:
+            model = convert(model, converter)
+        finally:
+            profile.wall_time = perf_counter() - start
+            if measured:
+                profile.peak_memory = tracemalloc.get_traced_memory()[1] - base
+            if started:
+                tracemalloc.stop()
+        return model
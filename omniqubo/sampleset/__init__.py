@@ -1,3 +1,4 @@
+from ._chunks import iter_chunks
 from ._dimod_import import dimod_import
 
-__all__ = ["dimod_import"]
+__all__ = ["dimod_import", "iter_chunks"]
@@ -0,0 +1,76 @@
+import sys
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+
+# checks if source is a dimod SampleSet. dimod is not imported if it was not
+# imported before, as SampleSet could not be created otherwise
+def _is_sampleset(source: Any) -> bool:
+    if "dimod" not in sys.modules:
+        return False
+    return isinstance(source, sys.modules["dimod"].SampleSet)
+
+
+# yields row ranges [start, end) of at most chunksize rows
+def _row_ranges(nrows: int, chunksize: Optional[int]) -> Iterator[Tuple[int, int]]:
+    if chunksize is None:
+        chunksize = max(nrows, 1)
+    assert chunksize > 0
+    for start in range(0, nrows, chunksize):
+        yield start, min(start + chunksize, nrows)
+
+
+# splits dimod SampleSet into DataFrames of the same form as produced by
+# SampleSet.to_pandas_dataframe
+def _sampleset_chunks(sampleset: Any, chunksize: Optional[int]) -> Iterator[DataFrame]:
+    record = sampleset.record
+    labels = list(sampleset.variables)
+    vectors = [name for name in record.dtype.names if name != "sample" and record[name].ndim == 1]
+    for start, end in _row_ranges(len(record), chunksize):
+        part = record[start:end]
+        chunk = DataFrame(part.sample, columns=labels, index=range(start, end))
+        for name in vectors:
+            chunk[name] = part[name]
+        yield chunk
+
+
+def iter_chunks(
+    source: Any, chunksize: int = None, columns: List[str] = None
+) -> Iterator[DataFrame]:
+    """Split samples into DataFrame chunks
+
+    Accepted sources are DataFrame, two-dimensional NumPy array (then columns
+    have to be provided), dimod SampleSet, or an iterable of any of them.
+    Each DataFrame, array or SampleSet is split into chunks of at most
+    chunksize rows. If chunksize is None, they are not split. Chunks of an
+    iterable are indexed consecutively across all of its elements.
+
+    :param source: samples to be split
+    :param chunksize: maximal number of rows in the chunk, defaults to None
+    :param columns: names of the columns of NumPy arrays, defaults to None
+    :raises ValueError: if columns are not provided for NumPy arrays
+    :raises TypeError: if source is of unknown type
+    :return: iterator over the chunks
+    """
+    if isinstance(source, DataFrame):
+        for start, end in _row_ranges(source.shape[0], chunksize):
+            yield source.iloc[start:end].copy()
+    elif isinstance(source, np.ndarray):
+        if columns is None:
+            raise ValueError("Names of the columns are required for NumPy arrays")
+        for start, end in _row_ranges(source.shape[0], chunksize):
+            yield DataFrame(source[start:end], columns=columns, index=range(start, end))
+    elif _is_sampleset(source):
+        yield from _sampleset_chunks(source, chunksize)
+    elif isinstance(source, Iterable) and not isinstance(source, str):
+        # chunks of all parts are numbered with a single running index
+        offset = 0
+        for part in source:
+            for chunk in iter_chunks(part, chunksize, columns):
+                chunk.index = range(offset, offset + chunk.shape[0])
+                offset += chunk.shape[0]
+                yield chunk
+    else:
+        raise TypeError(f"Cannot split samples of type {type(source)}")
@@ -1,8 +1,12 @@
-from dimod import SampleSet
+from typing import TYPE_CHECKING
+
 from pandas import DataFrame
 
+if TYPE_CHECKING:  # pragma: no cover
+    from dimod import SampleSet
+
 
-def dimod_import(data: SampleSet) -> DataFrame:
+def dimod_import(data: "SampleSet") -> DataFrame:
     """Transforms SampleSet of dimod into DataFrame
 
     The DataFrame also consist of extra column "feasible", set to True for all
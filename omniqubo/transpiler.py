@@ -1,7 +1,14 @@
+import sys
 from abc import ABC, abstractmethod
+from importlib import import_module
+from typing import Iterable, Optional, Tuple
 
 from .model import ModelAbs
 
+# entry of a lazy transpiler registry: module and class name of the model type,
+# followed by module and class name of the transpiler
+LazyTranspilerEntry = Tuple[str, str, str, str]
+
 
 class TranspilerAbs(ABC):
     """Abstract Transpiler class
@@ -30,3 +37,27 @@ class TranspilerAbs(ABC):
         :return: flag denoting if model can be transpiled
         """
         pass
+
+
+def _get_lazy_transpiler(
+    model, registry: Iterable[LazyTranspilerEntry], package: str = None
+) -> Optional[TranspilerAbs]:
+    """Find the transpiler for the model in the lazy registry
+
+    Model types are checked only for the modules which are already imported,
+    as otherwise the model cannot be an instance of the class defined in
+    there. Thus third-party modelling frameworks and the transpilers are
+    imported only when the model of their type is passed.
+
+    :param model: model to be transpiled
+    :param registry: entries of the lazy registry
+    :param package: package used for relative transpiler modules
+    :return: transpiler instance, or None if model type is not in the registry
+    """
+    for model_module, model_class, transpiler_module, transpiler_class in registry:
+        module = sys.modules.get(model_module)
+        if module is None or not isinstance(model, getattr(module, model_class)):
+            continue
+        transpiler = getattr(import_module(transpiler_module, package), transpiler_class)
+        return transpiler()
+    return None
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, Mapping, MutableMapping
 
 
 class VarAbs(ABC):
@@ -9,6 +10,8 @@ class VarAbs(ABC):
     :param name: name of the variable
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         self.name = name
 
@@ -19,3 +22,63 @@ class VarAbs(ABC):
     @abstractmethod
     def get_ub(self):
         pass
+
+
+class VarsDict(MutableMapping):
+    """Dictionary of variables keeping the number of variables of each type
+
+    Behaves like a dictionary mapping names into variables, but additionally
+    updates the number of variables of each type on every modification. This
+    makes checking the types of all variables in the model independent of the
+    number of variables.
+
+    :param variables: initial variables, defaults to no variables
+    """
+
+    def __init__(self, variables: Mapping[str, Any] = None) -> None:
+        self._vars: Dict[str, Any] = dict()
+        self._counts: Dict[type, int] = dict()
+        if variables is not None:
+            self.update(variables)
+
+    # updates the number of variables of type of var by diff
+    def _count(self, var: Any, diff: int) -> None:
+        vtype = type(var)
+        self._counts[vtype] = self._counts.get(vtype, 0) + diff
+        if self._counts[vtype] == 0:
+            del self._counts[vtype]
+
+    def __getitem__(self, name: str) -> Any:
+        return self._vars[name]
+
+    def __setitem__(self, name: str, var: Any) -> None:
+        if name in self._vars:
+            self._count(self._vars[name], -1)
+        self._vars[name] = var
+        self._count(var, 1)
+
+    def __delitem__(self, name: str) -> None:
+        self._count(self._vars.pop(name), -1)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._vars
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._vars)
+
+    def __len__(self) -> int:
+        return len(self._vars)
+
+    def __copy__(self) -> "VarsDict":
+        return VarsDict(self)
+
+    def __repr__(self) -> str:
+        return f"VarsDict({self._vars})"
+
+    def count(self, *vtypes: type) -> int:
+        """Return the number of variables being instances of the given types
+
+        :param vtypes: types of the variables
+        :return: the number of such variables
+        """
+        return sum(num for vtype, num in self._counts.items() if issubclass(vtype, vtypes))
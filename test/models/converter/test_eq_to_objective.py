@@ -1,6 +1,7 @@
 import warnings
 
 import pytest
+from sympy import Add, Pow, Rational, expand
 
 from omniqubo.converters.eq_to_objective import EqToObj
 from omniqubo.models.sympyopt.constraints import ConstraintEq
@@ -55,3 +56,56 @@ class TestEqToObj:
             2 * x - 3 * y + 2 - 10 * (2 * x - 3 * y - 3) ** 2 - 3.5 * (2 * x ** 2 - 3 * y) ** 2
         )
         assert sympyopt2 == sympyopt
+
+    def test_bits_reduced(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.bit_var(name="x")
+        y = sympyopt.bit_var(name="y")
+        z = sympyopt.bit_var(name="z")
+        sympyopt.minimize(x + z)
+        sympyopt.add_constraint(ConstraintEq(x + y, 1), name="c1")
+        sympyopt.add_constraint(ConstraintEq(y + z, 1), name="c2")
+        sympyopt = convert(sympyopt, EqToObj(".*", True, 2))
+
+        # penalties are accumulated with b^2 = b, so no powers are left
+        assert not sympyopt.objective.atoms(Pow)
+        sympyopt2 = SympyOpt()
+        x = sympyopt2.bit_var(name="x")
+        y = sympyopt2.bit_var(name="y")
+        z = sympyopt2.bit_var(name="z")
+        sympyopt2.minimize(x + z + 2 * (2 * x * y + 2 * y * z - x - 2 * y - z + 2))
+        assert sympyopt2 == sympyopt
+
+    def test_linear_mixed_vars(self):
+        sympyopt = SympyOpt()
+        b = sympyopt.bit_var(name="b")
+        s = sympyopt.spin_var(name="s")
+        x = sympyopt.int_var(name="x", lb=0, ub=2)
+        sympyopt.minimize(b + x)
+        sympyopt.add_constraint(ConstraintEq(2 * b - s + x, 1), name="c1")
+        sympyopt.add_constraint(ConstraintEq(b * x + s, 1), name="c2")
+        sympyopt = convert(sympyopt, EqToObj(".*", True, 3))
+
+        sympyopt2 = SympyOpt()
+        b = sympyopt2.bit_var(name="b")
+        s = sympyopt2.spin_var(name="s")
+        x = sympyopt2.int_var(name="x", lb=0, ub=2)
+        penalty = (2 * b - s + x - 1) ** 2 + (b * x + s - 1) ** 2
+        sympyopt2.minimize(b + x + 3 * sympyopt2._bitspin_simp(penalty))
+        assert sympyopt2 == sympyopt
+
+    def test_exact_coefficients(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.bit_var(name="x")
+        y = sympyopt.bit_var(name="y")
+        z = sympyopt.int_var(name="z", lb=0, ub=3)
+        sympyopt.add_constraint(ConstraintEq(x + y, 1), name="c1")
+        sympyopt.add_constraint(ConstraintEq(x / 3 + z / 2, Rational(2, 7)), name="c2")
+        sympyopt = convert(sympyopt, EqToObj("c1", False, 3))
+        assert sympyopt.objective == 6 * x * y - 3 * x - 3 * y + 3
+
+        sympyopt = convert(sympyopt, EqToObj("c2", False, 3))
+        for term in Add.make_args(sympyopt.objective):
+            assert term.as_coeff_Mul()[0].is_Rational
+        expected = 3 * (x + y - 1) ** 2 + 3 * (x / 3 + z / 2 - Rational(2, 7)) ** 2
+        assert expand(sympyopt.objective - sympyopt._bitspin_simp(expected)) == 0
@@ -0,0 +1,180 @@
+import numpy as np
+import pytest
+from pandas import DataFrame
+from scipy.sparse import csr_matrix
+from sympy import Add, expand
+
+from omniqubo import Omniqubo
+from omniqubo.converters.converter import can_convert, interpret
+from omniqubo.converters.eq_to_objective import EqToObj
+from omniqubo.converters.ineq_to_eq import IneqToEq
+from omniqubo.converters.simple_manipulation import RemoveConstraint, RemoveTrivialConstraints
+from omniqubo.converters.varreplace import VarOneHot
+from omniqubo.models.sympyopt.constraints import (
+    EQ_SENSE,
+    INEQ_GEQ_SENSE,
+    INEQ_LEQ_SENSE,
+    ConstraintEq,
+    ConstraintIneq,
+)
+from omniqubo.models.sympyopt.converters import _sub_expression, convert
+from omniqubo.models.sympyopt.sympyopt import SympyOpt
+
+MATRIX = np.array([[1, 2, 0, -1], [0, 1, 1, 0], [2, 0, 1, 1]])
+SENSES = [INEQ_LEQ_SENSE, EQ_SENSE, INEQ_GEQ_SENSE]
+RHS = [4, 2, 1]
+
+
+# same model with the constraints stored in a block or as Sympy constraints
+def _get_model(block: bool) -> SympyOpt:
+    sympyopt = SympyOpt()
+    x = sympyopt.int_var("x", lb=0, ub=3)
+    y = sympyopt.int_var("y", lb=-1, ub=2)
+    z = sympyopt.bit_var("z")
+    w = sympyopt.int_var("w", lb=0, ub=2)
+    sympyopt.minimize(x * y + 2 * z - w)
+    if block:
+        sympyopt.add_linear_constraints(
+            csr_matrix(MATRIX), SENSES, RHS, ["c0", "c1", "c2"], name="b"
+        )
+        return sympyopt
+    xs = [x, y, z, w]
+    for i, (sense, rhs) in enumerate(zip(SENSES, RHS)):
+        expr = sum(int(coeff) * var for coeff, var in zip(MATRIX[i], xs))
+        if sense == EQ_SENSE:
+            sympyopt.add_constraint(ConstraintEq(expr, rhs), f"c{i}")
+        else:
+            sympyopt.add_constraint(ConstraintIneq(expr, rhs, sense), f"c{i}")
+    return sympyopt
+
+
+class TestLinearConstraints:
+    @pytest.mark.parametrize("mode", ["binary", "one-hot"])
+    def test_pipeline(self, mode):
+        omniqubos = []
+        for block in [True, False]:
+            omniqubo = Omniqubo(_get_model(block))
+            omniqubo.ineq_to_eq(".*")
+            omniqubo.int_to_bits(".*", mode=mode)
+            omniqubo.eq_to_obj(".*", penalty=10)
+            assert omniqubo.model.is_qubo()
+            omniqubos.append(omniqubo)
+        assert omniqubos[0].model == omniqubos[1].model
+
+        bqm = omniqubos[0].export("dimod_bqm")
+        samples = DataFrame(
+            np.random.default_rng(0).integers(0, 2, (200, len(bqm.variables))),
+            columns=list(bqm.variables),
+        )
+        results = [omniqubo.interpret(samples.copy()) for omniqubo in omniqubos]
+        assert list(results[0]["feasible"]) == list(results[1]["feasible"])
+
+    def test_ineq_to_eq(self):
+        sympyopt = _get_model(True)
+        conv = IneqToEq("c0", False, True)
+        assert can_convert(sympyopt, conv)
+        assert not can_convert(sympyopt, IneqToEq("c1", False, True))
+        sympyopt = convert(sympyopt, conv)
+        block = sympyopt.constraints["b"]
+        assert list(block.senses) == [EQ_SENSE, EQ_SENSE, INEQ_GEQ_SENSE]
+        assert list(block.checks) == [False, True, True]
+        assert conv.data["slack_names"] == ["c0___slack"]
+        # x + 2y - w >= -4, thus the slack is at most 8
+        assert sympyopt.variables["c0___slack"].ub == 8
+
+        samples = DataFrame({"x": [0, 3], "y": [2, 2], "z": [0, 1], "w": [2, 0]})
+        samples["c0___slack"] = [2, 1]
+        samples["feasible"] = True
+        samples = interpret(samples, conv)
+        assert list(samples["feasible"]) == [True, False]
+
+        sympyopt = _get_model(True)
+        sympyopt.add_linear_constraints(np.ones((1, 4)), INEQ_GEQ_SENSE, 20, ["c3"])
+        with pytest.raises(ValueError):
+            convert(sympyopt, IneqToEq("c3", False, True))
+
+    def test_eq_to_obj(self):
+        sympyopt = SympyOpt()
+        xs = sympyopt.bit_vars("x", 3)
+        s = sympyopt.spin_var("s")
+        y = sympyopt.int_var("y", lb=0, ub=2)
+        sympyopt.add_linear_constraints(np.array([[1, 1, 1, 0, 0], [0, 0, 1, 1, 1]]), EQ_SENSE, 1)
+        conv = EqToObj(".*", True, penalty=2)
+        sympyopt = convert(sympyopt, conv)
+        assert not sympyopt.constraints
+        expected = (xs[0] + xs[1] + xs[2] - 1) ** 2 + (xs[2] + s + y - 1) ** 2
+        assert expand(sympyopt.objective - sympyopt._bitspin_simp(2 * expected)) == 0
+        # blocks store floats, but integral coefficients stay integers
+        assert all(term.as_coeff_Mul()[0].is_Integer for term in Add.make_args(sympyopt.objective))
+        assert len(conv.data["verifier"]) == 2
+
+    def test_remove_constraint(self):
+        sympyopt = _get_model(True)
+        conv = RemoveConstraint("c[01]", True, True)
+        sympyopt = convert(sympyopt, conv)
+        assert sympyopt.constraints["b"].names == ["c2"]
+        samples = DataFrame({"x": [0, 0], "y": [2, 1], "z": [0, 0], "w": [0, 0], "feasible": True})
+        samples = interpret(samples, conv)
+        assert list(samples["feasible"]) == [True, False]
+
+        assert not can_convert(sympyopt, RemoveConstraint("c0", False, True))
+        sympyopt = convert(sympyopt, RemoveConstraint("c2", False, False))
+        assert not sympyopt.constraints
+
+    def test_remove_trivial(self):
+        sympyopt = _get_model(True)
+        trivial = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [1, 1, 0, 0]])
+        senses = [INEQ_LEQ_SENSE, INEQ_GEQ_SENSE, INEQ_LEQ_SENSE]
+        sympyopt.add_linear_constraints(trivial, senses, [3, -1, 5], ["t0", "t1", "t2"])
+        assert can_convert(sympyopt, RemoveTrivialConstraints("t1", False))
+        assert not can_convert(sympyopt, RemoveTrivialConstraints("t3", False))
+        sympyopt = convert(sympyopt, RemoveTrivialConstraints("c1", False))
+        assert len(sympyopt.constraints) == 2
+
+        conv = RemoveTrivialConstraints(".*", True)
+        sympyopt = convert(sympyopt, conv)
+        assert list(sympyopt.constraints) == ["b"]
+        assert sympyopt.constraints["b"].names == ["c0", "c1", "c2"]
+        samples = DataFrame({"x": [3, 4], "y": [0, 0], "feasible": True})
+        samples = interpret(samples, conv)
+        assert list(samples["feasible"]) == [True, False]
+
+        sympyopt.add_linear_constraints(np.ones((1, 4)), INEQ_GEQ_SENSE, 20, ["c3"])
+        with pytest.raises(ValueError):
+            convert(sympyopt, RemoveTrivialConstraints("c3", False))
+        assert len(sympyopt.constraints) == 2
+
+    def test_varreplace(self):
+        sympyopt = convert(_get_model(True), VarOneHot("x", False))
+        block = sympyopt.constraints["b"]
+        assert "x" not in block.varnames
+        rows = block.to_constraints()
+        ohs = [sympyopt.get_var(f"x___OH_{i}") for i in range(1, 4)]
+        y, w = sympyopt.get_var("y"), sympyopt.get_var("w")
+        assert rows["c0"] == ConstraintIneq(ohs[0] + 2 * ohs[1] + 3 * ohs[2] + 2 * y - w, 4)
+
+        # nonlinear substitution turns the rows into Sympy constraints
+        sympyopt = _get_model(True)
+        x, y = sympyopt.get_var("x"), sympyopt.get_var("y")
+        _sub_expression(sympyopt, {x: y ** 2})
+        expected = _get_model(False)
+        _sub_expression(expected, {x: y ** 2})
+        assert sympyopt.constraints == expected.constraints
+
+    def test_literal_names(self):
+        # names with metacharacters are not compiled unless is_regexp is set
+        sympyopt = SympyOpt()
+        sympyopt.bit_vars("x", 3)
+        sympyopt.add_linear_constraints(np.eye(3), EQ_SENSE, 1, ["c[0", "c[1", "c(2"])
+        sympyopt.add_linear_constraints(np.ones((1, 3)), INEQ_LEQ_SENSE, 2, ["c[3"])
+        assert can_convert(sympyopt, EqToObj("c[1", False, 1))
+        assert not can_convert(sympyopt, EqToObj("c[3", False, 1))
+        assert can_convert(sympyopt, IneqToEq("c[3", False, True))
+        assert not can_convert(sympyopt, IneqToEq("c(2", False, True))
+        assert not can_convert(sympyopt, RemoveConstraint("c[4", False, True))
+
+        sympyopt = convert(sympyopt, EqToObj("c[1", False, 1))
+        sympyopt = convert(sympyopt, RemoveConstraint("c(2", False, True))
+        sympyopt = convert(sympyopt, IneqToEq("c[3", False, True))
+        names = [row for block in sympyopt.constraints.values() for row in block.names]
+        assert names == ["c[0", "c[3"]
@@ -0,0 +1,128 @@
+from copy import deepcopy
+
+import numpy as np
+import pytest
+from pandas import DataFrame
+
+from omniqubo.converters.converter import can_convert, interpret
+from omniqubo.converters.presolve import Presolve
+from omniqubo.models.sympyopt.constraints import (
+    EQ_SENSE,
+    INEQ_GEQ_SENSE,
+    INEQ_LEQ_SENSE,
+    ConstraintEq,
+    ConstraintIneq,
+)
+from omniqubo.models.sympyopt.converters import convert
+from omniqubo.models.sympyopt.sympyopt import SympyOpt
+
+
+class TestPresolve:
+    def test_convert(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0, ub=10)
+        y = sympyopt.int_var(name="y", lb=0, ub=10)
+        z = sympyopt.int_var(name="z", lb=-5, ub=5)
+        sympyopt.minimize(x + 2 * y + z)
+        sympyopt.add_constraint(ConstraintIneq(x + y, 3, INEQ_LEQ_SENSE), "c1")
+        sympyopt.add_constraint(ConstraintIneq(2 * x + 2 * y, 8, INEQ_LEQ_SENSE), "c2")
+        sympyopt.add_constraint(ConstraintEq(2 * z, 4), "c3")
+        sympyopt.add_constraint(ConstraintIneq(x + z, 1, INEQ_GEQ_SENSE), "c4")
+        sympyopt.add_constraint(ConstraintIneq(x * y * z, 1, INEQ_GEQ_SENSE), "nonlin")
+        sympyopt_orig = deepcopy(sympyopt)
+        conv = Presolve(".*", True)
+        sympyopt = convert(sympyopt, conv)
+
+        sympyopt2 = SympyOpt()
+        x = sympyopt2.int_var(name="x", lb=0, ub=3)
+        y = sympyopt2.int_var(name="y", lb=0, ub=3)
+        sympyopt2.minimize(x + 2 * y + 2)
+        sympyopt2.add_constraint(ConstraintIneq(x + y, 3, INEQ_LEQ_SENSE), "c1")
+        sympyopt2.add_constraint(ConstraintIneq(2 * x * y, 1, INEQ_GEQ_SENSE), "nonlin")
+        assert sympyopt == sympyopt2
+        assert conv.data["fixed"] == {"z": 2}
+
+        # variables of the original model are not changed
+        assert sympyopt_orig.variables["x"].get_ub() == 10
+
+        samples = DataFrame({"x": [1, 3, 3], "y": [2, 1, 2], "feasible": True})
+        samples = interpret(samples, conv)
+        assert list(samples["z"]) == [2, 2, 2]
+        assert list(samples["feasible"]) == [True, True, False]
+
+    def test_fixing_cascade(self):
+        sympyopt = SympyOpt()
+        b = sympyopt.bit_var(name="b")
+        s = sympyopt.spin_var(name="s")
+        x = sympyopt.int_var(name="x", lb=0, ub=3)
+        y = sympyopt.int_var(name="y", lb=0, ub=3)
+        sympyopt.minimize(b + s + x + y)
+        sympyopt.add_constraint(ConstraintIneq(x - b, 3, INEQ_GEQ_SENSE), "c1")
+        sympyopt.add_constraint(ConstraintIneq(x + y + s, 2, INEQ_LEQ_SENSE), "c2")
+        conv = Presolve(".*", True)
+        sympyopt = convert(sympyopt, conv)
+
+        assert conv.data["fixed"] == {"b": 0, "x": 3, "y": 0, "s": -1}
+        assert not sympyopt.variables
+        assert not sympyopt.constraints
+        assert sympyopt.objective == 2
+
+        conv = Presolve(".*", True, max_iter=0)
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0, ub=3)
+        sympyopt.add_constraint(ConstraintIneq(x, 2, INEQ_LEQ_SENSE), "c1")
+        sympyopt = convert(sympyopt, conv)
+        assert sympyopt.variables["x"].get_ub() == 3
+        assert not conv.data["fixed"]
+
+    def test_infeasible(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0, ub=3)
+        y = sympyopt.int_var(name="y", lb=0, ub=3)
+        sympyopt.add_constraint(ConstraintIneq(x + y, 1, INEQ_LEQ_SENSE), "c1")
+        sympyopt.add_constraint(ConstraintIneq(x, 5, INEQ_GEQ_SENSE), "c2")
+        sympyopt_copy = deepcopy(sympyopt)
+        with pytest.raises(ValueError):
+            convert(sympyopt, Presolve(".*", True))
+        assert sympyopt == sympyopt_copy
+
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0, ub=3)
+        y = sympyopt.int_var(name="y", lb=0, ub=3)
+        sympyopt.add_constraint(ConstraintEq(x + y, 1), "c1")
+        sympyopt.add_constraint(ConstraintEq(2 * x + 2 * y, 4), "c2")
+        with pytest.raises(ValueError):
+            convert(sympyopt, Presolve(".*", True))
+        convert(sympyopt, Presolve("c1", False))
+        assert set(sympyopt.constraints) == {"c1", "c2"}
+
+    def test_linear_constraints(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0, ub=10)
+        y = sympyopt.int_var(name="y", lb=0, ub=10)
+        sympyopt.int_var(name="z", lb=-5, ub=5)
+        sympyopt.minimize(x + 2 * y)
+        matrix = np.array([[1, 1, 0], [2, 2, 0], [0, 0, 2], [1, 0, 1]])
+        senses = [INEQ_LEQ_SENSE, INEQ_LEQ_SENSE, EQ_SENSE, INEQ_GEQ_SENSE]
+        sympyopt.add_linear_constraints(matrix, senses, [3, 8, 4, 1], ["c1", "c2", "c3", "c4"])
+        sympyopt.add_constraint(ConstraintIneq(x + y, 5, INEQ_LEQ_SENSE), "dominated")
+        conv = Presolve(".*", True)
+        sympyopt = convert(sympyopt, conv)
+
+        assert conv.data["fixed"] == {"z": 2}
+        assert sympyopt.variables["x"].get_ub() == 3
+        (block,) = sympyopt.constraints.values()
+        assert block.to_constraints() == {"c1": ConstraintIneq(x + y, 3, INEQ_LEQ_SENSE)}
+        samples = DataFrame({"x": [1, 3], "y": [2, 0], "feasible": True})
+        samples = interpret(samples, conv)
+        assert list(samples["feasible"]) == [True, True]
+
+        sympyopt = SympyOpt()
+        sympyopt.bit_vars("x", 2)
+        sympyopt.add_linear_constraints(np.ones((2, 2)), EQ_SENSE, [1, 2], ["c1", "c2"])
+        assert not can_convert(sympyopt, Presolve("c3", False))
+        with pytest.raises(ValueError):
+            convert(sympyopt, Presolve(".*", True))
+        sympyopt = convert(sympyopt, Presolve("c1", False))
+        (block,) = sympyopt.constraints.values()
+        assert block.names == ["c1", "c2"]
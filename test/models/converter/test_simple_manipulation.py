@@ -9,9 +9,15 @@ from omniqubo.converters.simple_manipulation import (
     MakeMax,
     MakeMin,
     RemoveConstraint,
+    RemoveTrivialConstraints,
     SetIntVarBounds,
 )
-from omniqubo.models.sympyopt.constraints import ConstraintEq
+from omniqubo.models.sympyopt.constraints import (
+    INEQ_GEQ_SENSE,
+    INEQ_LEQ_SENSE,
+    ConstraintEq,
+    ConstraintIneq,
+)
 from omniqubo.models.sympyopt.converters import convert
 from omniqubo.models.sympyopt.sympyopt import SympyOpt
 
@@ -67,6 +73,47 @@ class TestSimpleManipulation:
         sympyopt = convert(sympyopt, RemoveConstraint("second", False, False))
         assert sympyopt_small == sympyopt
 
+    def test_remove_trivial_constraints(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0, ub=2)
+        y = sympyopt.int_var(lb=-2, ub=3, name="y")
+        b = sympyopt.bit_var(name="b")
+        sympyopt.minimize(2 * x - 3 * y + 2)
+        sympyopt.add_constraint(ConstraintIneq(2 * x - 3 * y, 10, INEQ_LEQ_SENSE), "lin_leq")
+        sympyopt.add_constraint(ConstraintIneq(x + b, 0, INEQ_GEQ_SENSE), "lin_geq")
+        sympyopt.add_constraint(ConstraintIneq(x * y, 6, INEQ_LEQ_SENSE), "nonlin_leq")
+        sympyopt.add_constraint(ConstraintEq(x * b - b * x, 0), "nonlin_eq")
+        sympyopt.add_constraint(ConstraintIneq(x + y, 1, INEQ_LEQ_SENSE), "lin_kept")
+        sympyopt.add_constraint(ConstraintIneq(x * y, 2, INEQ_GEQ_SENSE), "nonlin_kept")
+        sympyopt.add_constraint(ConstraintEq(x + b, 1), "eq_kept")
+        conv = RemoveTrivialConstraints(".*", True)
+        sympyopt = convert(sympyopt, conv)
+        assert set(sympyopt.constraints.keys()) == {"lin_kept", "nonlin_kept", "eq_kept"}
+
+        samples = DataFrame({"x": [2, 0, 6], "y": [-2, 0, -2], "b": [1, 0, 0], "feasible": True})
+        assert list(interpret(samples, conv)["feasible"]) == [True, True, False]
+
+        conv = RemoveTrivialConstraints("eq_kept", False)
+        sympyopt = convert(sympyopt, conv)
+        assert "eq_kept" in sympyopt.constraints
+
+    def test_remove_trivial_constraints_infeasible(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0, ub=2)
+        y = sympyopt.int_var(lb=-2, ub=3, name="y")
+        sympyopt.add_constraint(ConstraintIneq(2 * x - 3 * y, -20, INEQ_LEQ_SENSE), "lin")
+        sympyopt.add_constraint(ConstraintIneq(x ** 2, 1, INEQ_LEQ_SENSE), "trivial")
+        sympyopt_copy = deepcopy(sympyopt)
+        with pytest.raises(ValueError):
+            convert(sympyopt, RemoveTrivialConstraints(".*", True))
+        assert sympyopt == sympyopt_copy
+
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0, ub=2)
+        sympyopt.add_constraint(ConstraintEq(x ** 2, -1), "nonlin")
+        with pytest.raises(ValueError):
+            convert(sympyopt, RemoveTrivialConstraints(".*", True))
+
     def test_int_bounds(self):
         sympyopt = SympyOpt()
         x = sympyopt.int_var(name="x")
@@ -7,6 +7,7 @@ from omniqubo.converters.varreplace import (
     TrivialIntToBit,
     VarBinary,
     VarOneHot,
+    VarReplaceBatch,
     interpret,
 )
 from omniqubo.models.sympyopt.constraints import ConstraintEq
@@ -84,6 +85,27 @@ class TestOneHot:
         assert set(samples["y1"]) == {-2, -1, 0, 1, 2, 3}
         assert set(samples["y2"]) == {0, 1}
 
+    def test_interpret_decoding(self):
+        conv = VarOneHot(".*", True)
+        conv.data["bounds"] = {"x": (-1, 1), "y": (2, 3)}
+        samples = DataFrame(
+            {
+                "x___OH_0": [1, 0, 0, 1],
+                "x___OH_1": [0, 0, 1, 0],
+                "x___OH_2": [0, 1, 0, 1],
+                "y___OH_0": [0, 1, 0, 1],
+                "y___OH_1": [1, 0, 0, 0],
+                "feasible": [True, True, True, False],
+            }
+        )
+        samples = interpret(samples, conv)
+        assert list(samples.columns) == ["feasible", "x", "y"]
+        assert samples["feasible"].tolist() == [True, True, False, False]
+        assert samples["x"].tolist()[:3] == [-1, 1, 0]
+        assert samples["x"].isna().tolist() == [False, False, False, True]
+        assert samples["y"].tolist()[:2] == [3, 2]
+        assert samples["y"].isna().tolist() == [False, False, True, False]
+
 
 class TestBinary:
     def test_objective(self):
@@ -260,3 +282,53 @@ class TestBitToSpin:
         assert samples.shape[0] == 4
         assert set(samples["y"]) == {0, 1}
         assert set(samples["x"]) == {0, 1}
+
+
+class TestVarReplaceBatch:
+    def _get_model(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0, ub=2)
+        y = sympyopt.int_var(name="y", lb=-2, ub=3)
+        z = sympyopt.int_var(name="z", lb=1, ub=2)
+        sympyopt.minimize(2 * x * y - 3 * y + z)
+        sympyopt.add_constraint(ConstraintEq(x + y + z, 2), "c")
+        return sympyopt
+
+    def _get_converters(self):
+        return [
+            TrivialIntToBit(".*", True),
+            VarOneHot("x", False),
+            VarBinary(".*", True),
+            BitToSpin(".*", True, False),
+        ]
+
+    def test_conversion(self):
+        sympyopt = self._get_model()
+        for conv in self._get_converters():
+            sympyopt = convert(sympyopt, conv)
+
+        convs = self._get_converters()
+        batch = VarReplaceBatch(convs)
+        sympyopt2 = convert(self._get_model(), batch)
+        assert sympyopt == sympyopt2
+        assert convs[0].data["lb"] == {"z": 1}
+        assert convs[1].data["bounds"] == {"x": (0, 2)}
+        assert convs[2].data["bounds"] == {"y": (-2, 3)}
+        assert "y___BIN_0" in convs[3].data["varnames"]
+
+    def test_interpret(self):
+        batch = VarReplaceBatch(self._get_converters())
+        sympyopt = convert(self._get_model(), batch)
+        conv = EqToObj(".*", True, 2)
+        sympyopt = convert(sympyopt, conv)
+        bqm = SympyOptToDimod().transpile(sympyopt)
+        h, J, _ = bqm.to_ising()
+        samples = dimod_import(ExactSolver().sample_ising(h, J))
+        samples["feasible"] = True
+        samples = interpret(interpret(samples, conv), batch)
+        assert set(samples.columns) == {"x", "y", "z", "energy", "num_occurrences", "feasible"}
+        feasible = samples[samples["feasible"]]
+        assert all(feasible["x"] + feasible["y"] + feasible["z"] == 2)
+        assert set(feasible["x"]) == {0, 1, 2}
+        assert set(feasible["y"]) == {-2, -1, 0, 1}
+        assert set(feasible["z"]) == {1, 2}
@@ -0,0 +1,68 @@
+import pickle
+
+import pytest
+from pandas import DataFrame
+
+from omniqubo.converters.converter import interpret
+from omniqubo.converters.eq_to_objective import EqToObj
+from omniqubo.converters.simple_manipulation import RemoveConstraint
+from omniqubo.converters.verifier import ConstraintsVerifier
+from omniqubo.models.sympyopt.constraints import INEQ_GEQ_SENSE, ConstraintEq, ConstraintIneq
+from omniqubo.models.sympyopt.converters import convert
+from omniqubo.models.sympyopt.sympyopt import SympyOpt
+
+
+class TestConstraintsVerifier:
+    def test_linear(self):
+        verifier = ConstraintsVerifier()
+        verifier.add_linear({"x": 1, "y": -2}, 1, "eq")
+        verifier.add_linear({"y": 1}, -1, "leq")
+        verifier.add_linear({}, 0, "geq")
+        assert len(verifier) == 3
+
+        samples = DataFrame({"x": [1, 3, 5], "y": [1, 2, 3]})
+        assert verifier.values(samples).tolist() == [[0, 0, 0], [0, 1, 0], [0, 2, 0]]
+        assert verifier.check(samples).tolist() == [True, False, False]
+
+    def test_nonlinear(self):
+        verifier = ConstraintsVerifier()
+        verifier.add_nonlinear(lambda vals: vals["x"] * vals["y"] - 2, ["x", "y"], "geq")
+        samples = DataFrame({"x": [1, 2, 3], "y": [1, 1, 1]})
+        assert verifier.check(samples).tolist() == [False, True, True]
+
+    def test_wrong_ctype(self):
+        verifier = ConstraintsVerifier()
+        with pytest.raises(ValueError):
+            verifier.add_linear({"x": 1}, 0, "lt")
+
+    def test_sympyopt_compiled_once(self, mocker):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0, ub=3)
+        y = sympyopt.int_var(name="y", lb=0, ub=3)
+        sympyopt.add_constraint(ConstraintEq(x + 2 * y, 3), name="lin")
+        sympyopt.add_constraint(ConstraintIneq(x * y, 1, INEQ_GEQ_SENSE), name="quad")
+        conv = RemoveConstraint(".*", True, True)
+        sympyopt = convert(sympyopt, conv)
+
+        verifier = conv.data["verifier"]
+        assert verifier.varnames == ["x", "y"]
+        assert len(verifier._nonlinear) == 1
+
+        # unpickled verifier is compiled again
+        conv.data["verifier"] = pickle.loads(pickle.dumps(verifier))
+
+        spy = mocker.patch("omniqubo.models.sympyopt.converters.lambdify")
+        samples = DataFrame({"x": [1, 3, 1], "y": [1, 0, 0], "feasible": [True, True, True]})
+        samples = interpret(samples, conv)
+        assert samples["feasible"].tolist() == [True, False, False]
+        spy.assert_not_called()
+
+    def test_eqtoobj_skip_check(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.bit_var(name="x")
+        c = ConstraintEq(x, 1)
+        c.check_interpret = False
+        sympyopt.add_constraint(c, name="c")
+        conv = EqToObj("c", False, 1)
+        convert(sympyopt, conv)
+        assert len(conv.data["verifier"]) == 0
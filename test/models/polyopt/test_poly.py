@@ -0,0 +1,149 @@
+import numpy as np
+import pytest
+from dimod import BinaryQuadraticModel
+
+from omniqubo.models.polyopt.constraints import ConstraintEq, ConstraintIneq
+from omniqubo.models.polyopt.poly import Poly
+from omniqubo.models.polyopt.polyopt import PolyOpt
+from omniqubo.models.polyopt.transpiler.polyopt_to_dimod import PolyOptToDimod
+from omniqubo.models.polyopt.transpiler.sympyopt_to_polyopt import SympyOptToPolyopt
+from omniqubo.models.sympyopt import SympyOpt
+
+
+class TestPoly:
+    def test_arithmetic(self):
+        x = Poly.var(0)
+        y = Poly.var(1)
+
+        assert x + y == y + x
+        assert x - x == 0
+        assert 2 - x == -(x - 2)
+        assert (x + y) ** 2 == x ** 2 + 2 * x * y + y ** 2
+        assert (x + 1) * (x - 1) == x ** 2 - 1
+        assert (2 * x + 4 * y) / 2 == x + 2 * y
+        assert (x + y) ** 0 == 1
+        assert len((x + y + 1) ** 2) == 6
+        assert (x * y).terms == {(0, 1): 1}
+        assert (y * x).terms == {(0, 1): 1}
+        assert Poly({(1, 0): 2, (0, 1): -2}) == 0
+
+    def test_properties(self):
+        x = Poly.var(0)
+        y = Poly.var(3)
+        poly = x ** 2 * y - 3 * y + 4
+        assert poly.degree() == 3
+        assert poly.variables() == {0, 3}
+        assert poly.constant() == 4
+        assert not poly.is_number()
+        assert Poly().degree() == 0
+        assert Poly({(): 3}).is_number()
+
+    def test_subs(self):
+        x = Poly.var(0)
+        y = Poly.var(1)
+        z = Poly.var(2)
+        poly = x ** 2 * y + 3 * y + z
+        assert poly.subs({0: y + 1}) == (y + 1) ** 2 * y + 3 * y + z
+        assert poly.subs({0: z, 1: 2 * z}) == 2 * z ** 3 + 7 * z
+        assert poly.subs({}) == poly
+
+    def test_reduce_powers(self):
+        b = Poly.var(0)
+        s = Poly.var(1)
+        i = Poly.var(2)
+        poly = (b - s) ** 3 + i ** 2
+        assert poly._reduce_powers({0}, {1}) == 4 * b - 3 * b * s - s + i ** 2
+
+    def test_evaluate(self):
+        x = Poly.var(0)
+        y = Poly.var(1)
+        poly = 2 * x * y - y + 3
+        assert poly.evaluate({0: 2, 1: 3}) == 12
+        values = {0: np.array([0, 1, 2]), 1: np.array([1, 1, 3])}
+        assert list(poly.evaluate(values)) == [2, 4, 12]
+
+    def test_pow_assertion(self):
+        with pytest.raises(AssertionError):
+            Poly.var(0) ** -1
+
+    def test_unhashable(self):
+        with pytest.raises(TypeError):
+            hash(Poly.var(0))
+
+
+class TestPolyOpt:
+    def test_variables(self):
+        polyopt = PolyOpt()
+        x = polyopt.bit_var("x")
+        polyopt.int_var("y", lb=0, ub=3)
+        assert polyopt.get_var("x") == x
+        assert polyopt.get_vars().keys() == {"x", "y"}
+        with pytest.raises(ValueError):
+            polyopt.bit_var("x")
+
+    def test_unknown_vars(self):
+        polyopt = PolyOpt()
+        polyopt.bit_var("x")
+        with pytest.raises(ValueError):
+            polyopt.minimize(Poly.var(1))
+        with pytest.raises(ValueError):
+            polyopt.add_constraint(ConstraintEq(Poly.var(1), 1))
+
+    def test_eq(self):
+        polyopt1 = PolyOpt()
+        x = polyopt1.bit_var("x")
+        y = polyopt1.int_var("y", lb=0, ub=3)
+        polyopt1.minimize(2 * x + y)
+        polyopt1.add_constraint(ConstraintIneq(x, y), "c")
+
+        # the same model, variables defined in a different order
+        polyopt2 = PolyOpt()
+        y = polyopt2.int_var("y", lb=0, ub=3)
+        x = polyopt2.bit_var("x")
+        polyopt2.minimize(y + 2 * x)
+        polyopt2.add_constraint(ConstraintIneq(x - y, 0), "c")
+        assert polyopt1 == polyopt2
+
+        polyopt2.maximize(y + 2 * x)
+        assert polyopt1 != polyopt2
+
+    def test_isstatements(self):
+        polyopt = PolyOpt()
+        x = polyopt.bit_var("x")
+        y = polyopt.bit_var("y")
+        polyopt.minimize(x ** 2 + (x + y) ** 2)
+        assert polyopt.is_bm()
+        assert polyopt.is_qubo()
+        assert polyopt.is_hobo()
+        assert polyopt.is_qip()
+        assert not polyopt.is_ilp()
+        assert not polyopt.is_ising()
+
+        polyopt.minimize((x + y) ** 3)
+        assert polyopt.is_qubo()  # b**n = b for bits
+
+        z = polyopt.int_var("z", lb=0, ub=3)
+        polyopt.minimize(x * y * z)
+        assert not polyopt.is_bm()
+        assert not polyopt.is_qcqp()
+        assert polyopt.is_pip()
+
+        polyopt = PolyOpt()
+        s1 = polyopt.spin_var("s1")
+        s2 = polyopt.spin_var("s2")
+        polyopt.minimize((s1 + s2) ** 4)
+        assert polyopt.is_ising()
+        assert not polyopt.is_ising(locality=1)
+        assert not polyopt.is_qubo()
+
+    def test_sympyopt_to_dimod(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.bit_var("x")
+        y = sympyopt.bit_var("y")
+        sympyopt.bit_var("z")
+        sympyopt.minimize(1.5 * (x - y) ** 2 + 0.5 * x ** 3 - 1.25)
+        polyopt = SympyOptToPolyopt().transpile(sympyopt)
+        bqm = BinaryQuadraticModel(
+            {"x": 2, "y": 1.5, "z": 0}, {("x", "y"): -3}, -1.25, vartype="BINARY"
+        )
+        assert PolyOptToDimod().transpile(polyopt) == bqm
@@ -0,0 +1,193 @@
+import pytest
+from dimod import ExactSolver
+from pandas import DataFrame
+
+from omniqubo.constraints import INEQ_GEQ_SENSE, INEQ_LEQ_SENSE
+from omniqubo.converters.converter import can_convert, interpret
+from omniqubo.converters.eq_to_objective import EqToObj
+from omniqubo.converters.ineq_to_eq import IneqToEq
+from omniqubo.converters.presolve import Presolve
+from omniqubo.converters.simple_manipulation import (
+    MakeMax,
+    RemoveConstraint,
+    RemoveTrivialConstraints,
+)
+from omniqubo.converters.varreplace import (
+    BitToSpin,
+    TrivialIntToBit,
+    VarBinary,
+    VarOneHot,
+    VarReplaceBatch,
+)
+from omniqubo.models.polyopt.constraints import ConstraintEq, ConstraintIneq
+from omniqubo.models.polyopt.converters import convert
+from omniqubo.models.polyopt.polyopt import PolyOpt
+from omniqubo.models.polyopt.transpiler.polyopt_to_dimod import PolyOptToDimod
+from omniqubo.sampleset import dimod_import
+
+
+class TestPolyOptConverters:
+    def test_eqtoobj(self):
+        polyopt = PolyOpt()
+        x = polyopt.int_var(name="x", lb=0, ub=2)
+        y = polyopt.int_var(lb=-2, ub=3, name="y")
+        polyopt.maximize(2 * x - 3 * y + 2)
+        polyopt.add_constraint(ConstraintEq(2 * x - 3 * y, 3), name="constr1")
+        polyopt.add_constraint(ConstraintEq(2 * x ** 2 - 3 * y, 0), name="constr2")
+        polyopt = convert(polyopt, EqToObj("constr1", False, 10))
+        polyopt = convert(polyopt, EqToObj("constr2", False, 3.5))
+
+        polyopt2 = PolyOpt()
+        x = polyopt2.int_var(name="x", lb=0, ub=2)
+        y = polyopt2.int_var(lb=-2, ub=3, name="y")
+        polyopt2.maximize(
+            2 * x - 3 * y + 2 - 10 * (2 * x - 3 * y - 3) ** 2 - 3.5 * (2 * x ** 2 - 3 * y) ** 2
+        )
+        assert polyopt == polyopt2
+
+    def test_ineqtoeq(self):
+        polyopt = PolyOpt()
+        x = polyopt.int_var(name="x", lb=0, ub=2)
+        y = polyopt.int_var(lb=-2, ub=3, name="y")
+        polyopt.add_constraint(ConstraintIneq(2 * x - 3 * y, 3, INEQ_GEQ_SENSE), name="constr1")
+        polyopt.add_constraint(
+            ConstraintIneq(2 * x ** 2 - 3 * y ** 3, 0, INEQ_LEQ_SENSE), name="constr2"
+        )
+        polyopt.add_constraint(ConstraintIneq(x, 2, INEQ_GEQ_SENSE), name="constr3")
+        polyopt = convert(polyopt, IneqToEq(".*", True, check_slack=False))
+
+        polyopt2 = PolyOpt()
+        x = polyopt2.int_var(name="x", lb=0, ub=2)
+        y = polyopt2.int_var(lb=-2, ub=3, name="y")
+        xi1 = polyopt2.int_var(lb=0, ub=7, name="constr1___slack")
+        xi2 = polyopt2.int_var(lb=0, ub=81, name="constr2___slack")
+        polyopt2.add_constraint(ConstraintEq(2 * x - 3 * y - xi1, 3), name="constr1")
+        polyopt2.add_constraint(ConstraintEq(2 * x ** 2 - 3 * y ** 3 + xi2, 0), name="constr2")
+        polyopt2.add_constraint(ConstraintEq(x, 2), name="constr3")
+        assert polyopt == polyopt2
+
+    def test_ineqtoeq_interpret(self):
+        polyopt = PolyOpt()
+        x = polyopt.int_var(name="x", lb=0, ub=2)
+        y = polyopt.int_var(lb=-2, ub=3, name="y")
+        polyopt.add_constraint(ConstraintIneq(2 * x + y, -2, INEQ_LEQ_SENSE), name="c1")
+        polyopt.add_constraint(ConstraintIneq(x + y, 2, INEQ_LEQ_SENSE), name="c2")
+        conv = IneqToEq(".*", True, check_slack=False)
+        polyopt = convert(polyopt, conv)
+        assert "c1___slack" not in polyopt.variables
+        assert polyopt.variables["c2___slack"].get_ub() == 4
+
+        samples = DataFrame(
+            {"x": [0, 1], "y": [-2, 3], "c2___slack": [0, 0], "feasible": [True, True]}
+        )
+        samples = interpret(samples, conv)
+        assert list(samples["feasible"]) == [True, False]
+        assert "c2___slack" not in samples.columns
+
+        polyopt = PolyOpt()
+        x = polyopt.int_var(name="x", lb=0, ub=2)
+        polyopt.add_constraint(ConstraintIneq(x, 3, INEQ_GEQ_SENSE), name="c")
+        with pytest.raises(ValueError):
+            convert(polyopt, IneqToEq(".*", True, check_slack=False))
+
+    def test_onehot(self):
+        polyopt = PolyOpt()
+        x = polyopt.int_var(name="x", lb=0, ub=2)
+        y = polyopt.int_var(lb=-2, ub=3, name="y")
+        polyopt.add_constraint(ConstraintEq(-1.5 * x + 2 * y, 4), "lin")
+        polyopt = convert(polyopt, VarOneHot("x", is_regexp=False))
+
+        polyopt2 = PolyOpt()
+        y = polyopt2.int_var(lb=-2, ub=3, name="y")
+        x1 = polyopt2.bit_var(name="x___OH_0")
+        x2 = polyopt2.bit_var(name="x___OH_1")
+        x3 = polyopt2.bit_var(name="x___OH_2")
+        polyopt2.add_constraint(ConstraintEq(x1 + x2 + x3, 1), name="___OH_x")
+        polyopt2.add_constraint(ConstraintEq(-1.5 * x2 - 3 * x3 + 2 * y, 4), name="lin")
+        assert polyopt == polyopt2
+
+    def test_binary_interpret(self):
+        polyopt = PolyOpt()
+        x = polyopt.bit_var(name="x")
+        y1 = polyopt.int_var(lb=-2, ub=3, name="y1")
+        y2 = polyopt.int_var(lb=0, ub=1, name="y2")
+        polyopt.minimize(2 * x - 3 * y1 + y2 + 2)
+        polyopt.add_constraint(ConstraintEq(x + y2, 1), "c")
+
+        convs = [
+            TrivialIntToBit(".*", True),
+            VarBinary(".*", True),
+            EqToObj(".*", True, 10),
+        ]
+        for conv in convs:
+            polyopt = convert(polyopt, conv)
+        assert polyopt.is_qubo()
+
+        bqm = PolyOptToDimod().transpile(polyopt)
+        samples = dimod_import(ExactSolver().sample(bqm))
+        for conv in reversed(convs):
+            samples = interpret(samples, conv)
+        samples = samples.loc[samples["feasible"]]
+        best = samples.sort_values("energy").iloc[0, :]
+        assert best["y1"] == 3
+        assert best["x"] == 0
+        assert best["y2"] == 1
+        assert best["energy"] == -6
+
+    def test_bittospin_makemax_remove(self):
+        polyopt = PolyOpt()
+        x = polyopt.bit_var(name="x")
+        y = polyopt.bit_var(name="y")
+        polyopt.minimize(x * y)
+        polyopt.add_constraint(ConstraintEq(x, y), "c")
+        polyopt = convert(polyopt, RemoveConstraint("c", False, True))
+        polyopt = convert(polyopt, BitToSpin(".*", True, False))
+        assert polyopt.is_ising()
+        assert len(polyopt.constraints) == 0
+
+        polyopt = convert(polyopt, MakeMax())
+        polyopt2 = PolyOpt()
+        s1 = polyopt2.spin_var("x___bts")
+        s2 = polyopt2.spin_var("y___bts")
+        polyopt2.maximize(-(1 + s1) * (1 + s2) / 4)
+        assert polyopt == polyopt2
+
+    def test_varreplacebatch(self):
+        def get_model():
+            polyopt = PolyOpt()
+            x = polyopt.int_var(name="x", lb=0, ub=2)
+            y = polyopt.int_var(name="y", lb=-2, ub=3)
+            z = polyopt.int_var(name="z", lb=1, ub=2)
+            polyopt.minimize(2 * x * y - 3 * y + z)
+            polyopt.add_constraint(ConstraintEq(x + y * z, 2), "c")
+            return polyopt
+
+        def get_converters():
+            return [
+                TrivialIntToBit(".*", True),
+                VarOneHot("x", False),
+                VarBinary(".*", True),
+                BitToSpin(".*", True, False),
+            ]
+
+        polyopt = get_model()
+        for conv in get_converters():
+            polyopt = convert(polyopt, conv)
+        convs = get_converters()
+        assert convert(get_model(), VarReplaceBatch(convs)) == polyopt
+        assert convs[0].data["lb"] == {"z": 1}
+        assert convs[2].data["bounds"] == {"y": (-2, 3)}
+
+    def test_presolve(self):
+        polyopt = PolyOpt()
+        x = polyopt.int_var(name="x", lb=0, ub=2)
+        polyopt.add_constraint(ConstraintIneq(x, 1, INEQ_LEQ_SENSE), "c")
+        assert not can_convert(polyopt, Presolve(".*", True))
+        assert not can_convert(polyopt, Presolve("c", False))
+
+    def test_remove_trivial_constraints(self):
+        polyopt = PolyOpt()
+        x = polyopt.int_var(name="x", lb=0, ub=2)
+        polyopt.add_constraint(ConstraintIneq(x, 3, INEQ_LEQ_SENSE), "c")
+        assert not can_convert(polyopt, RemoveTrivialConstraints(".*", True))
+        assert not can_convert(polyopt, RemoveTrivialConstraints("c", False))
@@ -0,0 +1,66 @@
+from fractions import Fraction
+from math import inf
+
+import pytest
+from sympy import Rational, Symbol, exp
+
+from omniqubo.models.sympyopt.bounds import ExprBounds
+from omniqubo.models.sympyopt.sympyopt import SympyOpt
+
+
+class TestExprBounds:
+    def test_linear(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0, ub=2)
+        y = sympyopt.int_var(name="y", lb=-2, ub=3)
+        b = sympyopt.bit_var(name="b")
+        bounds = ExprBounds(sympyopt)
+        assert bounds(2 * x - 3 * y + 2) == (-7, 12)
+        assert bounds(0.1 * x + 0.2 * b - 0.3) == (Fraction(-3, 10), Fraction(1, 10))
+        assert bounds(Rational(1, 3) * y) == (Fraction(-2, 3), 1)
+        assert bounds.get_lb(x - b) == -1
+        assert bounds.get_ub(x - b) == 2
+
+    def test_products_and_powers(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0, ub=2)
+        y = sympyopt.int_var(name="y", lb=-2, ub=3)
+        b = sympyopt.bit_var(name="b")
+        s = sympyopt.spin_var(name="s")
+        bounds = ExprBounds(sympyopt)
+        assert bounds(x * y) == (-4, 6)
+        assert bounds(-x * y * s) == (-6, 6)
+        assert bounds(y ** 2) == (0, 9)
+        assert bounds(y ** 3) == (-8, 27)
+        assert bounds(2 * x ** 2 - 3 * y ** 3) == (-81, 32)
+        assert bounds(b ** 3) == (0, 1)
+        assert bounds(s ** 2) == (1, 1)
+        assert bounds((x - 3) ** 2) == (1, 9)
+
+    def test_unbounded(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0)
+        y = sympyopt.real_var(name="y", lb=-1.5, ub=0.5)
+        b = sympyopt.bit_var(name="b")
+        bounds = ExprBounds(sympyopt)
+        assert bounds(x + y) == (Fraction(-3, 2), inf)
+        assert bounds(-x * b) == (-inf, 0)
+
+    def test_not_polynomial(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=1, ub=2)
+        bounds = ExprBounds(sympyopt)
+        with pytest.raises(ValueError):
+            bounds(exp(x))
+        with pytest.raises(ValueError):
+            bounds(x ** -1)
+
+    def test_unknown_symbol(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=1, ub=2)
+        a = Symbol("a")
+        bounds = ExprBounds(sympyopt)
+        with pytest.raises(ValueError):
+            bounds(a * x)
+        with pytest.raises(ValueError):
+            bounds(x + a ** 2)
@@ -1,6 +1,13 @@
+import numpy as np
 import pytest
 
-from omniqubo.models.sympyopt.constraints import INEQ_GEQ_SENSE, ConstraintEq, ConstraintIneq
+from omniqubo.models.sympyopt.constraints import (
+    EQ_SENSE,
+    INEQ_GEQ_SENSE,
+    ConstraintEq,
+    ConstraintIneq,
+    LinearConstraints,
+)
 from omniqubo.models.sympyopt.sympyopt import SympyOpt
 
 
@@ -73,3 +80,39 @@ class TestConstraintIneq:
 
         c = ConstraintIneq(x + 2 * y - 4 * z, 3.1 - 2.4 * y + 3.4 * z)
         assert str(c) == "x + 2*y - 4*z <= -2.4*y + 3.4*z + 3.1"
+
+
+class TestLinearConstraints:
+    def test_block(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var("x", lb=0, ub=3)
+        y = sympyopt.bit_var("y")
+        matrix = np.array([[1, -2], [0.5, 0]])
+        c = LinearConstraints(matrix, ["x", "y"], [EQ_SENSE, INEQ_GEQ_SENSE], [1, 2], ["a", "b"])
+        assert len(c) == 2
+        assert not c.is_eq_constraint() and not c.is_ineq_constraint()
+        assert c.select(np.array([True, False])).is_eq_constraint()
+        assert c._list_unknown_vars(["x"]) == ["y"]
+        assert str(c) == "Linear constraints block of 2 rows and 2 variables"
+
+        rows = c.to_constraints()
+        assert rows["a"] == ConstraintEq(x - 2 * y, 1)
+        assert rows["b"] == ConstraintIneq(0.5 * x, 2, INEQ_GEQ_SENSE)
+
+        reordered = LinearConstraints(
+            matrix[:, ::-1], ["y", "x"], [EQ_SENSE, INEQ_GEQ_SENSE], [1, 2], ["a", "b"]
+        )
+        assert c == reordered
+        assert c != LinearConstraints(matrix, ["x", "y"], EQ_SENSE, [1, 2], ["a", "b"])
+        assert c != rows["a"]
+
+    def test_errors(self):
+        matrix = np.eye(2)
+        with pytest.raises(ValueError):
+            LinearConstraints(matrix, ["x"], EQ_SENSE, 0, ["a", "b"])
+        with pytest.raises(ValueError):
+            LinearConstraints(matrix, ["x", "x"], EQ_SENSE, 0, ["a", "b"])
+        with pytest.raises(ValueError):
+            LinearConstraints(matrix, ["x", "y"], EQ_SENSE, 0, ["a"])
+        with pytest.raises(ValueError):
+            LinearConstraints(matrix, ["x", "y"], "lt", 0, ["a", "b"])
@@ -1,6 +1,19 @@
+import pickle
+from copy import copy, deepcopy
+
+import numpy as np
+import pytest
+from scipy.sparse import csr_matrix
 from sympy import S, sin, sympify
 
+from omniqubo.models.sympyopt.constraints import (
+    EQ_SENSE,
+    INEQ_LEQ_SENSE,
+    ConstraintEq,
+    ConstraintIneq,
+)
 from omniqubo.models.sympyopt.sympyopt import SympyOpt
+from omniqubo.models.sympyopt.vars import BitVar, IntVar, SpinVar
 
 
 class TestSympySympyOpt:
@@ -28,3 +41,114 @@ class TestSympySympyOpt:
         expr1 = sympyopt._bitspin_simp(z ** 4)
         expr2 = S(1)
         assert sympify(expr1 - expr2) == 0
+
+    def test_cached_classification(self, mocker):
+        sympyopt = SympyOpt()
+        x = sympyopt.bit_var("x")
+        y = sympyopt.bit_var("y")
+        sympyopt.minimize((x + y) ** 3)
+        assert sympyopt.is_qubo()
+
+        spy = mocker.spy(sympyopt, "_bitspin_simp")
+        assert sympyopt.is_qubo()
+        assert sympyopt.is_hobo()
+        assert not sympyopt.is_ising()
+        spy.assert_not_called()
+
+        # replacing the variable invalidates the cache
+        sympyopt.variables["y"] = IntVar("y", lb=0, ub=2)
+        assert not sympyopt.is_qubo()
+        assert not sympyopt.is_qcqp()
+        assert sympyopt.is_pip()
+        spy.assert_called()
+
+        sympyopt.variables.pop("y")
+        sympyopt.spin_var("y")
+        sympyopt.variables["x"] = SpinVar("x")
+        assert sympyopt.is_ising()
+        assert sympyopt.is_ising(locality=1)  # s**2 == 1 for spins
+
+        mocker.stop(spy)
+
+        for model in [deepcopy(sympyopt), pickle.loads(pickle.dumps(sympyopt))]:
+            assert model.is_ising()
+            assert len(model._degrees.entries) == 1
+
+    def test_vars_census(self):
+        sympyopt = SympyOpt()
+        sympyopt.bit_var("x")
+        sympyopt.int_var("y", lb=0, ub=2)
+        variables = sympyopt.variables
+        assert variables.count(BitVar) == 1
+        assert variables.count(BitVar, IntVar) == 2
+
+        variables["y"] = BitVar("y")
+        assert variables.count(BitVar) == 2
+        del variables["x"]
+        variables.update({"z": SpinVar("z")})
+        assert variables.count(BitVar) == 1
+        assert variables.setdefault("z", BitVar("z")) == SpinVar("z")
+        assert variables.count(SpinVar) == 1
+        assert copy(variables).count(SpinVar) == 1
+        assert pickle.loads(pickle.dumps(variables)).count(BitVar) == 1
+        assert deepcopy(variables).count(BitVar, SpinVar) == 2
+        variables.clear()
+        assert variables.count(BitVar) == 0
+
+    def test_bulk_vars(self):
+        sympyopt = SympyOpt()
+        xs = sympyopt.bit_vars("x", (2, 3))
+        assert xs.shape == (2, 3)
+        assert xs[1, 2] == sympyopt.get_var("x_1_2")
+        ss = sympyopt.spin_vars("s", 2)
+        assert list(ss) == [sympyopt.get_var("s_0"), sympyopt.get_var("s_1")]
+        ys = sympyopt.int_vars(["y", "z"], lbs=[0, -1], ubs=3)
+        assert sympyopt.variables["y"] == IntVar("y", 0, 3)
+        assert sympyopt.variables["z"] == IntVar("z", -1, 3)
+        assert sympyopt.variables.count(BitVar) == 6
+        assert sympyopt.variables.get_id("z") == 9
+        assert list(sympyopt.variables.ubs[-2:]) == [3, 3]
+
+        sympyopt.minimize(xs.sum() + ss @ ys)
+        x = sympyopt.get_vars()
+        assert sympyopt.objective == sum(x[f"x_{i}_{j}"] for i in range(2) for j in range(3)) + (
+            ss[0] * ys[0] + ss[1] * ys[1]
+        )
+
+        with pytest.raises(ValueError):
+            sympyopt.bit_vars("x", (1, 2))
+        with pytest.raises(ValueError):
+            sympyopt.int_vars(["u", "u"], 0, 1)
+        with pytest.raises(ValueError):
+            sympyopt.int_vars(["u", "v"], [0], 1)
+        assert "u" not in sympyopt.variables
+
+    def test_add_linear_constraints(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var("x", lb=0, ub=3)
+        y = sympyopt.bit_var("y")
+        sympyopt.bit_var("z")
+        name = sympyopt.add_linear_constraints(csr_matrix([[1, 2, 0]]), EQ_SENSE, 2)
+        assert sympyopt.constraints[name].names == [f"{name}_0"]
+        assert sympyopt.is_ilp()
+
+        # COO input with the last column empty
+        sympyopt.add_linear_constraints(
+            ([1.0, -1.0], ([0, 1], [0, 1])), INEQ_LEQ_SENSE, [3, 0], variables=[x, y, "z"], name="b"
+        )
+        block = sympyopt.constraints["b"]
+        assert block.matrix.shape == (2, 3)
+        assert block.to_constraints()["b_1"] == ConstraintIneq(-y, 0)
+
+        with pytest.raises(ValueError):
+            sympyopt.add_linear_constraints(np.eye(1), EQ_SENSE, 0, names=["b_0"])
+        with pytest.raises(ValueError):
+            sympyopt.add_linear_constraints(np.eye(1), EQ_SENSE, 0, name="b")
+        with pytest.raises(ValueError):
+            sympyopt.add_linear_constraints(np.eye(1), EQ_SENSE, 0, variables=["u"])
+        # rows of the blocks share the namespace with the constraints
+        with pytest.raises(ValueError):
+            sympyopt.add_constraint(ConstraintEq(x, 1), "b_0")
+        sympyopt.add_constraint(ConstraintEq(x, 1), "c")
+        with pytest.raises(ValueError):
+            sympyopt.add_linear_constraints(np.eye(1), EQ_SENSE, 0, names=["c"])
@@ -1,6 +1,17 @@
+from copy import copy, deepcopy
+
+import pytest
 from sympy.core.evalf import INF
 
 from omniqubo.models.sympyopt.sympyopt import SympyOpt
+from omniqubo.models.sympyopt.vars import (
+    BIT_VTYPE,
+    INT_VTYPE,
+    NO_VTYPE,
+    REAL_VTYPE,
+    SPIN_VTYPE,
+    IntVar,
+)
 
 
 class TestIntVar:
@@ -117,3 +128,44 @@ class TestSpinVar:
         x = sympyopt.variables[sympyopt.spin_var(name="x").name]
         assert x.get_lb() == -1
         assert x.get_ub() == 1
+
+
+class TestSympyOptVars:
+    def test_ids(self):
+        sympyopt = SympyOpt()
+        sympyopt.bit_var(name="b")
+        sympyopt.spin_var(name="s")
+        sympyopt.int_var(name="x", lb=-2, ub=3)
+        sympyopt.real_var(name="r")
+        variables = sympyopt.variables
+        assert [variables.get_id(name) for name in ["b", "s", "x", "r"]] == [0, 1, 2, 3]
+        assert variables.get_name(2) == "x"
+        assert list(variables.get_ids(["x", "b"])) == [2, 0]
+        assert list(variables.vtypes) == [BIT_VTYPE, SPIN_VTYPE, INT_VTYPE, REAL_VTYPE]
+        assert list(variables.lbs) == [0, -1, -2, -INF]
+        assert list(variables.ubs) == [1, 1, 3, INF]
+        assert variables.get_vtype("s") == SPIN_VTYPE
+        with pytest.raises(ValueError):
+            variables.lbs[0] = 1
+
+    def test_modification(self):
+        sympyopt = SympyOpt()
+        for i in range(10):
+            sympyopt.int_var(name=f"x{i}", lb=0, ub=i + 1)
+        variables = sympyopt.variables
+        variables["x3"] = IntVar("x3", 1, 2)
+        del variables["x5"]
+        sympyopt.bit_var(name="b")
+        assert variables.get_id("x3") == 3
+        assert (variables.lbs[3], variables.ubs[3]) == (1, 2)
+        assert variables.vtypes[5] == NO_VTYPE
+        assert variables.get_id("b") == 10
+        with pytest.raises(KeyError):
+            variables.get_name(5)
+
+        variables2 = copy(variables)
+        del variables2["b"]
+        assert variables.get_id("b") == 10
+        assert variables.vtypes[10] == BIT_VTYPE
+        assert variables2.count(IntVar) == 9
+        assert deepcopy(sympyopt) == sympyopt
@@ -0,0 +1,97 @@
+import pytest
+from pulp import LpBinary, LpInteger, LpMaximize, LpMinimize, LpProblem, LpVariable
+
+from omniqubo import Omniqubo
+from omniqubo.models.sympyopt.constraints import (
+    INEQ_GEQ_SENSE,
+    ConstraintEq,
+    ConstraintIneq,
+    LinearConstraints,
+)
+from omniqubo.models.sympyopt.sympyopt import SympyOpt
+from omniqubo.models.sympyopt.transpiler.pulp_to_sympyopt import PulpToSympyopt
+from omniqubo.models.sympyopt.transpiler.transpiler import transpile
+from omniqubo.models.sympyopt.vars import BitVar, IntVar, RealVar
+
+
+class TestPulpToSympyoptObjective:
+    def test_zero_objective(self):
+        mdl = LpProblem("lp")
+        assert PulpToSympyopt().transpile(mdl) == SympyOpt()
+
+    def test_linear_objective(self):
+        mdl = LpProblem("lp", LpMaximize)
+        x = LpVariable("x", cat=LpBinary)
+        y = LpVariable("y", -2, 10, cat=LpInteger)
+        mdl += 2 * x - 3.5 * y + 2
+        sympymodel = PulpToSympyopt().transpile(mdl)
+
+        sympyopt = SympyOpt()
+        xx = sympyopt.bit_var("x")
+        yy = sympyopt.int_var(lb=-2, ub=10, name="y")
+        sympyopt.maximize(2 * xx - 3.5 * yy + 2)
+        assert sympymodel == sympyopt
+
+
+class TestPulpToSympyoptTypes:
+    def test_types(self):
+        mdl = LpProblem("lp", LpMinimize)
+        x = LpVariable("x", cat=LpBinary)
+        y = LpVariable("y", lowBound=-2, cat=LpInteger)
+        z = LpVariable("z", -2.5, 3.1)
+        w = LpVariable("w", 0, 1, cat=LpInteger)
+        mdl += x + y + z + w
+        sympyopt = PulpToSympyopt().transpile(mdl)
+        assert sympyopt.variables["x"] == BitVar("x")
+        assert sympyopt.variables["y"] == IntVar("y", lb=-2)
+        assert sympyopt.variables["z"] == RealVar("z", -2.5, 3.1)
+        assert sympyopt.variables["w"] == BitVar("w")
+
+    def test_fixed_variable(self):
+        mdl = LpProblem("lp", LpMinimize)
+        x = LpVariable("x", cat=LpBinary)
+        y = LpVariable("y", 3, 3, cat=LpInteger)
+        mdl += x + y
+        assert not PulpToSympyopt().can_transpile(mdl)
+        with pytest.raises(ValueError):
+            PulpToSympyopt().transpile(mdl)
+
+
+class TestPulpToSympyoptConstraints:
+    def test_linear_constraints(self):
+        mdl = LpProblem("lp", LpMinimize)
+        x = LpVariable("x", cat=LpBinary)
+        y = LpVariable("y", -2, 10, cat=LpInteger)
+        z = LpVariable("z", 0, 4)
+        mdl += 2 * x - 3 * y
+        mdl += 2 * x + 3 * y == 2, "lin1"
+        mdl += x + 10.5 * y <= 1.1 - z, "lin2"
+        mdl += 3 <= y - z, "lin3"
+        mdl += y == 5, "trivial"
+        sympyopt = PulpToSympyopt().transpile(mdl)
+
+        (block,) = sympyopt.constraints.values()
+        assert isinstance(block, LinearConstraints)
+        assert block.names == ["lin1", "lin2", "lin3", "trivial"]
+        xx, yy, zz = (sympyopt.get_var(name) for name in "xyz")
+        assert block.to_constraints() == {
+            "lin1": ConstraintEq(2 * xx + 3 * yy, 2),
+            "lin2": ConstraintIneq(xx + 10.5 * yy + zz, 1.1),
+            "lin3": ConstraintIneq(yy - zz, 3, INEQ_GEQ_SENSE),
+            "trivial": ConstraintEq(yy, 5),
+        }
+
+    def test_transpile(self):
+        mdl = LpProblem("lp", LpMinimize)
+        xs = [LpVariable(f"x{i}", cat=LpBinary) for i in range(3)]
+        y = LpVariable("y", 0, 3, cat=LpInteger)
+        mdl += xs[0] - xs[1] + y
+        mdl += xs[0] + xs[1] + xs[2] == 1, "one"
+        mdl += xs[2] + y >= 2, "lower"
+        assert isinstance(transpile(mdl), SympyOpt)
+
+        omniqubo = Omniqubo(mdl)
+        omniqubo.ineq_to_eq(".*")
+        omniqubo.int_to_bits(".*", mode="binary")
+        omniqubo.eq_to_obj(".*", penalty=10)
+        assert omniqubo.model.is_qubo()
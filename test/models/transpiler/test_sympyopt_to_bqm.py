@@ -51,6 +51,27 @@ class TestSympyOptToDimod:
         bqm.offset += -3
         assert bqm != bqm_sym
 
+    def test_float_coeffs_unused_var(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.bit_var("x")
+        y = sympyopt.bit_var("y")
+        sympyopt.bit_var("z")
+        sympyopt.minimize(1.5 * (x - y) ** 2 + 0.5 * x ** 3 - 1.25)
+        bqm_sym = SympyOptToDimod().transpile(sympyopt)
+        bqm = BinaryQuadraticModel(
+            {"x": 2, "y": 1.5, "z": 0}, {("x", "y"): -3}, -1.25, vartype="BINARY"
+        )
+        assert bqm == bqm_sym
+
+    def test_ising(self):
+        sympyopt = SympyOpt()
+        s1 = sympyopt.spin_var("s1")
+        s2 = sympyopt.spin_var("s2")
+        sympyopt.minimize((s1 + s2) ** 2 + s1 ** 3 - 2 * s2)
+        bqm_sym = SympyOptToDimod().transpile(sympyopt)
+        bqm = BinaryQuadraticModel({"s1": 1, "s2": -2}, {("s1", "s2"): 2}, 2, vartype="SPIN")
+        assert bqm == bqm_sym
+
     def test_can_transpile(self):
         # maximization
         sympyopt = SympyOpt()
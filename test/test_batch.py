@@ -0,0 +1,61 @@
+import pickle
+
+import pytest
+from dimod import ExactSolver
+from docplex.mp.model import Model
+
+from omniqubo import Omniqubo
+from omniqubo.converters.eq_to_objective import EqToObj
+from omniqubo.converters.ineq_to_eq import IneqToEq
+from omniqubo.converters.varreplace import VarOneHot
+from omniqubo.sampleset import dimod_import
+
+
+def _knapsack(capacity: int) -> Model:
+    mdl = Model(name="knapsack")
+    x = mdl.binary_var("x")
+    y = mdl.integer_var(lb=0, ub=3, name="y")
+    mdl.minimize(-2 * x - 3 * y)
+    mdl.add_constraint(2 * x + y <= capacity, ctname="c")
+    return mdl
+
+
+def _recipe():
+    return [IneqToEq(".*", True, False), VarOneHot(".*", True), EqToObj(".*", True, 20)]
+
+
+class TestConvertBatch:
+    @pytest.mark.parametrize("processes", [0, 2])
+    @pytest.mark.parametrize("backend", ["sympyopt", "polyopt"])
+    def test_batch(self, processes, backend):
+        capacities = [1, 2, 3, 4]
+        recipe = _recipe()
+        results = Omniqubo.convert_batch(
+            (_knapsack(cap) for cap in capacities),
+            recipe,
+            export_mode="dimod_bqm",
+            model_backend=backend,
+            processes=processes,
+            max_pending=3,
+        )
+        results = sorted(results, key=lambda result: result.index)
+        assert [result.index for result in results] == [0, 1, 2, 3]
+        assert all(not conv.data for conv in recipe)
+
+        for cap, result in zip(capacities, results):
+            omniqubo = Omniqubo(_knapsack(cap), model_backend=backend)
+            for conv in _recipe():
+                omniqubo.convert(conv)
+            assert result.model == omniqubo.export("dimod_bqm")
+
+            result = pickle.loads(pickle.dumps(result))
+            samples = result.interpret(dimod_import(ExactSolver().sample(result.model)))
+            best = samples.loc[samples["feasible"]].sort_values("energy").iloc[0, :]
+            assert 2 * best["x"] + best["y"] <= cap
+            assert "c___slack" not in samples.columns
+
+    def test_no_export(self):
+        results = list(Omniqubo.convert_batch([_knapsack(2)], _recipe(), processes=0))
+        assert len(results) == 1
+        assert results[0].model.is_qubo()
+        assert len(results[0].logs) == 3
@@ -0,0 +1,136 @@
+import pytest
+from docplex.mp.model import Model
+
+from omniqubo import Omniqubo
+from omniqubo.converters.varreplace import TrivialIntToBit, VarBinary, VarOneHot
+from omniqubo.estimate import estimate_qubo, select_encodings
+from omniqubo.models.sympyopt.constraints import INEQ_GEQ_SENSE, ConstraintEq, ConstraintIneq
+from omniqubo.models.sympyopt.sympyopt import SympyOpt
+
+
+def _get_model():
+    mdl = Model(name="estimate")
+    x = mdl.integer_var(lb=0, ub=5, name="x")
+    y = mdl.integer_var(lb=-2, ub=3, name="y")
+    z = mdl.integer_var(lb=1, ub=2, name="z")
+    b = mdl.binary_var(name="b")
+    mdl.minimize(3 * x * y - x + 2 * b * z + z)
+    mdl.add_constraint(x + 2 * y <= 4, ctname="c1")
+    mdl.add_constraint(x - b >= 1, ctname="c2")
+    mdl.add_constraint(y + z + b == 2, ctname="c3")
+    return mdl
+
+
+def _get_coeffs(bqm):
+    return [abs(v) for v in list(bqm.linear.values()) + list(bqm.quadratic.values()) if v]
+
+
+class TestEstimate:
+    @pytest.mark.parametrize("backend", ["sympyopt", "polyopt"])
+    @pytest.mark.parametrize("mode", ["binary", "one-hot"])
+    def test_estimate(self, backend, mode):
+        omniqubo = Omniqubo(_get_model(), model_backend=backend)
+        est = omniqubo.estimate(mode, penalty=10)
+        assert len(omniqubo.logs) == 0
+
+        omniqubo.ineq_to_eq(".*")
+        omniqubo.int_to_bits(".*", mode=mode)
+        omniqubo.eq_to_obj(".*", penalty=10)
+        bqm = omniqubo.export("dimod_bqm")
+        assert est.binaries == len(bqm.variables)
+        assert est.quadratic_terms == bqm.num_interactions
+        assert est.is_quadratic
+        assert est.max_coeff >= max(_get_coeffs(bqm))
+        assert est.density == pytest.approx(
+            est.quadratic_terms / (est.binaries * (est.binaries - 1) / 2)
+        )
+        assert est.as_dict()["dynamic_range"] == est.max_coeff / est.min_coeff
+
+    def test_mixed_modes(self):
+        omniqubo = Omniqubo(_get_model())
+        est = omniqubo.estimate({"x": "one-hot"}, penalty=10)
+        omniqubo.ineq_to_eq(".*")
+        omniqubo.int_to_bits("x", mode="one-hot", is_regexp=False)
+        omniqubo.int_to_bits(".*", mode="binary")
+        omniqubo.eq_to_obj(".*", penalty=10)
+        bqm = omniqubo.export("dimod_bqm")
+        assert est.binaries == len(bqm.variables)
+        assert est.quadratic_terms == bqm.num_interactions
+
+    def test_higher_order(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0, ub=3)
+        y = sympyopt.int_var(name="y", lb=0, ub=3)
+        sympyopt.minimize(x * x * y)
+        assert not Omniqubo(sympyopt).estimate().is_quadratic
+
+    def test_errors(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0)
+        sympyopt.minimize(x)
+        with pytest.raises(ValueError):
+            Omniqubo(sympyopt).estimate()
+
+        sympyopt = SympyOpt()
+        x = sympyopt.int_var(name="x", lb=0, ub=3)
+        sympyopt.minimize(x)
+        sympyopt.add_constraint(ConstraintIneq(x, 5, INEQ_GEQ_SENSE), "c")
+        with pytest.raises(ValueError):
+            Omniqubo(sympyopt).estimate()
+        with pytest.raises(ValueError):
+            Omniqubo(_get_model()).estimate("unary")
+
+
+def _get_encoding_model():
+    sympyopt = SympyOpt()
+    x = sympyopt.int_var(name="x", lb=0, ub=3)
+    y = sympyopt.int_var(name="y", lb=0, ub=7)
+    z = sympyopt.int_var(name="z", lb=0, ub=7)
+    sympyopt.minimize(2 * x * y + y + z)
+    sympyopt.add_constraint(ConstraintEq(y + z, 7), "c")
+    return sympyopt
+
+
+class TestSelectEncodings:
+    def test_select_encodings(self):
+        sympyopt = _get_encoding_model()
+        varnames = ["x", "y", "z", "unknown"]
+        assert select_encodings(sympyopt, varnames) == {x: "binary" for x in "xyz"}
+        assert select_encodings(sympyopt, varnames, max_binaries=8) == {x: "binary" for x in "xyz"}
+        modes = select_encodings(sympyopt, varnames, max_density=0.7)
+        assert modes == {"x": "one-hot", "y": "binary", "z": "binary"}
+        with pytest.raises(ValueError):
+            select_encodings(sympyopt, varnames, max_binaries=7)
+        with pytest.raises(ValueError):
+            select_encodings(sympyopt, varnames, max_density=0.5)
+
+    def test_many_variables(self):
+        sympyopt = SympyOpt()
+        objective = 0
+        for i in range(30):
+            x = sympyopt.int_var(name=f"x{i}", lb=0, ub=3)
+            y = sympyopt.int_var(name=f"y{i}", lb=0, ub=7)
+            z = sympyopt.int_var(name=f"z{i}", lb=0, ub=7)
+            objective += 2 * x * y + y + z
+            sympyopt.add_constraint(ConstraintEq(y + z, 7), f"c{i}")
+        sympyopt.minimize(objective)
+        assert estimate_qubo(sympyopt).density > 0.021
+
+        # changes are scored incrementally, the result agrees with the estimate
+        modes = select_encodings(sympyopt, sympyopt.variables.keys(), max_density=0.021)
+        est = estimate_qubo(sympyopt, modes)
+        assert est.density <= 0.021
+        assert est.binaries > estimate_qubo(sympyopt).binaries
+
+    @pytest.mark.parametrize("backend", ["sympyopt", "polyopt"])
+    def test_auto_int_to_bits(self, backend):
+        omniqubo = Omniqubo(_get_encoding_model(), model_backend=backend)
+        est = omniqubo.estimate({"x": "one-hot"})
+        omniqubo.auto_int_to_bits(max_density=0.7)
+        assert [type(conv) for conv in omniqubo.logs] == [TrivialIntToBit, VarOneHot, VarBinary]
+        assert omniqubo.logs[2].varname == "y|z"
+
+        omniqubo.eq_to_obj(".*")
+        bqm = omniqubo.export("dimod_bqm")
+        assert est.binaries == len(bqm.variables)
+        assert est.quadratic_terms == bqm.num_interactions
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+from docplex.mp.model import Model
+
+from omniqubo.models.sympyopt.transpiler.transpiler import _TRANSPILERS, transpile
+
+FRAMEWORKS = ["dimod", "docplex", "pulp", "qiskit", "qiskit_optimization"]
+
+
+# returns the frameworks imported after running code in a fresh interpreter
+def _imported_frameworks(code: str) -> list:
+    check = f"import sys; print([m for m in {FRAMEWORKS} if m in sys.modules])"
+    out = subprocess.run(
+        [sys.executable, "-c", f"{code}\n{check}"], check=True, capture_output=True, text=True
+    )
+    return eval(out.stdout)
+
+
+class TestLazyImports:
+    def test_import_omniqubo(self):
+        code = "\n".join(
+            [
+                "from omniqubo import Omniqubo",
+                "from omniqubo.models.sympyopt import SympyOpt",
+                "model = SympyOpt()",
+                "model.minimize(model.bit_var('x'))",
+                "Omniqubo(model).make_max()",
+            ]
+        )
+        assert _imported_frameworks(code) == []
+
+    def test_import_on_demand(self):
+        code = "\n".join(
+            [
+                "from docplex.mp.model import Model",
+                "from omniqubo import Omniqubo",
+                "mdl = Model()",
+                "mdl.minimize(mdl.binary_var('x'))",
+                "Omniqubo(mdl).export('dimod_bqm')",
+            ]
+        )
+        assert set(_imported_frameworks(code)) == {"dimod", "docplex"}
+
+    def test_registry(self):
+        for model_module, model_class, transpiler_module, transpiler_class in _TRANSPILERS:
+            assert transpiler_module.startswith(".")
+            assert model_module.split(".")[0] in FRAMEWORKS
+
+        mdl = Model()
+        mdl.minimize(mdl.binary_var("x"))
+        assert transpile(mdl).variables.keys() == {"x"}
@@ -3,9 +3,13 @@ from copy import deepcopy
 import pytest
 from dimod import ExactSolver
 from docplex.mp.model import Model
+from pandas import concat
 from sympy import sin
 
 from omniqubo import Omniqubo
+from omniqubo.converters.eq_to_objective import EqToObj
+from omniqubo.converters.varreplace import TrivialIntToBit, VarBinary
+from omniqubo.models.polyopt.polyopt import PolyOpt
 from omniqubo.models.sympyopt.constraints import INEQ_GEQ_SENSE, ConstraintEq, ConstraintIneq
 from omniqubo.models.sympyopt.sympyopt import SympyOpt
 from omniqubo.sampleset import dimod_import
@@ -29,6 +33,27 @@ class TestOmniquboInit:
         omniqubo = Omniqubo(sympyopt)
         assert omniqubo.model == sympyopt
 
+    def test_polyopt_backend(self):
+        mdl = Model(name="knapsack")
+        x = mdl.binary_var("x")
+        y = mdl.integer_var(lb=0, ub=3, name="y")
+        mdl.minimize(2 * x - 3 * y + 2)
+        mdl.add_constraint(x + y <= 3, ctname="c")
+
+        omniqubo = Omniqubo(mdl, model_backend="polyopt")
+        assert isinstance(omniqubo.model, PolyOpt)
+        omniqubo.ineq_to_eq(".*")
+        omniqubo.int_to_bits(".*", mode="binary")
+        omniqubo.eq_to_obj(".*", penalty=10)
+        assert omniqubo.is_qubo()
+
+        bqm = omniqubo.export("dimod_bqm")
+        samples = omniqubo.interpret(dimod_import(ExactSolver().sample(bqm)))
+        best = samples.loc[samples["feasible"]].sort_values("energy").iloc[0, :]
+        assert best["x"] == 0
+        assert best["y"] == 3
+        assert best["energy"] == -7
+
     def test_error(self):
         with pytest.raises(ValueError):
             Omniqubo(1)
@@ -47,8 +72,90 @@ class TestOmniquboInit:
         omniqubo.int_to_bits(".*", "one-hot", trivial_conv=False)
         assert len(omniqubo.model_logs) == 2
 
+    @pytest.mark.parametrize("backend", ["sympyopt", "polyopt"])
+    def test_logs_reconstruction(self, backend):
+        mdl = Model(name="knapsack")
+        x = mdl.binary_var("x")
+        y = mdl.integer_var(lb=0, ub=3, name="y")
+        z = mdl.integer_var(lb=-1, ub=2, name="z")
+        mdl.minimize(2 * x - 3 * y + z + 2)
+        mdl.add_constraint(x + y + z <= 3, ctname="c1")
+        mdl.add_constraint(x + z == 1, ctname="c2")
+
+        omniqubo = Omniqubo(mdl, verbatim_logs=True, model_backend=backend)
+        snapshots = [deepcopy(omniqubo.model)]
+        omniqubo.ineq_to_eq(".*")
+        snapshots.append(deepcopy(omniqubo.model))
+        omniqubo.int_to_bits("y", mode="one-hot", is_regexp=False, trivial_conv=False)
+        snapshots.append(deepcopy(omniqubo.model))
+        omniqubo.int_to_bits(".*", mode="binary", trivial_conv=False)
+        snapshots.append(deepcopy(omniqubo.model))
+        omniqubo.eq_to_obj(".*", penalty=10)
+        snapshots.append(deepcopy(omniqubo.model))
+        omniqubo.make_max()
+        snapshots.append(deepcopy(omniqubo.model))
+
+        assert len(omniqubo.model_logs) == len(snapshots)
+        for step, model in enumerate(snapshots):
+            assert omniqubo.model_logs[step] == model
+        assert omniqubo.model_logs[-1] == omniqubo.model
+        with pytest.raises(IndexError):
+            omniqubo.model_logs[len(snapshots)]
+
+        # reconstructed models do not affect the history
+        model = omniqubo.model_logs[1]
+        model.constraints.clear()
+        assert omniqubo.model_logs[1] == snapshots[1]
+
+    def test_orig_model_shared(self):
+        sympyopt = SympyOpt()
+        y = sympyopt.int_var(lb=0, ub=2, name="y")
+        x = sympyopt.bit_var(name="x")
+        sympyopt.minimize(2 * y + x)
+        sympyopt.add_constraint(ConstraintEq(x + y, 1), name="c")
+        omniqubo = Omniqubo(sympyopt)
+        omniqubo.int_to_bits(".*", mode="binary")
+        omniqubo.eq_to_obj(".*", penalty=10)
+        assert omniqubo.orig_model == sympyopt
+
 
 class TestOmniqubo:
+    def test_interpret_chunks(self):
+        mdl = Model(name="knapsack")
+        x = mdl.binary_var("x")
+        y = mdl.integer_var(lb=0, ub=3, name="y")
+        mdl.minimize(-2 * x - 3 * y)
+        mdl.add_constraint(2 * x + y <= 3, ctname="c")
+
+        omniqubo = Omniqubo(mdl)
+        omniqubo.ineq_to_eq(".*")
+        omniqubo.int_to_bits(".*", mode="one-hot")
+        omniqubo.eq_to_obj(".*", penalty=10)
+        sampleset = ExactSolver().sample(omniqubo.export("dimod_bqm"))
+        expected = omniqubo.interpret(dimod_import(sampleset))
+
+        chunks = list(omniqubo.interpret_chunks(sampleset, chunksize=100))
+        assert len(chunks) == (len(sampleset) + 99) // 100
+        assert all(chunk.shape[0] <= 100 for chunk in chunks)
+        assert concat(chunks)[expected.columns].equals(expected)
+
+        samples = dimod_import(sampleset)
+        chunks = omniqubo.interpret_chunks([samples.iloc[:10], samples.iloc[10:]], chunksize=7)
+        assert concat(chunks)[expected.columns].equals(expected)
+
+        labels = list(sampleset.variables)
+        block = sampleset.record.sample
+        chunks = omniqubo.interpret_chunks(iter([block]), chunksize=50, columns=labels)
+        assert concat(chunks)[["x", "y", "feasible"]].equals(expected[["x", "y", "feasible"]])
+
+        chunks = omniqubo.interpret_chunks([block[:10], block[10:]], chunksize=7, columns=labels)
+        assert concat(chunks)[["x", "y", "feasible"]].equals(expected[["x", "y", "feasible"]])
+
+        with pytest.raises(ValueError):
+            next(omniqubo.interpret_chunks(block))
+        with pytest.raises(TypeError):
+            next(omniqubo.interpret_chunks("samples"))
+
     def test_name_int_to_bits(self):
         sympyopt = SympyOpt()
         y1 = sympyopt.int_var(lb=0, ub=2, name="y1")
@@ -76,6 +183,30 @@ class TestOmniqubo:
         omniqubo.int_to_bits(".*", mode="one-hot")
         assert omniqubo.is_bm()
 
+    @pytest.mark.parametrize("backend", ["sympyopt", "polyopt"])
+    def test_convert_fused(self, backend):
+        mdl = Model(name="knapsack")
+        x = mdl.binary_var("x")
+        y = mdl.integer_var(lb=0, ub=3, name="y")
+        z = mdl.integer_var(lb=-1, ub=0, name="z")
+        mdl.minimize(2 * x - 3 * y + z + 2)
+        mdl.add_constraint(x + y + z == 1, ctname="c")
+
+        omniqubo = Omniqubo(mdl, model_backend=backend)
+        omniqubo.int_to_bits(".*", mode="binary")
+        omniqubo.eq_to_obj(".*", penalty=10)
+        omniqubo_seq = Omniqubo(mdl, verbatim_logs=True, model_backend=backend)
+        omniqubo_seq.int_to_bits(".*", mode="binary")
+        omniqubo_seq.eq_to_obj(".*", penalty=10)
+        assert omniqubo.model == omniqubo_seq.model
+        assert [type(conv) for conv in omniqubo.logs] == [TrivialIntToBit, VarBinary, EqToObj]
+        assert len(omniqubo_seq.model_logs) == 4
+
+        bqm = omniqubo.export("dimod_bqm")
+        samples = omniqubo.interpret(dimod_import(ExactSolver().sample(bqm)))
+        best = samples.loc[samples["feasible"]].sort_values("energy").iloc[0, :]
+        assert (best["x"], best["y"], best["z"]) == (0, 2, -1)
+
     def test_name_minmax(self):
         sympyopt = SympyOpt()
         y = sympyopt.int_var(lb=0, ub=2, name="y1")
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from docplex.mp.model import Model
+
+from omniqubo import Omniqubo
+from omniqubo.converters.converter import convert
+from omniqubo.converters.eq_to_objective import EqToObj
+from omniqubo.models.sympyopt import SympyOpt
+from omniqubo.models.sympyopt.constraints import ConstraintEq
+from omniqubo.parametric import _split_objective, parameter
+
+
+def _model() -> Model:
+    mdl = Model(name="knapsack")
+    x = mdl.binary_var("x")
+    y = mdl.integer_var(lb=0, ub=3, name="y")
+    z = mdl.integer_var(lb=-1, ub=2, name="z")
+    mdl.minimize(-2 * x - 3 * y + z)
+    mdl.add_constraint(2 * x + y + z <= 3, ctname="c1")
+    mdl.add_constraint(x + z == 1, ctname="c2")
+    return mdl
+
+
+def _convert(omniqubo: Omniqubo, penalty1, penalty2) -> Omniqubo:
+    omniqubo.ineq_to_eq(".*")
+    omniqubo.int_to_bits(".*", mode="binary")
+    omniqubo.eq_to_obj("c1", is_regexp=False, penalty=penalty1)
+    omniqubo.eq_to_obj("c2", is_regexp=False, penalty=penalty2)
+    return omniqubo
+
+
+class TestParametric:
+    def test_bind(self):
+        a = parameter("a")
+        b = parameter("b")
+        omniqubo = _convert(Omniqubo(_model()), a, b)
+        assert omniqubo.model.is_qubo()
+        parametric = omniqubo.export_parametric()
+        assert parametric.params == ["a", "b"]
+
+        samples = np.random.default_rng(0).integers(0, 2, (100, len(parametric.labels)))
+        for penalty1, penalty2 in [(0.5, 1), (1, 2.5), (10, 3)]:
+            expected = _convert(Omniqubo(_model()), penalty1, penalty2).export("dimod_bqm")
+            bqm = parametric.bind(a=penalty1, b=penalty2)
+            assert bqm.variables == expected.variables
+            energies = bqm.energies((samples, parametric.labels))
+            assert energies == pytest.approx(expected.energies((samples, parametric.labels)))
+
+        with pytest.raises(ValueError):
+            parametric.bind(a=1)
+        with pytest.raises(ValueError):
+            parametric.bind(a=1, b=2, c=3)
+
+    def test_maximize(self):
+        def get_omniqubo(penalty) -> Omniqubo:
+            mdl = _model()
+            mdl.maximize(2 * mdl.get_var_by_name("x") + 3 * mdl.get_var_by_name("y"))
+            omniqubo = _convert(Omniqubo(mdl), penalty, penalty)
+            omniqubo.make_min()
+            return omniqubo
+
+        omniqubo = get_omniqubo(parameter("p"))
+        omniqubo.make_max()
+        omniqubo.make_min()
+        parametric = omniqubo.export_parametric()
+        samples = np.random.default_rng(0).integers(0, 2, (100, len(parametric.labels)))
+        expected = get_omniqubo(5).export("dimod_bqm")
+        energies = parametric.bind(p=5).energies((samples, parametric.labels))
+        assert energies == pytest.approx(expected.energies((samples, parametric.labels)))
+
+    def test_degree(self):
+        sympyopt = SympyOpt()
+        x = sympyopt.bit_var("x")
+        y = sympyopt.int_var("y", lb=0, ub=3)
+        sympyopt.minimize(x - y)
+        sympyopt.add_constraint(ConstraintEq(x + y, 1), "c")
+        sympyopt = convert(sympyopt, EqToObj("c", False, penalty=parameter("a")))
+        # parameters are coefficients, thus a * (x + y - 1) ** 2 is quadratic
+        assert sympyopt.is_qip()
+        assert not sympyopt.is_ilp()
+
+    def test_not_affine(self):
+        a = parameter("a")
+        b = parameter("b")
+        omniqubo = Omniqubo(_model())
+        x = omniqubo.model.variables["x"].var
+        assert _split_objective(2 * x + a * x, {a, b}) == {1: 2 * x, a: x}
+        with pytest.raises(ValueError):
+            _split_objective(a * b * x, {a, b})
+
+    def test_polyopt(self):
+        omniqubo = Omniqubo(_model(), model_backend="polyopt")
+        omniqubo.ineq_to_eq(".*")
+        with pytest.raises(AssertionError):
+            omniqubo.eq_to_obj(".*", penalty=parameter("a"))
+        with pytest.raises(ValueError):
+            omniqubo.export_parametric()
@@ -0,0 +1,97 @@
+import logging
+import tracemalloc
+from contextlib import contextmanager
+
+import pytest
+from docplex.mp.model import Model
+
+from omniqubo import Omniqubo
+from omniqubo.profiling import Profiler
+
+
+def _knapsack() -> Model:
+    mdl = Model(name="knapsack")
+    x = mdl.binary_var("x")
+    y = mdl.integer_var(lb=0, ub=3, name="y")
+    mdl.minimize(-2 * x - 3 * y)
+    mdl.add_constraint(2 * x + y <= 3, ctname="c")
+    return mdl
+
+
+class _Span:
+    def __init__(self) -> None:
+        self.attributes = dict()
+
+    def set_attribute(self, key, val) -> None:
+        self.attributes[key] = val
+
+
+class TestProfiler:
+    @pytest.mark.parametrize("backend", ["sympyopt", "polyopt"])
+    def test_profiles(self, backend, caplog):
+        received = []
+        profiler = Profiler(callback=received.append)
+        omniqubo = Omniqubo(_knapsack(), model_backend=backend, profiler=profiler)
+        with caplog.at_level(logging.DEBUG, logger="omniqubo.profiling"):
+            omniqubo.ineq_to_eq(".*")
+            omniqubo.int_to_bits(".*", mode="one-hot", trivial_conv=False)
+            omniqubo.eq_to_obj(".*", penalty=10)
+
+        assert received == profiler.profiles
+        assert [p.step for p in received] == [0, 1, 2]
+        assert [p.converter for p in received] == ["IneqToEq", "VarOneHot", "EqToObj"]
+        assert all(p.wall_time >= 0 and p.peak_memory >= 0 for p in received)
+
+        ineq, onehot, eqtoobj = received
+        assert ineq.before == {"variables": 2, "constraints": 1, "objective_terms": 2}
+        assert ineq.after == {"variables": 3, "constraints": 1, "objective_terms": 2}
+        # y and slack in [0, 3] replaced with 4 bits each, with one extra constraint each
+        assert onehot.after["variables"] == 9
+        assert onehot.after["constraints"] == 3
+        assert eqtoobj.before == onehot.after
+        assert eqtoobj.after["constraints"] == 0
+        assert eqtoobj.after["objective_terms"] > onehot.after["objective_terms"]
+
+        assert [r.omniqubo_profile for r in caplog.records] == [p.as_dict() for p in received]
+
+    @pytest.mark.parametrize("reset_peak", [True, False])
+    def test_traced_memory(self, reset_peak, monkeypatch):
+        if not reset_peak:
+            monkeypatch.delattr(tracemalloc, "reset_peak", raising=False)
+        omniqubo = Omniqubo(_knapsack(), profiler=Profiler())
+        tracemalloc.start(5)
+        try:
+            traced = bytes(1000)
+            omniqubo.ineq_to_eq(".*")
+            # tracing started outside of the profiler is kept with its traces
+            assert tracemalloc.is_tracing()
+            assert tracemalloc.get_traceback_limit() == 5
+            assert tracemalloc.get_object_traceback(traced) is not None
+        finally:
+            tracemalloc.stop()
+        if reset_peak:
+            assert omniqubo.profiler.profiles[0].peak_memory >= 0
+        else:
+            assert omniqubo.profiler.profiles[0].peak_memory is None
+
+    def test_span(self):
+        spans = []
+
+        @contextmanager
+        def span(name):
+            spans.append((name, _Span()))
+            yield spans[-1][1]
+
+        omniqubo = Omniqubo(_knapsack(), profiler=Profiler(memory=False, span=span))
+        omniqubo.ineq_to_eq(".*")
+        omniqubo.make_max()
+
+        assert [name for name, _ in spans] == [
+            "omniqubo.convert.IneqToEq",
+            "omniqubo.convert.MakeMax",
+        ]
+        attributes = spans[0][1].attributes
+        assert attributes["omniqubo.converter"] == "IneqToEq"
+        assert attributes["omniqubo.after_variables"] == 3
+        assert "omniqubo.peak_memory" not in attributes
+        assert omniqubo.profiler.profiles[1].peak_memory is None